@@ -1,53 +1,132 @@
 # app/__init__.py (Database-wired version)
 
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
+import logging
+import os
 from flask import Flask, jsonify, session, request
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from app.models.sqlalchemy_task import Base  # ✅ Correct import
+from app.models.sqlalchemy_task import create_schema  # ✅ Correct import
 from app.repositories.database_task_repository import DatabaseTaskRepository
 from app.services.task_service import TaskService
-from app.routes.tasks import tasks_bp
-from app.routes.health import health_bp
-# UI blueprint imported inside create_app to avoid circular imports
-# Import time_bp for time service API route
-from app.services.time_service import TimeService
-from app.routes.time import time_bp
-from app.services.time_service import TimeService
-from app.routes.time import time_bp
-from app.routes.ui_time import ui_time_bp  # Import UI time blueprint
+from app.services.time_service import TimeService  # `requests` itself is imported lazily
+from app.services.fragment_cache import FragmentCache
+from app.metrics import MetricsRegistry, install_request_metrics
+from app.sql_instrumentation import QueryInstrumentation
+from app.profiling import install_request_profiler
+from app.sampling_profiler import install_sampling_profiler
+from app.tracing import install_tracing
+from app.startup import StartupTimer
+from app.logging_config import configure_logging
+from app.templating import configure_templates
+# Blueprints are imported inside create_app (see _register_blueprints) so that
+# importing the package stays cheap and circular imports are avoided
+
+_IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
+
+logger = logging.getLogger(__name__)
+
+
+def _env_flag(name):
+    """Return True when an environment variable is set to a truthy value."""
+    return os.getenv(name, "").lower() in ("1", "true", "yes")
+
+
+def _register_blueprints(app):
+    """Import and register all route blueprints."""
+    from app.routes.tasks import tasks_bp
+    from app.routes.health import health_bp
+    from app.routes.time import time_bp
+    from app.routes.ui_time import ui_time_bp
+    from app.routes.ui import ui_bp
+    from app.routes.metrics import metrics_bp
+    from app.routes.admin import admin_bp
+
+    app.register_blueprint(tasks_bp)
+    app.register_blueprint(health_bp)
+    app.register_blueprint(time_bp)  # ✅ Register time service route
+    app.register_blueprint(ui_time_bp)  # ✅ Register time UI route
+    app.register_blueprint(ui_bp) # ✅ Enables /tasks/new route for web form
+    app.register_blueprint(metrics_bp)  # ✅ Prometheus scrape endpoint (/metrics)
+    app.register_blueprint(admin_bp)  # ✅ Token-protected /admin endpoints
 
 def create_app(service=None):
     """
-    
-    import os
-    print(f"[DEBUG] Flask app created. TESTING={os.getenv('TESTING')}")
     Sprint 4: Database-wired Flask application
+
+    Startup phases are timed into `app.startup_timer`; run
+    `flask --app app startup-report` to print the breakdown.
+
+    Set TASKS_LAZY_LOAD=true to defer loading the task list from the
+    database until the first request that needs it.
     """
-    app = Flask(__name__)
+    timer = StartupTimer()
+    timer.record("import app package", _IMPORT_SECONDS)
+
+    # ✅ Structured logs, written by a background thread (LOG_LEVEL, LOG_LEVELS, ...)
+    configure_logging()
+
+    with timer.phase("flask app"):
+        app = Flask(__name__)
+    app.startup_timer = timer
     
     # Configure secret key for session management
     app.config['SECRET_KEY'] = 'dev-secret-key-change-in-production'
 
+    # ✅ Jinja bytecode cache (must be set before app.jinja_env is first used)
+    configure_templates(app)
+
+    # ✅ Request/upstream/database metrics, served at /metrics
+    app.metrics = MetricsRegistry()
+    install_request_metrics(app, app.metrics)
+
+    # ✅ One TimeService instance shared by the task service and the time routes
+    time_service = TimeService(metrics=app.metrics)
+
     # 🔧 Database Setup (only if no service provided via dependency injection)
     if service is None:
-        # Use file-based database for CI/testing and development/production
-        import os
-        is_testing = os.getenv("TESTING") == "true" or os.getenv("CI") == "true"
-        db_path = "/tmp/tasks.db" if is_testing else "./tasks.db"
-        print(f"[DEBUG] TESTING={os.getenv('TESTING')}, CI={os.getenv('CI')}, db_path={db_path}")
-        engine = create_engine(f"sqlite:///{db_path}")
-        
-        # Create session factory
-        Session = sessionmaker(bind=engine)
-        
-        # Create database tables
-        Base.metadata.create_all(engine)  # Creates database and tables
-        print("✅ Database tables created by Base.metadata.create_all(engine)")
+        with timer.phase("database setup"):
+            # Use file-based database for CI/testing and development/production
+            is_testing = os.getenv("TESTING") == "true" or os.getenv("CI") == "true"
+            db_path = "/tmp/tasks.db" if is_testing else "./tasks.db"
+            logger.debug(
+                "database path selected",
+                extra={"testing": os.getenv("TESTING"), "ci": os.getenv("CI"), "db_path": db_path},
+            )
+            engine = create_engine(f"sqlite:///{db_path}")
+            # Per-statement counts/timings, slow-query log, optional query plans
+            app.sql_instrumentation = QueryInstrumentation(
+                app.metrics,
+                slow_threshold=float(os.getenv("SQL_SLOW_QUERY_MS", "100")) / 1000,
+                explain=_env_flag("SQL_DEBUG"),
+            )
+            app.sql_instrumentation.attach(engine)
+            app.sql_instrumentation.install_request_counting(app)
+            
+            # Create session factory
+            Session = sessionmaker(bind=engine)
+            
+            # Create database tables and indexes
+            create_schema(engine)  # Creates database, tables and any missing indexes
+            logger.info("database schema ready", extra={"db_path": db_path})
         
-        # Wire up the repository and service with TimeService
-        repo = DatabaseTaskRepository(Session)
-        time_service = TimeService()
-        service = TaskService(repo, time_service)
+        with timer.phase("task service"):
+            # Wire up the repository and service with TimeService
+            repo = DatabaseTaskRepository(Session)
+            service = TaskService(
+                repo,
+                time_service,
+                lazy_load=_env_flag("TASKS_LAZY_LOAD"),
+                # Optional wait for concurrent writes to share one commit
+                commit_window=float(os.getenv("GROUP_COMMIT_WINDOW_MS", "0")) / 1000,
+                max_commit_batch=int(os.getenv("GROUP_COMMIT_MAX_BATCH", "64")),
+                # sync | group | write_behind (see TaskService)
+                durability=os.getenv("TASK_DURABILITY", "group"),
+                write_behind_interval=float(os.getenv("WRITE_BEHIND_INTERVAL_MS", "1000")) / 1000,
+            )
         
         # Store engine reference for cleanup
         app.database_engine = engine
@@ -58,9 +137,14 @@ def create_app(service=None):
             """Ensure database connections are properly closed."""
             pass  # Sessions are closed in repository methods
             
-        # Register app cleanup for engine disposal
+        # Register app cleanup: save pending task changes, then dispose the engine
         import atexit
         def dispose_engine():
+            try:
+                service.close()
+            except Exception:
+                # Still dispose the engine; the unsaved changes are lost either way
+                logger.exception("saving pending task changes at exit failed")
             if hasattr(app, 'database_engine'):
                 app.database_engine.dispose()
         atexit.register(dispose_engine)
@@ -68,7 +152,14 @@ def create_app(service=None):
     # Inject the service into the app
     app.task_service = service
     # Add Inject TimeService after app.task_service = service but before route registration
-    app.time_service = TimeService()  # ✅ TimeService instance for fetching current time
+    app.time_service = time_service  # ✅ TimeService instance for fetching current time
+    # ✅ Rendered task-list rows, keyed on (task id, task version)
+    app.fragment_cache = FragmentCache(int(os.getenv("FRAGMENT_CACHE_SIZE", "2048")))
+    # Read at scrape time from whichever service is installed (tests swap it)
+    app.metrics.gauge(
+        "tasks_in_memory", "Tasks held in the task service's memory.",
+        lambda: getattr(app.task_service, "loaded_task_count", lambda: 0)(),
+    )
 
     # Context processor to inject time data into all templates
     @app.context_processor
@@ -94,14 +185,8 @@ def create_app(service=None):
         )
 
     # Register Blueprints
-    app.register_blueprint(tasks_bp)
-    app.register_blueprint(health_bp)
-    app.register_blueprint(time_bp)  # ✅ Register time service route
-    app.register_blueprint(ui_time_bp)  # ✅ Register time UI route
-    
-    # Import and register UI Blueprint (imported here to avoid circular imports)
-    from app.routes.ui import ui_bp
-    app.register_blueprint(ui_bp) # ✅ Enables /tasks/new route for web form
+    with timer.phase("blueprints"):
+        _register_blueprints(app)
     
     # Global error handlers
     @app.errorhandler(400)
@@ -111,8 +196,17 @@ def create_app(service=None):
     @app.errorhandler(404)
     def not_found(error):
         return jsonify({"error": "Not Found"}), 404
-    
-    
-    return app
 
+    @app.cli.command("startup-report")
+    def startup_report():
+        """Print how long each create_app() phase took."""
+        print(app.startup_timer.report())
 
+    # ✅ Opt-in: profile single requests sent with X-Profile: <PROFILE_SECRET>
+    install_request_profiler(app)
+    # ✅ Opt-in: always-on stack sampling, served at /admin/profile/stacks
+    install_sampling_profiler(app)
+    # ✅ Opt-in: per-layer request spans appended to TRACE_FILE (OTLP/JSON)
+    install_tracing(app)
+    
+    return app
@@ -0,0 +1,189 @@
+"""
+app/logging_config.py - Structured, Queue-Based Application Logging
+
+Replaces print() diagnostics. Call sites log through standard loggers
+(`logging.getLogger(__name__)`) and may attach fields with `extra=`:
+
+    logger.debug("time api response", extra={"status": 200, "url": url})
+
+`configure_logging()` (called by create_app) routes every record of the
+"app" loggers through a QueueHandler (third-party and test loggers are left
+to their own handlers): the calling thread only formats the message and enqueues it,
+and a background QueueListener does the actual writing to stderr. Request
+threads never wait on terminal or pipe I/O. When the queue is full, records
+are dropped and counted (`queue_handler.dropped`) rather than blocking.
+
+Output is one JSON object per line (or plain text with LOG_FORMAT=text):
+
+    {"ts": "2026-01-05T10:00:00.123Z", "level": "INFO", "logger": "app",
+     "message": "database ready", "db_path": "./tasks.db"}
+
+High-volume DEBUG events are sampled: of the DEBUG records with the same
+logger and message template, only the first and then every Nth one is kept,
+marked with `"sampled": N`.
+
+Environment variables:
+    LOG_LEVEL         Level of the "app" loggers (default: INFO)
+    LOG_LEVELS        Per-module levels, e.g. "app.sql=DEBUG,app.services.time_service=WARNING"
+    LOG_FORMAT        json | text (default: json)
+    LOG_DEBUG_SAMPLE  Keep 1 in N DEBUG records per message (default: 10; 1 keeps all)
+    LOG_QUEUE_SIZE    Records buffered before new ones are dropped (default: 10000)
+"""
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+
+# Attributes every LogRecord has; anything else on a record came from `extra=`
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+# The installed (queue handler, listener), shared by every app in the process
+_installed = None
+
+
+def record_fields(record):
+    """The `extra=` fields of a record."""
+    return {key: value for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: ts, level, logger, message, extra fields."""
+
+    def format(self, record):
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+                  + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(record_fields(record))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Human-readable lines with the extra fields appended as key=value."""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    def format(self, record):
+        line = super().format(record)
+        fields = record_fields(record)
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return line
+
+
+class DebugSampler(logging.Filter):
+    """Keep the first and then every Nth DEBUG record per (logger, message template)."""
+
+    def __init__(self, every):
+        super().__init__()
+        self.every = every
+        self._seen = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG or self.every <= 1:
+            return True
+        key = (record.name, record.msg)
+        with self._lock:
+            seen = self._seen.get(key, 0)
+            self._seen[key] = seen + 1
+        if seen % self.every:
+            return False
+        record.sampled = self.every
+        return True
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops (and counts) records instead of blocking when full."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Merge args into the message now (they may change before the writer
+        # runs) but keep the traceback in exc_text for the formatter
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _restart_after_fork():
+    """Give a forked child (e.g. a Gunicorn worker) its own queue and writer
+    thread: the parent's thread is gone there and its queue lock may be held."""
+    handler, listener = _installed
+    handler.queue = listener.queue = queue.Queue(handler.queue.maxsize)
+    listener._thread = None
+    listener.start()
+
+
+def parse_levels(spec):
+    """Parse "module=LEVEL,..." into {logger name: level}.
+
+    Example:
+        >>> parse_levels("app.sql=DEBUG, app.services.time_service=warning")
+        {'app.sql': 'DEBUG', 'app.services.time_service': 'WARNING'}
+    """
+    levels = {}
+    for item in (spec or "").split(","):
+        name, sep, level = item.partition("=")
+        if sep and name.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging(environ=None):
+    """Install the queue handler on the "app" logger and apply levels.
+
+    Safe to call once per create_app(): the handler and its writer thread
+    are installed once per process, later calls only update levels.
+
+    Args:
+        environ: Mapping to read settings from (defaults to os.environ)
+
+    Returns:
+        DroppingQueueHandler: The installed handler
+    """
+    global _installed
+    environ = os.environ if environ is None else environ
+
+    logging.getLogger("app").setLevel(environ.get("LOG_LEVEL", "INFO").upper())
+    for name, level in parse_levels(environ.get("LOG_LEVELS")).items():
+        logging.getLogger(name).setLevel(level)
+
+    if _installed is None:
+        stream = logging.StreamHandler()
+        stream.setFormatter(TextFormatter() if environ.get("LOG_FORMAT") == "text" else JsonFormatter())
+        handler = DroppingQueueHandler(queue.Queue(int(environ.get("LOG_QUEUE_SIZE", "10000"))))
+        handler.addFilter(DebugSampler(int(environ.get("LOG_DEBUG_SAMPLE", "10"))))
+        listener = logging.handlers.QueueListener(handler.queue, stream)
+        listener.start()
+        logging.getLogger("app").addHandler(handler)
+        atexit.register(listener.stop)  # writes out whatever is still queued
+        os.register_at_fork(after_in_child=_restart_after_fork)
+        _installed = (handler, listener)
+    return _installed[0]
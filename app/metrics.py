@@ -0,0 +1,220 @@
+"""
+app/metrics.py - Request Metrics in Prometheus Text Format
+
+A small, dependency-free metrics registry plus the Flask hooks that feed it.
+`install_request_metrics(app, registry)` (called by create_app) records, for every
+request:
+
+    http_requests_total{endpoint, method, status}       Counter
+    http_request_duration_seconds{endpoint, method}     Histogram
+
+Other parts of the app add their own series to `app.metrics`: TimeService
+records upstream latency and fallbacks, the database engine counts queries,
+and gauges report in-memory task counts when /metrics is scraped.
+
+GET /metrics (app/routes/metrics.py) renders everything in the Prometheus
+text exposition format, version 0.0.4.
+
+Recording costs one dict lookup and a few additions under a lock. Labels are
+Flask endpoint names, not raw paths, so the number of series stays bounded.
+For streamed responses (/tasks) the duration ends when the response object
+is returned, before the body has been sent.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+
+from flask import g, request
+
+# Latency buckets in seconds, from sub-millisecond cache hits to slow upstream calls
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs.extend(f'{name}="{value}"' for name, value in extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self):
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, one value per label combination."""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values = {}
+
+    def inc(self, *labelvalues, amount=1):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def value(self, *labelvalues):
+        return self._values.get(labelvalues, 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """Counts of observations per bucket, plus their sum and total count."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # labels → [per-bucket counts (+Inf last), sum, count]
+
+    def observe(self, value, *labelvalues):
+        # The first bucket whose upper bound is >= value; the +Inf slot is last
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *labelvalues):
+        series = self._series.get(labelvalues)
+        return series[2] if series else 0
+
+    def samples(self):
+        with self._lock:
+            items = sorted((labels, (list(s[0]), s[1], s[2])) for labels, s in self._series.items())
+        lines = []
+        for labels, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = (("le", _format_value(float(bound))),)
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Value read from a callback each time the metrics are rendered."""
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, callback):
+        super().__init__(name, documentation)
+        self.callback = callback
+
+    def samples(self):
+        return [f"{self.name} {_format_value(self.callback())}"]
+
+
+class MetricsRegistry:
+    """Named metrics, rendered together in Prometheus text format.
+
+    Example:
+        >>> registry = MetricsRegistry()
+        >>> hits = registry.counter("cache_hits_total", "Cache hits.", ["cache"])
+        >>> hits.inc("fragments")
+        >>> print(registry.render())
+        # HELP cache_hits_total Cache hits.
+        # TYPE cache_hits_total counter
+        cache_hits_total{cache="fragments"} 1
+        <BLANKLINE>
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric {metric.name!r} is already registered as a {existing.kind}")
+                if isinstance(metric, Gauge):
+                    existing.callback = metric.callback  # re-registration replaces the source
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        """Return the counter called name, creating it on first use."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """Return the histogram called name, creating it on first use."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name, documentation, callback):
+        """Register a gauge whose value comes from callback() at render time."""
+        return self._register(Gauge(name, documentation, callback))
+
+    def get(self, name):
+        return self._metrics.get(name)
+
+    def render(self):
+        """All metrics in Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            samples = metric.samples()
+            if samples:
+                lines.extend(metric.header())
+                lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+def install_request_metrics(app, registry):
+    """Time every request of app into registry (see the module docstring)."""
+    requests_total = registry.counter(
+        "http_requests_total", "HTTP requests handled.", ["endpoint", "method", "status"]
+    )
+    duration = registry.histogram(
+        "http_request_duration_seconds", "Time to produce a response.", ["endpoint", "method"]
+    )
+
+    @app.before_request
+    def _start_request_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def _record_request(response):
+        started = g.pop("request_started", None)
+        if started is not None:
+            endpoint = request.endpoint or "unmatched"
+            duration.observe(time.perf_counter() - started, endpoint, request.method)
+            requests_total.inc(endpoint, request.method, str(response.status_code))
+        return response
+
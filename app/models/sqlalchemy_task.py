@@ -1,6 +1,7 @@
 # app/models/sqlalchemy_task.py
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index, event, text
+from sqlalchemy.exc import OperationalError
 from datetime import datetime
 
 """
@@ -24,5 +25,83 @@ class Task(Base):
     completed = Column(Boolean, default=False)
     created_at = Column(String, nullable=True)  # Store as ISO 8601 string from TimeService
 
+    # ix_tasks_completed_id serves "open"/"completed" filtered pages in id order
+    # without a table scan; ix_tasks_created_at serves created_at range and
+    # "most recent" queries (ISO 8601 strings sort in time order)
+    __table_args__ = (
+        Index("ix_tasks_completed_id", "completed", "id"),
+        Index("ix_tasks_created_at", "created_at"),
+    )
+
     def __repr__(self):
-        return f"<Task(id={self.id}, title='{self.title}', completed={self.completed}, created_at='{self.created_at}')>"
\ No newline at end of file
+        return f"<Task(id={self.id}, title='{self.title}', completed={self.completed}, created_at='{self.created_at}')>"
+
+
+# 🔍 Full-text search (SQLite FTS5)
+# tasks_fts is an "external content" FTS5 table: it stores only the search index
+# and reads title/description back from `tasks`. The triggers keep the index in
+# step with every INSERT/UPDATE/DELETE on `tasks`, whichever code path runs it.
+# prefix='2 3' adds prefix indexes so "gro*" style queries stay fast.
+SEARCH_INDEX_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description, content='tasks', content_rowid='id', prefix='2 3'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+]
+
+
+def create_search_index(connection):
+    """Create the FTS5 search table and its triggers on a SQLite connection.
+
+    Returns:
+        bool: True if the search index exists afterwards, False when the
+        database is not SQLite or SQLite was built without FTS5
+    """
+    if connection.dialect.name != "sqlite":
+        return False
+    try:
+        for statement in SEARCH_INDEX_DDL:
+            connection.execute(text(statement))
+    except OperationalError:
+        return False  # no FTS5 module; searches fall back to TaskService
+    return True
+
+
+@event.listens_for(Task.__table__, "after_create")
+def _create_search_index_with_table(target, connection, **kw):
+    # Any Base.metadata.create_all() that creates `tasks` (including the
+    # in-memory databases used by tests) also gets the search index
+    create_search_index(connection)
+
+
+def create_schema(engine):
+    """Create missing tables, indexes and the full-text search index.
+
+    `Base.metadata.create_all` only creates indexes together with a new table,
+    so indexes added after a database file was first created are created here.
+    A search index added to an existing database is filled from `tasks`.
+    """
+    Base.metadata.create_all(engine)
+    for index in Task.__table__.indexes:
+        index.create(engine, checkfirst=True)
+    with engine.begin() as connection:
+        if connection.dialect.name != "sqlite":
+            return
+        existed = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'")
+        ).first() is not None
+        if create_search_index(connection) and not existed:
+            connection.execute(text("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')"))
@@ -1,15 +1,25 @@
+import json
+
+
 class Task:
-    """Domain model for a Task, with id, title, description, completed status, and creation timestamp."""
+    """Domain model for a Task, with id, title, description, completed status, and creation timestamp.
+
+    `version` is set by TaskService each time the task changes, so cached
+    renderings of a task can be keyed on (id, version).
+    """
     def __init__(self, task_id: int, title: str, description: str = "", completed: bool = False, created_at: str = None) -> None:
         self.id: int = task_id
         self.title: str = title
         self.description: str = description
         self.completed: bool = completed
         self.created_at: str = created_at
+        self.version: int = 0
+        self._json: bytes = None  # cached to_json() result
 
     def mark_complete(self) -> None:
         """Mark this task as completed."""
         self.completed = True
+        self._json = None
 
     def to_dict(self) -> dict[str, object]:
         """Serialize Task object to a dictionary (for JSON serialization)."""
@@ -19,4 +29,16 @@ class Task:
             "description": self.description,
             "completed": self.completed,
             "created_at": self.created_at
-        }
\ No newline at end of file
+        }
+
+    def to_json(self) -> bytes:
+        """Serialize Task object to JSON bytes, encoded once and then cached.
+
+        Uses the same settings as Flask's jsonify() outside debug mode (sorted
+        keys, no spaces, ASCII-only), so fragments can be joined into a list
+        body that is byte-for-byte what jsonify() would return.
+        """
+        if self._json is None:
+            text = json.dumps(self.to_dict(), ensure_ascii=True, sort_keys=True, separators=(",", ":"))
+            self._json = text.encode("ascii")
+        return self._json
@@ -0,0 +1,140 @@
+"""
+app/profiling.py - On-Demand cProfile of Single Requests
+
+When one endpoint is slow in staging, send that exact request again with an
+`X-Profile` header carrying the profiling secret:
+
+    curl -H "X-Profile: $PROFILE_SECRET" http://staging:5000/tasks
+
+The request runs under cProfile (including the streamed response body) and
+two files are written to the profile directory:
+
+    <time>-<method>-<path>.prof   raw stats, for snakeviz / pstats / gprof2dot
+    <time>-<method>-<path>.txt    top functions by cumulative time, followed
+                                  by the app's own frames (routes, TaskService,
+                                  repositories, TimeService)
+
+The response carries `X-Profile-File: <name>.prof`.
+
+Off by default: the middleware is only installed when PROFILE_SECRET is set,
+and a request whose header does not match is served normally. Only one
+request is profiled at a time (Python allows one active profiler); a second
+profiled request arriving meanwhile is served unprofiled with
+`X-Profile-File: busy`.
+
+Configuration (app.config or environment):
+    PROFILE_SECRET  Enables profiling; the value the X-Profile header must match
+    PROFILE_DIR     Where profiles are written (default: <tmp>/task-profiles)
+"""
+
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import re
+import tempfile
+import threading
+import time
+
+# Frames shown in the second section of the text summary
+APP_FRAMES_RE = r"app[/\\](routes|services|repositories|models)[/\\]"
+TOP_FUNCTIONS = 40
+
+
+def _profile_name(environ):
+    method = environ.get("REQUEST_METHOD", "GET")
+    path = re.sub(r"[^A-Za-z0-9]+", "_", environ.get("PATH_INFO", "/")).strip("_") or "root"
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{int(time.time() * 1000) % 1000:03d}-{method}-{path[:60]}"
+
+
+def write_profile(profile, directory, name):
+    """Write profile as <name>.prof plus a <name>.txt summary; return the .prof path."""
+    os.makedirs(directory, exist_ok=True)
+    prof_path = os.path.join(directory, f"{name}.prof")
+    profile.dump_stats(prof_path)
+
+    summary = io.StringIO()
+    stats = pstats.Stats(profile, stream=summary).sort_stats(pstats.SortKey.CUMULATIVE)
+    summary.write(f"Top {TOP_FUNCTIONS} functions by cumulative time\n")
+    stats.print_stats(TOP_FUNCTIONS)
+    summary.write("\nApplication frames (routes, services, repositories, models)\n")
+    stats.print_stats(APP_FRAMES_RE, TOP_FUNCTIONS)
+    with open(os.path.join(directory, f"{name}.txt"), "w", encoding="utf-8") as f:
+        f.write(summary.getvalue())
+    return prof_path
+
+
+class ProfilingMiddleware:
+    """WSGI middleware that profiles requests sent with the right X-Profile header."""
+
+    def __init__(self, wsgi_app, secret, directory):
+        self.wsgi_app = wsgi_app
+        self.secret = secret.encode("utf-8")
+        self.directory = directory
+        self._lock = threading.Lock()  # one active profiler per process
+
+    def _requested(self, environ):
+        header = environ.get("HTTP_X_PROFILE")
+        return header is not None and hmac.compare_digest(header.encode("utf-8"), self.secret)
+
+    def __call__(self, environ, start_response):
+        if not self._requested(environ):
+            return self.wsgi_app(environ, start_response)
+        if not self._lock.acquire(blocking=False):
+            return self.wsgi_app(environ, self._with_header(start_response, "busy"))
+        try:
+            return self._profile(environ, start_response)
+        finally:
+            self._lock.release()
+
+    @staticmethod
+    def _with_header(start_response, value):
+        def _start_response(status, headers, exc_info=None):
+            return start_response(status, headers + [("X-Profile-File", value)], exc_info)
+        return _start_response
+
+    def _profile(self, environ, start_response):
+        name = _profile_name(environ)
+        captured = {}
+
+        def capture_start_response(status, headers, exc_info=None):
+            captured["start"] = (status, headers, exc_info)
+            return lambda data: captured.setdefault("written", []).append(data)
+
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            # Run the whole request, including a streamed body, under the profiler
+            result = self.wsgi_app(environ, capture_start_response)
+            try:
+                body = list(result)
+            finally:
+                if hasattr(result, "close"):
+                    result.close()
+        finally:
+            profile.disable()
+
+        write_profile(profile, self.directory, name)
+        status, headers, exc_info = captured["start"]
+        start_response(status, headers + [("X-Profile-File", f"{name}.prof")], exc_info)
+        return captured.get("written", []) + body
+
+
+def install_request_profiler(app):
+    """Enable header-triggered profiling when PROFILE_SECRET is configured.
+
+    Returns:
+        bool: True if the profiler was installed
+    """
+    secret = app.config.get("PROFILE_SECRET") or os.getenv("PROFILE_SECRET")
+    if not secret:
+        return False
+    directory = (
+        app.config.get("PROFILE_DIR")
+        or os.getenv("PROFILE_DIR")
+        or os.path.join(tempfile.gettempdir(), "task-profiles")
+    )
+    app.config["PROFILE_DIR"] = directory
+    app.wsgi_app = ProfilingMiddleware(app.wsgi_app, secret, directory)
+    return True
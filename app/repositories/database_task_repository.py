@@ -1,8 +1,13 @@
 #app/repositories/database_task_repository.py
 
+import re
 from abc import ABC, abstractmethod
 from typing import List, Optional
+from sqlalchemy import bindparam, delete, insert, select, text, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import OperationalError
 from app.models.sqlalchemy_task import Task
+from app import tracing
 
 class TaskRepository(ABC):
     """Abstract base class for task repositories.
@@ -93,46 +98,224 @@ class DatabaseTaskRepository(TaskRepository):
     def __init__(self, session_factory):
         self.session_factory = session_factory
 
+    @staticmethod
+    def _to_dict(task):
+        """Convert a Task row to the dict format used by TaskService."""
+        return {
+            'id': task.id,
+            'title': task.title,
+            'description': task.description,
+            'completed': task.completed,
+            'created_at': task.created_at
+        }
+
     def load_tasks(self):
         """Load all tasks as dictionaries (for compatibility with TaskService)."""
+        with tracing.span("DatabaseTaskRepository.load_tasks"):
+            session = self.session_factory()
+            try:
+                tasks = session.query(Task).all()
+                return [self._to_dict(task) for task in tasks]
+            finally:
+                session.close()
+
+    def query_tasks(self, completed: Optional[bool] = None, offset: int = 0, limit: Optional[int] = None):
+        """Load one page of tasks as dictionaries, in id order.
+
+        Filtering and paging run in SQL (LIMIT/OFFSET over the
+        ix_tasks_completed_id index), so only the requested rows are read.
+
+        Args:
+            completed: True/False to filter by status, None for all tasks
+            offset: Number of matching tasks to skip
+            limit: Maximum number of tasks to return (None for no limit)
+        """
         session = self.session_factory()
         try:
-            tasks = session.query(Task).all()
-            return [
-                {
-                    'id': task.id,
-                    'title': task.title,
-                    'description': task.description,
-                    'completed': task.completed,
-                    'created_at': task.created_at
-                }
-                for task in tasks
-            ]
+            query = session.query(Task)
+            if completed is not None:
+                query = query.filter(Task.completed == completed)
+            query = query.order_by(Task.id).offset(offset)
+            if limit is not None:
+                query = query.limit(limit)
+            return [self._to_dict(task) for task in query]
         finally:
             session.close()
 
-    def save_tasks(self, tasks):
-        """Save tasks from a list of dictionaries (for compatibility with TaskService).
-        Note: This method recreates all tasks - use carefully.
+    def query_tasks_by_created(self, created_after: Optional[str] = None,
+                               created_before: Optional[str] = None,
+                               limit: Optional[int] = None,
+                               newest_first: bool = False) -> List[dict]:
+        """Return tasks created strictly between two timestamps, in creation order.
+
+        Runs as a range scan on the ix_tasks_created_at index. Tasks without
+        a created_at are never returned.
+
+        Args:
+            created_after: Exclusive lower bound (ISO 8601), None for no bound
+            created_before: Exclusive upper bound (ISO 8601), None for no bound
+            limit: Maximum number of tasks to return (None for no limit)
+            newest_first: Order newest first instead of oldest first
         """
         session = self.session_factory()
         try:
-            # Clear existing tasks
-            session.query(Task).delete()
-            # Add new tasks
-            for task_dict in tasks:
-                task = Task(
-                    id=task_dict.get('id'),
-                    title=task_dict['title'],
-                    description=task_dict.get('description'),
-                    completed=task_dict.get('completed', False),
-                    created_at=task_dict.get('created_at')
-                )
-                session.add(task)
-            session.commit()
+            query = session.query(Task).filter(Task.created_at.isnot(None))
+            if created_after is not None:
+                query = query.filter(Task.created_at > created_after)
+            if created_before is not None:
+                query = query.filter(Task.created_at < created_before)
+            if newest_first:
+                query = query.order_by(Task.created_at.desc(), Task.id.desc())
+            else:
+                query = query.order_by(Task.created_at, Task.id)
+            if limit is not None:
+                query = query.limit(limit)
+            return [self._to_dict(task) for task in query]
+        finally:
+            session.close()
+
+    @staticmethod
+    def _match_expression(query: str) -> str:
+        """Turn free text into an FTS5 query: every word must match as a prefix.
+
+        Words are quoted, so user input can never inject FTS5 operators.
+        Example: 'buy gro' → '"buy"* "gro"*'
+        """
+        return " ".join(f'"{word}"*' for word in re.findall(r"\w+", query))
+
+    def search_tasks(self, query: str, limit: int = 20):
+        """Full-text search over titles and descriptions, best matches first.
+
+        Uses the tasks_fts FTS5 index (kept in sync by triggers, see
+        app/models/sqlalchemy_task.py), ranked by bm25 with title matches
+        weighted above description matches.
+
+        Every match is ranked: FTS5 computes the rank of each matching row and
+        keeps the best `limit`, so an older task that matches well is found
+        as readily as a new one.
+
+        Returns:
+            List[dict]: Matching tasks, or None if the database has no search index
+        """
+        match = self._match_expression(query)
+        if not match:
+            return []
+        statement = select(Task).from_statement(text(
+            "SELECT tasks.* FROM ("
+            "  SELECT rowid, rank FROM tasks_fts"
+            "  WHERE tasks_fts MATCH :match AND rank MATCH 'bm25(10.0, 1.0)'"
+            "  ORDER BY rank LIMIT :limit"
+            ") AS hits JOIN tasks ON tasks.id = hits.rowid ORDER BY hits.rank"
+        ))
+        params = {"match": match, "limit": limit}
+        session = self.session_factory()
+        try:
+            rows = session.execute(statement, params).scalars()
+            return [self._to_dict(task) for task in rows]
+        except OperationalError:
+            return None
         finally:
             session.close()
 
+    def count_tasks(self, completed: Optional[bool] = None) -> int:
+        """Count tasks, optionally only those with the given completed status."""
+        session = self.session_factory()
+        try:
+            query = session.query(Task)
+            if completed is not None:
+                query = query.filter(Task.completed == completed)
+            return query.count()
+        finally:
+            session.close()
+
+    # Columns compared and written by save_tasks/save_changes, in row order
+    _SAVED_COLUMNS = ("id", "title", "description", "completed", "created_at")
+    # Ids per DELETE ... WHERE id IN (...), below SQLite's bound-parameter limit
+    _DELETE_CHUNK = 500
+
+    def save_tasks(self, tasks):
+        """Make the table hold exactly tasks, a list of dictionaries (for compatibility with TaskService).
+
+        Only the difference is written: rows whose id is gone are deleted,
+        new ids are inserted and changed rows are updated. Unchanged rows are
+        not touched, so the tasks_fts triggers only re-index what changed
+        (rewriting every row re-indexed the whole table on every save).
+        """
+        with tracing.span("DatabaseTaskRepository.save_tasks", tasks=len(tasks)):
+            table = Task.__table__
+            session = self.session_factory()
+            try:
+                stored = {
+                    row[0]: tuple(row)
+                    for row in session.execute(select(*(table.c[name] for name in self._SAVED_COLUMNS)))
+                }
+                inserts, updates, kept = [], [], set()
+                for task_dict in tasks:
+                    row = self._row(task_dict)
+                    current = stored.get(row["id"])
+                    if current is None:
+                        inserts.append(row)
+                        continue
+                    kept.add(row["id"])
+                    if current != tuple(row[name] for name in self._SAVED_COLUMNS):
+                        updates.append({f"b_{name}": value for name, value in row.items()})
+
+                self._delete_ids(session, [task_id for task_id in stored if task_id not in kept])
+                if updates:
+                    session.execute(
+                        update(table)
+                        .where(table.c.id == bindparam("b_id"))
+                        .values({name: bindparam(f"b_{name}") for name in self._SAVED_COLUMNS[1:]}),
+                        updates,
+                    )
+                if inserts:
+                    session.execute(insert(table), inserts)
+                session.commit()
+            finally:
+                session.close()
+
+    def save_changes(self, changed, removed_ids):
+        """Write only what changed since the last save (for TaskService).
+
+        Rows in `changed` (task dictionaries) are inserted, or updated if
+        their id exists; rows in `removed_ids` are deleted. Nothing else is
+        read or written, so a save costs O(changes), however large the table.
+        The caller must know what the table holds, e.g. because it loaded it
+        and saved every change since.
+        """
+        with tracing.span("DatabaseTaskRepository.save_changes", changed=len(changed), removed=len(removed_ids)):
+            table = Task.__table__
+            session = self.session_factory()
+            try:
+                self._delete_ids(session, removed_ids)
+                if changed:
+                    upsert = sqlite_insert(table)
+                    upsert = upsert.on_conflict_do_update(
+                        index_elements=[table.c.id],
+                        set_={name: upsert.excluded[name] for name in self._SAVED_COLUMNS[1:]},
+                    )
+                    session.execute(upsert, [self._row(task_dict) for task_dict in changed])
+                session.commit()
+            finally:
+                session.close()
+
+    @staticmethod
+    def _row(task_dict):
+        """Column values for one task dictionary."""
+        return {
+            "id": task_dict.get("id"),
+            "title": task_dict["title"],
+            "description": task_dict.get("description"),
+            "completed": bool(task_dict.get("completed", False)),
+            "created_at": task_dict.get("created_at"),
+        }
+
+    def _delete_ids(self, session, ids):
+        """Delete the rows with these ids, a chunk of ids per statement."""
+        table = Task.__table__
+        for i in range(0, len(ids), self._DELETE_CHUNK):
+            session.execute(delete(table).where(table.c.id.in_(ids[i:i + self._DELETE_CHUNK])))
+
     def add_task(self, title: str, description: Optional[str] = None):
         """Add a new task to the database."""
         session = self.session_factory()
@@ -0,0 +1,54 @@
+import hmac
+import os
+
+from flask import Blueprint, Response, abort, current_app, jsonify, request
+
+admin_bp = Blueprint("admin", __name__, url_prefix="/admin")
+
+
+def _require_admin():
+    """
+    Admin endpoints need `Authorization: Bearer <ADMIN_TOKEN>`; without a
+    configured ADMIN_TOKEN they do not exist (404).
+    """
+    token = current_app.config.get("ADMIN_TOKEN") or os.getenv("ADMIN_TOKEN")
+    if not token:
+        abort(404)
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+    if not hmac.compare_digest(supplied.encode("utf-8"), token.encode("utf-8")):
+        return jsonify({"error": "Unauthorized"}), 401
+    return None
+
+
+def _sampling_profiler():
+    profiler = getattr(current_app, "sampling_profiler", None)
+    if profiler is None:
+        abort(404)
+    return profiler
+
+
+@admin_bp.route("/profile/stacks", methods=["GET"])
+def profile_stacks():
+    """
+    Stacks sampled by the background profiler, in collapsed format
+    ("outer;inner;leaf count" per line) for flamegraph.pl or speedscope.
+
+    ?contains=app. keeps only stacks that pass through the app's own code.
+    """
+    denied = _require_admin()
+    if denied:
+        return denied
+    profiler = _sampling_profiler()
+    response = Response(profiler.collapsed(request.args.get("contains")), mimetype="text/plain")
+    response.headers["X-Profile-Samples"] = str(profiler.samples)
+    return response
+
+
+@admin_bp.route("/profile/reset", methods=["POST"])
+def profile_reset():
+    """Discard the samples collected so far (e.g. before a load test)."""
+    denied = _require_admin()
+    if denied:
+        return denied
+    _sampling_profiler().reset()
+    return "", 204
@@ -0,0 +1,15 @@
+from flask import Blueprint, Response, current_app
+
+metrics_bp = Blueprint("metrics", __name__)
+
+@metrics_bp.route("/metrics")
+def metrics():
+    """
+    Prometheus scrape endpoint: request, time-service, database and task
+    metrics in the text exposition format (see app/metrics.py).
+    """
+    return Response(
+        current_app.metrics.render(),
+        mimetype="text/plain",
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
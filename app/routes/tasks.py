@@ -1,5 +1,5 @@
 # app/routes/tasks.py
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, Response, request, jsonify, current_app
 from app.exceptions import TaskValidationError
 # ✅ Phase 2: Remove direct storage imports - we'll use injected service instead
 # from app.services.task_storage import load_tasks, save_tasks
@@ -68,12 +68,79 @@ def add_task():
         # Unexpected errors
         return jsonify({"error": f"Internal error: {str(e)}"}), 500
 
+# Largest number of search results a client may request
+MAX_SEARCH_RESULTS = 100
+
 @tasks_bp.route('', methods=['GET'])
 def list_tasks():
-    """Return the list of all tasks. GET /api/tasks"""
-    tasks = current_app.task_service.get_all_tasks()
+    """Return the list of all tasks. GET /api/tasks
+
+    With ?q=words, return matching tasks instead (best matches first),
+    at most ?limit= results (default 20, max 100), ranked over all matches.
+
+    With ?created_after= and/or ?created_before= (ISO 8601 UTC timestamps,
+    both exclusive), return the tasks created in that range, oldest first,
+    optionally capped by ?limit=.
+    """
+    query = request.args.get("q")
+    if query is not None:
+        limit = min(max(request.args.get("limit", 20, type=int), 1), MAX_SEARCH_RESULTS)
+        return jsonify(current_app.task_service.search_tasks(query, limit)), 200
+    created_after = request.args.get("created_after")
+    created_before = request.args.get("created_before")
+    if created_after is not None or created_before is not None:
+        limit = request.args.get("limit", type=int)
+        tasks = current_app.task_service.get_tasks_by_created(
+            created_after=created_after,
+            created_before=created_before,
+            limit=None if limit is None else max(limit, 1),
+        )
+        return jsonify(tasks), 200
+    service = current_app.task_service
+    if hasattr(service, "get_all_tasks_json"):
+        # Pre-encoded body, cached until the task list changes
+        return Response(service.get_all_tasks_json(), mimetype="application/json"), 200
+    tasks = service.get_all_tasks()
     return jsonify(tasks), 200
 
+@tasks_bp.route('/export.ndjson', methods=['GET'])
+def export_tasks():
+    """Stream all tasks as newline-delimited JSON, one task per line.
+
+    GET /api/tasks/export.ndjson
+    """
+    return Response(
+        current_app.task_service.iter_tasks_ndjson(),
+        mimetype="application/x-ndjson",
+        headers={"Content-Disposition": "attachment; filename=tasks.ndjson"},
+    )
+
+# Largest number of tasks /api/tasks/recent returns
+MAX_RECENT_TASKS = 100
+
+@tasks_bp.route('/recent', methods=['GET'])
+def recent_tasks():
+    """Return the most recently created tasks, newest first. GET /api/tasks/recent
+
+    ?limit= sets how many (default 10, max 100).
+    """
+    limit = min(max(request.args.get("limit", 10, type=int), 1), MAX_RECENT_TASKS)
+    return jsonify(current_app.task_service.get_recent_tasks(limit)), 200
+
+# Largest number of title suggestions a client may request
+MAX_SUGGESTIONS = 20
+
+@tasks_bp.route('/suggest', methods=['GET'])
+def suggest_titles():
+    """Autocomplete for task titles. GET /api/tasks/suggest?prefix=buy
+
+    Returns existing titles starting with ?prefix= (case-insensitive),
+    at most ?limit= of them (default 10, max 20).
+    """
+    prefix = request.args.get("prefix", "")
+    limit = min(max(request.args.get("limit", 10, type=int), 1), MAX_SUGGESTIONS)
+    return jsonify(current_app.task_service.suggest_titles(prefix, limit)), 200
+
 @tasks_bp.route("/<int:task_id>", methods=["PUT"])
 def complete_task(task_id):
     """
@@ -1,4 +1,7 @@
-from flask import Blueprint, render_template, request, redirect, url_for, current_app
+import math
+
+from flask import Blueprint, Response, render_template, stream_template, stream_with_context, request, redirect, url_for, current_app
+from markupsafe import Markup
 
 """
 📚 UI ROUTES - WEB INTERFACE FOR TASK MANAGEMENT:
@@ -32,6 +35,84 @@ maintaining separation between web layer and business layer.
 
 ui_bp = Blueprint("ui", __name__)
 
+
+# Task list paging: default page size and the largest size a client may ask for
+TASKS_PER_PAGE = 20
+MAX_TASKS_PER_PAGE = 100
+STATUS_TABS = (("all", "All"), ("open", "Open"), ("completed", "Completed"))
+
+# Streamed pages are sent in chunks of at least this many characters, so the
+# browser gets the page header and first rows quickly without one network write
+# per template event
+STREAM_CHUNK_SIZE = 8192
+
+
+def _render_task_fragments(versioned_tasks):
+    """Yield one rendered <article> per task, reusing cached HTML for unchanged tasks.
+
+    Fragments are cached on (task id, task version), so a task is only
+    re-rendered after it changes. task_item.html is rendered straight from the
+    Jinja environment, which skips the per-render context processors (and their
+    TimeService call) that render_template would run for every task.
+
+    Args:
+        versioned_tasks: Iterable of (task dict, version) pairs
+    """
+    template = current_app.jinja_env.get_template("task_item.html")
+    cache = current_app.fragment_cache
+    for task, version in versioned_tasks:
+        if version is None:
+            # Read straight from the repository; nothing safe to cache it under
+            yield Markup(template.render(task=task))
+            continue
+        yield cache.get_or_render(
+            (task["id"], version),
+            lambda task=task: Markup(template.render(task=task)),
+        )
+
+
+def _wants_row_fragment():
+    """True when the client asked for just the changed row (X-Fragment: row)."""
+    return request.headers.get("X-Fragment") == "row"
+
+
+def _row_fragment_response(task, status=200):
+    """Respond with a single task row, or an empty fragment when task is None."""
+    if task is None:
+        return Response("", status=status, mimetype="text/html")
+    # Services without versions (e.g. test doubles) render the row uncached
+    get_task_version = getattr(current_app.task_service, "get_task_version", None)
+    version = None if get_task_version is None else get_task_version(task["id"])
+    fragment = next(_render_task_fragments([(task, version)]))
+    return Response(fragment, status=status, mimetype="text/html")
+
+
+def _page_args():
+    """Read and clamp the status/page/per_page query parameters."""
+    status = request.args.get("status", "all")
+    if status not in dict(STATUS_TABS):
+        status = "all"
+    page = max(request.args.get("page", 1, type=int), 1)
+    per_page = request.args.get("per_page", TASKS_PER_PAGE, type=int)
+    per_page = min(max(per_page, 1), MAX_TASKS_PER_PAGE)
+    return status, page, per_page
+
+
+def _chunked(stream, size=STREAM_CHUNK_SIZE):
+    """Join small template events into chunks of roughly `size` characters."""
+    buffer = []
+    buffered = 0
+    for piece in stream:
+        buffer.append(piece)
+        buffered += len(piece)
+        if buffered >= size:
+            yield "".join(buffer)
+            buffer = []
+            buffered = 0
+    if buffer:
+        yield "".join(buffer)
+
+
 @ui_bp.route("/")
 def home():
     """
@@ -83,15 +164,65 @@ def show_tasks():
     Display all tasks in a list view.
     
     📚 DATA FLOW: 
-    1. Route calls TaskService.get_all_tasks()
-    2. Service returns list of Task objects converted to dicts
-    3. Template receives 'tasks' variable for rendering
-    4. Jinja2 loops through tasks with {% for task in tasks %}
+    1. Route calls TaskService.get_tasks_page() for the requested page
+    2. Service returns that page's Task objects converted to dicts
+    3. Each task is rendered (or fetched from the fragment cache) as HTML
+    4. Jinja2 loops through the fragments with {% for fragment in task_fragments %}
     
     This demonstrates the MVC pattern: Route (Controller) → Service (Model) → Template (View)
+
+    ⚡ STREAMING: The page is rendered with stream_template over a lazy task
+    iterator, so the header and first rows are sent before later rows are
+    rendered, and memory use does not grow with the number of tasks.
+
+    📄 PAGING: ?status=all|open|completed&page=N&per_page=M selects one page;
+    the filter and paging are applied by TaskService.get_tasks_page(), never
+    in the template. ?mode=scroll loads further pages via /tasks/rows.
+
+    🔍 SEARCH: ?q=words shows matching tasks (TaskService.search_tasks) instead.
     """
-    tasks = current_app.task_service.get_all_tasks()
-    return render_template("task_list.html", tasks=tasks)
+    status, page, per_page = _page_args()
+    mode = "scroll" if request.args.get("mode") == "scroll" else "pages"
+    query = request.args.get("q", "").strip()
+    if query:
+        # Search results: one bounded, relevance-ranked list instead of pages
+        results = current_app.task_service.search_tasks(query, MAX_TASKS_PER_PAGE)
+        entries, total, page, pages = [(task, None) for task in results], len(results), 1, 1
+    else:
+        entries, total = current_app.task_service.get_tasks_page(page, per_page, status)
+        pages = max(math.ceil(total / per_page), 1)
+    return Response(_chunked(stream_template(
+        "task_list.html",
+        task_fragments=_render_task_fragments(entries),
+        status=status,
+        status_tabs=STATUS_TABS,
+        page=page,
+        pages=pages,
+        per_page=per_page,
+        total=total,
+        mode=mode,
+        query=query,
+    )), mimetype="text/html")
+
+@ui_bp.route("/tasks/rows")
+def task_rows():
+    """
+    Return one page of task rows as an HTML fragment (no page layout).
+
+    📚 INFINITE SCROLL: In mode=scroll, task_list.js calls this route as the
+    user nears the end of the list and appends the returned <article> rows.
+    The X-Next-Page header holds the URL of the following page, and is empty
+    on the last page.
+    """
+    status, page, per_page = _page_args()
+    entries, total = current_app.task_service.get_tasks_page(page, per_page, status)
+    # The rows render while the body is sent, after the view has returned
+    response = Response(stream_with_context(_chunked(_render_task_fragments(entries))), mimetype="text/html")
+    has_next = page * per_page < total
+    response.headers["X-Next-Page"] = (
+        url_for("ui.task_rows", status=status, page=page + 1, per_page=per_page) if has_next else ""
+    )
+    return response
 
 @ui_bp.route("/tasks/<int:task_id>/delete", methods=["POST"])
 def delete_task(task_id):
@@ -103,13 +234,20 @@ def delete_task(task_id):
     - HTTP Method: POST for destructive actions (RESTful design)
     - Error Handling: TaskService will raise exception if task not found
     - Redirect: Post-Redirect-Get pattern prevents duplicate submissions
+
+    ⚡ PARTIAL UPDATE: With the header "X-Fragment: row" (sent by
+    task_list.js), the response is an empty fragment that replaces the row,
+    instead of a redirect that re-renders the whole list.
     """
+    deleted = None
     try:
-        current_app.task_service.delete_task(task_id)
+        deleted = current_app.task_service.delete_task(task_id)
     except Exception as e:
         # In production, you'd handle this error gracefully
         # For now, let the error bubble up for debugging
         pass
+    if _wants_row_fragment():
+        return _row_fragment_response(None, status=200 if deleted else 404)
     return redirect(url_for("ui.show_tasks"))
 
 @ui_bp.route("/tasks/<int:task_id>/complete", methods=["POST"])
@@ -124,12 +262,18 @@ def complete_task(task_id):
     - UI layer just orchestrates the flow
     
     This separation of concerns makes the code maintainable and testable.
+
+    ⚡ PARTIAL UPDATE: With the header "X-Fragment: row" (sent by
+    task_list.js), the response is just the updated task's <article>.
     """
+    updated = None
     try:
-        current_app.task_service.complete_task(task_id)
+        updated = current_app.task_service.complete_task(task_id)
     except Exception as e:
         # In production, you'd show user-friendly error messages
         pass
+    if _wants_row_fragment():
+        return _row_fragment_response(updated, status=200 if updated else 404)
     return redirect(url_for("ui.show_tasks"))
 
 @ui_bp.route("/tasks/report")
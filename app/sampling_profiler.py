@@ -0,0 +1,172 @@
+"""
+app/sampling_profiler.py - Background Sampling Profiler (Flame-Graph Stacks)
+
+Per-request profiling (app/profiling.py) only shows one request. This
+profiler runs all the time and shows where the process spends its time in
+aggregate: a background thread wakes every `interval` seconds, reads every
+other thread's current stack with `sys._current_frames()` and counts it.
+
+- Cost is one stack walk per thread per sample and no tracing hooks, so
+  code between samples runs at full speed. At the default 50 samples a
+  second the overhead stays well under 1% (tests/benchmarks/
+  bench_sampling_profiler.py measures it).
+- Memory is bounded: at most `max_stacks` distinct stacks are kept; samples
+  of new stacks beyond that are counted under "(other)". Stacks deeper than
+  `max_depth` keep their innermost frames.
+- `collapsed()` returns Brendan Gregg's collapsed-stack format,
+  "outer;inner;leaf count" per line, ready for flamegraph.pl or speedscope.
+
+Configuration (app.config or environment), read by install_sampling_profiler:
+    SAMPLING_PROFILER              "true" to start the profiler with the app
+    SAMPLING_PROFILER_INTERVAL_MS  Milliseconds between samples (default: 20)
+    SAMPLING_PROFILER_MAX_STACKS   Distinct stacks kept (default: 5000)
+
+The stacks are served at GET /admin/profile/stacks (app/routes/admin.py).
+"""
+
+import os
+import sys
+import threading
+import time
+
+OTHER = "(other)"
+
+
+def frame_label(frame):
+    """Readable, flame-graph-safe name for one stack frame."""
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{module}.{name}".replace(";", ":")
+
+
+class SamplingProfiler:
+    """Periodically sample all thread stacks and count identical stacks.
+
+    Example:
+        >>> profiler = SamplingProfiler(interval=0.001)
+        >>> profiler.sample()  # one sample, normally taken by the thread
+        >>> profiler.samples
+        1
+    """
+
+    def __init__(self, interval=0.02, max_stacks=5000, max_depth=64):
+        """
+        Args:
+            interval: Seconds between samples
+            max_stacks: Most distinct stacks kept in memory
+            max_depth: Most frames kept per stack (innermost ones)
+        """
+        self.interval = interval
+        self.max_stacks = max_stacks
+        self.max_depth = max_depth
+        self.samples = 0
+        self.started_at = None
+        self._counts = {}  # stack tuple (outermost first) → samples
+        self._labels = {}  # code object → frame_label(), computed once per function
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the sampling thread (does nothing if it is already running)."""
+        if self.running:
+            return
+        self._stop.clear()
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def restart_after_fork(self):
+        """Start over in a forked child: the parent's sampling thread is gone
+        there, and its lock may have been copied in the locked state."""
+        self._lock = threading.Lock()
+        self._thread = None
+        self._counts = {}
+        self.samples = 0
+        self.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        """Record the current stack of every thread except the sampler itself."""
+        own_id = threading.get_ident()
+        cache = self._labels
+        stacks = []
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            labels = []
+            while frame is not None and len(labels) < self.max_depth:
+                label = cache.get(frame.f_code)
+                if label is None:
+                    label = cache[frame.f_code] = frame_label(frame)
+                labels.append(label)
+                frame = frame.f_back
+            labels.reverse()
+            stacks.append(tuple(labels))
+        with self._lock:
+            self.samples += 1
+            counts = self._counts
+            for stack in stacks:
+                if stack in counts:
+                    counts[stack] += 1
+                elif len(counts) < self.max_stacks:
+                    counts[stack] = 1
+                else:
+                    counts[(OTHER,)] = counts.get((OTHER,), 0) + 1
+
+    def collapsed(self, contains=None):
+        """Stacks in collapsed format, most frequent first.
+
+        Args:
+            contains: Only stacks with a frame containing this text
+                (e.g. "app." for the application's own code)
+        """
+        with self._lock:
+            items = list(self._counts.items())
+        if contains:
+            items = [(stack, n) for stack, n in items if any(contains in label for label in stack)]
+        items.sort(key=lambda item: item[1], reverse=True)
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in items)
+
+    def reset(self):
+        """Forget every sample taken so far."""
+        with self._lock:
+            self._counts.clear()
+            self.samples = 0
+            self.started_at = time.time()
+
+
+def install_sampling_profiler(app):
+    """Start a SamplingProfiler for app when SAMPLING_PROFILER is enabled.
+
+    Sets `app.sampling_profiler` (None when disabled).
+
+    Returns:
+        bool: True if the profiler was started
+    """
+    def setting(name, default=None):
+        return app.config.get(name) or os.getenv(name) or default
+
+    app.sampling_profiler = None
+    if str(setting("SAMPLING_PROFILER", "")).lower() not in ("1", "true", "yes"):
+        return False
+    app.sampling_profiler = SamplingProfiler(
+        interval=float(setting("SAMPLING_PROFILER_INTERVAL_MS", "20")) / 1000,
+        max_stacks=int(setting("SAMPLING_PROFILER_MAX_STACKS", "5000")),
+    )
+    app.sampling_profiler.start()
+    return True
@@ -0,0 +1,122 @@
+"""
+app/server.py - Production WSGI Server Entry Point
+
+`app/main.py` runs Flask's single-threaded development server. This module runs
+the same `create_app()` application under Gunicorn with several worker
+processes, each serving requests on a pool of threads.
+
+Startup sequence:
+1. The master process builds the app once (`preload_app`) and compiles every
+   template, so compiled templates, blueprints and the database engine are
+   created before any fork.
+2. `when_ready` runs `gc.freeze()` so the preloaded objects are moved out of
+   the garbage collector's generations. Workers then share those memory pages
+   copy-on-write instead of touching (and copying) them on every collection.
+3. `post_fork` disposes the inherited SQLAlchemy connection pool in each
+   worker, so no SQLite connection is ever shared between processes, and
+   restarts the sampling profiler thread (threads do not survive a fork).
+
+Usage:
+    python -m app.server
+
+Environment variables:
+    HOST             Interface to bind (default: 0.0.0.0)
+    PORT             Port to bind (default: 5000)
+    WEB_CONCURRENCY  Number of worker processes (default: 1)
+    WEB_THREADS      Threads per worker process (default: 4)
+    WEB_TIMEOUT      Seconds before a silent worker is restarted (default: 30)
+
+⚠️ NOTE: TaskService keeps its task list in process memory, so every worker
+process holds its own copy. Keep WEB_CONCURRENCY at 1 unless each worker is
+allowed to serve a slightly different view of the task list.
+"""
+
+import gc
+import os
+
+from gunicorn.app.base import BaseApplication
+
+from app import create_app
+from app.templating import precompile_templates
+
+
+def _env_int(environ, name, default):
+    """Read a positive integer from the environment, falling back to default."""
+    value = environ.get(name)
+    if value is None or value.strip() == "":
+        return default
+    number = int(value)
+    if number < 1:
+        raise ValueError(f"{name} must be a positive integer, got {value!r}")
+    return number
+
+
+def when_ready(server):
+    """Freeze the preloaded app's objects before the master forks workers."""
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """Drop database connections inherited from the master process."""
+    application = getattr(server.app, "application", None)
+    engine = getattr(application, "database_engine", None)
+    if engine is not None:
+        # close=False leaves the parent's connections alone and just forgets them
+        engine.dispose(close=False)
+    profiler = getattr(application, "sampling_profiler", None)
+    if profiler is not None:
+        profiler.restart_after_fork()
+
+
+def server_options(environ=None):
+    """Build the Gunicorn settings from environment variables.
+
+    Args:
+        environ: Mapping to read settings from (defaults to os.environ)
+
+    Returns:
+        dict: Gunicorn configuration options
+    """
+    environ = os.environ if environ is None else environ
+    host = environ.get("HOST", "0.0.0.0")
+    port = _env_int(environ, "PORT", 5000)
+    return {
+        "bind": f"{host}:{port}",
+        "workers": _env_int(environ, "WEB_CONCURRENCY", 1),
+        "threads": _env_int(environ, "WEB_THREADS", 4),
+        "worker_class": "gthread",
+        "timeout": _env_int(environ, "WEB_TIMEOUT", 30),
+        "preload_app": True,
+        "when_ready": when_ready,
+        "post_fork": post_fork,
+    }
+
+
+class ProductionServer(BaseApplication):
+    """Gunicorn application that serves a preloaded `create_app()` instance."""
+
+    def __init__(self, app_factory=create_app, options=None):
+        self.app_factory = app_factory
+        self.options = server_options() if options is None else options
+        self.application = None
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            if key in self.cfg.settings and value is not None:
+                self.cfg.set(key, value)
+
+    def load(self):
+        if self.application is None:
+            self.application = self.app_factory()
+            precompile_templates(self.application)
+        return self.application
+
+
+def main():
+    ProductionServer().run()
+
+
+if __name__ == "__main__":
+    main()
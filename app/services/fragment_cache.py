@@ -0,0 +1,70 @@
+"""
+app/services/fragment_cache.py - Size-Bounded LRU Cache for Rendered HTML
+
+The task list page is made of one `<article class="task-item">` block per
+task. Most page views happen when no task has changed, so re-rendering every
+block is wasted work. This cache keeps each rendered block under a key of
+(task id, task version); a task gets a new version whenever it changes, so a
+stale fragment is simply never looked up again and ages out of the LRU.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class FragmentCache:
+    """Least-recently-used cache of rendered fragments with a fixed capacity.
+
+    Example:
+        >>> cache = FragmentCache(max_entries=2)
+        >>> cache.get_or_render(("task", 1, 1), lambda: "<li>one</li>")
+        '<li>one</li>'
+        >>> cache.hits, cache.misses
+        (0, 1)
+    """
+
+    def __init__(self, max_entries: int = 2048):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the cached fragment for key (marking it recently used), or None."""
+        with self._lock:
+            fragment = self._entries.get(key)
+            if fragment is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return fragment
+
+    def set(self, key, fragment) -> None:
+        """Store a fragment, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = fragment
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_render(self, key, render):
+        """Return the cached fragment for key, calling render() on a miss."""
+        fragment = self.get(key)
+        if fragment is None:
+            fragment = render()
+            self.set(key, fragment)
+        return fragment
+
+    def clear(self) -> None:
+        """Drop every cached fragment and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,268 @@
+"""
+app/services/group_commit.py - Group Commit and Write-Behind for Task Saves
+
+Every TaskService change saves the whole task list, and each save is its own
+SQLite transaction ending in an fsync. Under bursty writes most of that work
+is redundant: a save of the newest list already contains every earlier change.
+
+GroupCommitWriter coalesces saves. Writers `submit()` their snapshot and then
+`wait()` for it. One of the waiting threads becomes the leader and saves the
+newest snapshot once for the whole batch; every writer whose change is in it
+is woken when that save has returned, so each caller still only gets its
+answer once its change is durable.
+
+Batching happens naturally while a save is in progress (writers arriving
+meanwhile form the next batch). `window` additionally lets the leader wait a
+moment for more writers before it saves, up to `max_batch` submissions.
+With max_batch=1 every change is saved on its own (fully synchronous).
+
+WriteBehindWriter trades durability for latency: `wait()` returns at once and
+a background thread saves the newest snapshot every `interval` seconds, so a
+crash can lose the changes made since the last save.
+
+Both writers have `flush()`, which returns once everything submitted so far
+is saved; call it (or `close()`) before the process exits. `pending` tells
+whether storage is behind the newest submitted snapshot.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class _Batch:
+    """Snapshots submitted while a batch was open, saved together."""
+
+    __slots__ = ("snapshot", "size", "done", "error")
+
+    def __init__(self):
+        self.snapshot = None
+        self.size = 0
+        self.done = False
+        self.error = None
+
+
+class GroupCommitWriter:
+    """Coalesce concurrent saves of full snapshots into one save per batch.
+
+    Example:
+        >>> saved = []
+        >>> writer = GroupCommitWriter(saved.append)
+        >>> writer.commit(["task 1"])
+        >>> saved
+        [['task 1']]
+    """
+
+    def __init__(self, save, window=0.0, max_batch=64):
+        """
+        Args:
+            save: Callable that durably stores one snapshot
+            window: Seconds the leader waits for more writers before saving
+            max_batch: Save as soon as this many snapshots are waiting
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.save = save
+        self.window = window
+        self.max_batch = max_batch
+        self.batches = 0    # saves performed
+        self.submitted = 0  # snapshots submitted
+        self._cond = threading.Condition()
+        self._queue = deque()  # unsaved batches, oldest first; the last one accepts snapshots
+        self._committing = False
+
+    def submit(self, snapshot):
+        """Queue a snapshot for saving and return a ticket for wait().
+
+        Callers must submit in the order their snapshots were produced (for
+        TaskService: while still holding its writer lock), so the newest
+        snapshot in a batch is always the one that includes every change.
+        """
+        with self._cond:
+            if not self._queue or self._queue[-1].size >= self.max_batch:
+                self._queue.append(_Batch())
+            batch = self._queue[-1]
+            batch.snapshot = snapshot
+            batch.size += 1
+            self.submitted += 1
+            if batch.size >= self.max_batch:
+                self._cond.notify_all()
+            return batch
+
+    def wait(self, batch):
+        """Block until the ticket's batch is saved; re-raise its save error, if any."""
+        with self._cond:
+            while not batch.done:
+                if not self._committing and self._queue[0] is batch:
+                    self._lead(batch)
+                else:
+                    self._cond.wait()
+        if batch.error is not None:
+            raise batch.error
+
+    def commit(self, snapshot):
+        """Submit a snapshot and wait until it is saved."""
+        self.wait(self.submit(snapshot))
+
+    def flush(self):
+        """Return once every batch submitted so far has been saved."""
+        with self._cond:
+            while self._queue or self._committing:
+                if not self._committing:
+                    self._lead(self._queue[0])
+                else:
+                    self._cond.wait()
+
+    def close(self):
+        """Flush; group commit has no background thread to stop."""
+        self.flush()
+
+    @property
+    def pending(self):
+        """True while some submitted snapshot has not been saved yet."""
+        with self._cond:
+            return bool(self._queue) or self._committing
+
+    def _lead(self, batch):
+        """Save `batch` on behalf of all of its writers. Called with the condition held."""
+        self._committing = True
+        if self.window > 0:
+            deadline = time.monotonic() + self.window
+            while batch.size < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+        self._queue.popleft()  # later writers start the next batch
+        self._cond.release()
+        try:
+            self.save(batch.snapshot)
+        except Exception as e:  # handed to every writer in the batch
+            batch.error = e
+        finally:
+            self._cond.acquire()
+            batch.snapshot = None
+            batch.done = True
+            self.batches += 1
+            self._committing = False
+            self._cond.notify_all()
+
+
+class WriteBehindWriter:
+    """Acknowledge saves immediately and store the newest snapshot in the background.
+
+    Example:
+        >>> saved = []
+        >>> writer = WriteBehindWriter(saved.append, interval=60)
+        >>> writer.commit(["task 1"])  # returns without saving
+        >>> saved
+        []
+        >>> writer.close()             # saves what is pending, stops the thread
+        >>> saved
+        [['task 1']]
+    """
+
+    def __init__(self, save, interval=1.0):
+        """
+        Args:
+            save: Callable that durably stores one snapshot
+            interval: Seconds between background saves (the most recent
+                changes that a crash can lose)
+        """
+        self.save = save
+        self.interval = interval
+        self.batches = 0    # saves performed
+        self.submitted = 0  # snapshots submitted
+        self.last_error = None
+        self._cond = threading.Condition()
+        self._pending = None
+        self._has_pending = False
+        self._saving = False
+        self._closed = False
+        self._thread = None
+
+    def submit(self, snapshot):
+        """Make snapshot the next one to save; the previous pending one is dropped."""
+        with self._cond:
+            self._pending = snapshot
+            self._has_pending = True
+            self.submitted += 1
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(
+                    target=self._run, name="task-write-behind", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+        return None
+
+    def wait(self, ticket):
+        """Write-behind never waits for the save."""
+
+    def commit(self, snapshot):
+        """Queue a snapshot for the background thread and return immediately."""
+        self.submit(snapshot)
+
+    def flush(self):
+        """Save the pending snapshot now, raising the save error if it fails."""
+        error = self._save_pending()
+        if error is not None:
+            raise error
+
+    @property
+    def pending(self):
+        """True while some submitted snapshot has not been saved yet."""
+        with self._cond:
+            return self._has_pending or self._saving
+
+    def close(self):
+        """Save the pending snapshot and stop the background thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._has_pending or self._closed)
+                if self._closed:
+                    return  # close() saves whatever is left
+                # Let more changes pile up; close() cuts the wait short
+                self._cond.wait_for(lambda: self._closed, timeout=self.interval)
+            error = self._save_pending()
+            if error is not None:
+                logger.warning(
+                    "write-behind save failed, retrying",
+                    extra={"retry_in_seconds": self.interval, "error": f"{type(error).__name__}: {error}"},
+                )
+                with self._cond:
+                    self._cond.wait_for(lambda: self._closed, timeout=self.interval)
+
+    def _save_pending(self):
+        """Save the pending snapshot, if any. Returns the save error or None."""
+        with self._cond:
+            self._cond.wait_for(lambda: not self._saving)
+            if not self._has_pending:
+                return None
+            snapshot = self._pending
+            self._pending, self._has_pending = None, False
+            self._saving = True
+        error = None
+        try:
+            self.save(snapshot)
+        except Exception as e:
+            error = self.last_error = e
+        with self._cond:
+            if error is None:
+                self.batches += 1
+            elif not self._has_pending:
+                # Keep it for the next attempt unless a newer snapshot replaced it
+                self._pending, self._has_pending = snapshot, True
+            self._saving = False
+            self._cond.notify_all()
+        return error
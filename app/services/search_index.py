@@ -0,0 +1,274 @@
+"""
+app/services/search_index.py - In-Memory Indexes for Task Search
+
+Without the database backend (JSON TaskStorage, or no storage at all) there is
+no FTS5 table to search, and scanning every task's text on each query is
+O(number of tasks). This index maps each word to the set of task ids that
+contain it, so a query only touches the tasks that actually match.
+
+- Term lookups are a dict access.
+- Prefix lookups ("gro" → "groceries", "grout") bisect a sorted list of every
+  distinct word, then read only the words in the matching range.
+- Updates are incremental: adding or removing a task touches only its own words.
+
+TitlePrefixIndex is the matching structure for title autocomplete: a sorted
+array of whole normalized titles, read in order from the first match.
+CreatedAtIndex does the same for creation timestamps (range and "most
+recent" queries).
+"""
+
+import heapq
+import math
+import re
+from bisect import bisect_left, insort
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """Split text into lowercase words.
+
+    Example:
+        >>> tokenize("Buy groceries: milk & eggs")
+        ['buy', 'groceries', 'milk', 'eggs']
+    """
+    return _WORD_RE.findall((text or "").lower())
+
+
+class SearchIndex:
+    """Inverted index from words to the ids of the documents containing them.
+
+    Example:
+        >>> index = SearchIndex()
+        >>> index.add(1, "Buy groceries")
+        >>> index.add(2, "Grout the bathroom")
+        >>> index.search("gro")
+        [1, 2]
+        >>> index.search("buy gro")
+        [1]
+    """
+
+    def __init__(self):
+        self._postings = {}    # word → set of document ids
+        self._documents = {}   # document id → its distinct words
+        self._vocabulary = []  # every word in _postings, kept sorted for prefix lookups
+
+    def __len__(self):
+        return len(self._documents)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._documents
+
+    def add(self, doc_id, text):
+        """Index a document's text, replacing any earlier text for the same id."""
+        if doc_id in self._documents:
+            self.remove(doc_id)
+        words = frozenset(tokenize(text))
+        self._documents[doc_id] = words
+        for word in words:
+            ids = self._postings.get(word)
+            if ids is None:
+                self._postings[word] = {doc_id}
+                insort(self._vocabulary, word)
+            else:
+                ids.add(doc_id)
+
+    def remove(self, doc_id):
+        """Drop a document from the index (no-op if it is not indexed)."""
+        for word in self._documents.pop(doc_id, ()):
+            ids = self._postings[word]
+            ids.discard(doc_id)
+            if not ids:
+                del self._postings[word]
+                del self._vocabulary[bisect_left(self._vocabulary, word)]
+
+    def clear(self):
+        """Remove every document."""
+        self._postings.clear()
+        self._documents.clear()
+        self._vocabulary.clear()
+
+    def _prefix_matches(self, prefix):
+        """Ids of documents with at least one word starting with prefix."""
+        exact = self._postings.get(prefix)
+        start = bisect_left(self._vocabulary, prefix)
+        stop = bisect_left(self._vocabulary, prefix + "\U0010ffff", start)
+        if stop - start == (1 if exact is not None else 0):
+            return exact or set()  # only the word itself: no union needed
+        ids = set()
+        for word in self._vocabulary[start:stop]:
+            ids.update(self._postings[word])
+        return ids
+
+    def search(self, query, limit=None):
+        """Return ids of documents matching every word of query as a prefix.
+
+        Args:
+            query: Free-text search string
+            limit: Maximum number of ids to return (None for all)
+
+        Returns:
+            list: Matching document ids in ascending order
+        """
+        words = tokenize(query)
+        if not words:
+            return []
+        # Look up the longest (most selective) words first so the running
+        # intersection shrinks as early as possible
+        matches = None
+        for word in sorted(set(words), key=len, reverse=True):
+            ids = self._prefix_matches(word)
+            matches = ids if matches is None else matches & ids
+            if not matches:
+                return []
+        if limit is None:
+            return sorted(matches)
+        return heapq.nsmallest(limit, matches)
+
+
+def normalize_title(title):
+    """Case-fold a title and collapse its whitespace, for prefix matching.
+
+    Example:
+        >>> normalize_title("  Buy   Groceries ")
+        'buy groceries'
+    """
+    return " ".join((title or "").casefold().split())
+
+
+class TitlePrefixIndex:
+    """Sorted array of normalized titles answering "titles starting with ..." queries.
+
+    A lookup is one binary search plus a walk over at most the matching range,
+    stopping as soon as `limit` distinct titles are found, so it costs
+    O(log n + limit) regardless of how many tasks exist.
+
+    Example:
+        >>> index = TitlePrefixIndex()
+        >>> index.add(1, "Buy groceries")
+        >>> index.add(2, "Buy a gift")
+        >>> index.add(3, "buy groceries")
+        >>> index.suggest("BUY", limit=5)
+        ['Buy a gift', 'Buy groceries']
+    """
+
+    def __init__(self):
+        self._entries = []  # (normalized title, id), sorted
+        self._titles = {}   # id → title as written
+
+    def __len__(self):
+        return len(self._titles)
+
+    def add(self, doc_id, title):
+        """Index a title, replacing any earlier title for the same id."""
+        if doc_id in self._titles:
+            self.remove(doc_id)
+        self._titles[doc_id] = title
+        insort(self._entries, (normalize_title(title), doc_id))
+
+    def remove(self, doc_id):
+        """Drop an id's title from the index (no-op if it is not indexed)."""
+        title = self._titles.pop(doc_id, None)
+        if title is not None:
+            del self._entries[bisect_left(self._entries, (normalize_title(title), doc_id))]
+
+    def clear(self):
+        """Remove every title."""
+        self._entries.clear()
+        self._titles.clear()
+
+    def suggest(self, prefix, limit=10):
+        """Return up to limit distinct titles starting with prefix, alphabetically.
+
+        Titles that differ only in case or spacing are suggested once, as
+        written by the task with the lowest id.
+        """
+        key = normalize_title(prefix)
+        if not key:
+            return []
+        suggestions = []
+        previous = None
+        entries = self._entries
+        for position in range(bisect_left(entries, (key,)), len(entries)):
+            normalized, doc_id = entries[position]
+            if not normalized.startswith(key):
+                break
+            if normalized != previous:
+                if len(suggestions) == limit:
+                    break
+                suggestions.append(self._titles[doc_id])
+                previous = normalized
+        return suggestions
+
+
+class CreatedAtIndex:
+    """Task ids sorted by creation time, for range and "most recent" queries.
+
+    Timestamps are the ISO 8601 UTC strings TaskService stores in created_at,
+    which sort in time order as plain strings. Tasks without a timestamp are
+    not indexed. A range query is two binary searches plus a slice, so it costs
+    O(log n + k) for k results.
+
+    Example:
+        >>> index = CreatedAtIndex()
+        >>> index.add(1, "2025-01-01T09:00:00Z")
+        >>> index.add(2, "2025-01-02T09:00:00Z")
+        >>> index.add(3, "2025-01-03T09:00:00Z")
+        >>> index.between(created_after="2025-01-01T09:00:00Z")
+        [2, 3]
+        >>> index.between(limit=2, newest_first=True)
+        [3, 2]
+    """
+
+    def __init__(self):
+        self._entries = []     # (created_at, id), sorted
+        self._created_at = {}  # id → created_at
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, doc_id, created_at):
+        """Index an id under its creation time (ignored when created_at is empty)."""
+        if doc_id in self._created_at:
+            self.remove(doc_id)
+        if created_at:
+            self._created_at[doc_id] = created_at
+            insort(self._entries, (created_at, doc_id))
+
+    def remove(self, doc_id):
+        """Drop an id from the index (no-op if it is not indexed)."""
+        created_at = self._created_at.pop(doc_id, None)
+        if created_at is not None:
+            del self._entries[bisect_left(self._entries, (created_at, doc_id))]
+
+    def clear(self):
+        """Remove every entry."""
+        self._entries.clear()
+        self._created_at.clear()
+
+    def between(self, created_after=None, created_before=None, limit=None, newest_first=False):
+        """Return ids created strictly after/before the given timestamps.
+
+        Args:
+            created_after: Exclusive lower bound (None for no bound)
+            created_before: Exclusive upper bound (None for no bound)
+            limit: Maximum number of ids (None for all)
+            newest_first: Return the newest matches first instead of the oldest
+
+        Returns:
+            list: Matching ids in creation order (or reverse creation order)
+        """
+        entries = self._entries
+        start = 0 if created_after is None else bisect_left(entries, (created_after, math.inf))
+        stop = len(entries) if created_before is None else bisect_left(entries, (created_before,))
+        if stop <= start:
+            return []
+        if limit is not None:
+            if newest_first:
+                start = max(start, stop - limit)
+            else:
+                stop = min(stop, start + limit)
+        ids = [doc_id for _, doc_id in entries[start:stop]]
+        if newest_first:
+            ids.reverse()
+        return ids
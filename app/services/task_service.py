@@ -1,8 +1,20 @@
+import itertools
+import threading
+
+from app import tracing
+from app.services.group_commit import GroupCommitWriter, WriteBehindWriter
+from app.services.search_index import CreatedAtIndex, SearchIndex, TitlePrefixIndex
 from app.services.task_storage import load_tasks, save_tasks
 from app.models.task import Task
 from app.schemas import TaskCreate
 from app.exceptions import TaskValidationError
 
+# Version numbers handed out to tasks whenever they change. The counter is shared
+# by every TaskService in the process, so (task id, version) never repeats, even
+# when a task id is reused after a delete or a new service replaces an old one.
+_versions = itertools.count(1)
+
+
 # This class encapsulates all task operations (create, read, update, delete) with flexible storage support
 class TaskService:
     """Service layer for task management operations.
@@ -15,28 +27,166 @@ class TaskService:
 
     📋 NEXT LAB: Once everything works, we'll clean this up to use ONLY dependency injection
     for cleaner, more maintainable code. This hybrid approach is temporary for learning!
+
+    🔒 THREAD SAFETY (one writer, lock-free readers):
+    - Every change (add/complete/delete/clear) runs under one writer lock, so
+      two requests can never pick the same next id or interleave their saves.
+    - The task list is copy-on-write: a writer builds a new list and swaps
+      it in with one assignment. Published lists and the Task objects in them
+      are never modified afterwards (complete_task swaps in a completed copy),
+      so readers take no lock and always see one whole, consistent snapshot.
+    - The search/title/created_at indexes are updated in place, so lookups on
+      them take a separate, short-held index lock.
+    - Saves run outside the writer lock, through a writer chosen by the
+      `durability` level:
+        "sync"          every change is saved on its own before the call returns
+        "group"         (default) changes made while a save is running share the
+                        next save; each call still returns only once saved
+        "write_behind"  calls return at once; a background thread saves the
+                        newest state every write_behind_interval seconds
+      Call flush() (create_app does, at exit) so nothing pending is lost.
     """
 
-    def __init__(self, storage=None, time_service=None):
+    # UI status filter names → completed flag (None means no filter)
+    STATUS_FILTERS = {"all": None, "open": False, "completed": True}
+
+    DURABILITY_LEVELS = ("sync", "group", "write_behind")
+
+    def __init__(self, storage=None, time_service=None, lazy_load=False,
+                 commit_window=0.0, max_commit_batch=64,
+                 durability="group", write_behind_interval=1.0):
+        """
+        Args:
+            storage: Optional storage adapter with load_tasks()/save_tasks()
+            time_service: Optional TimeService used to timestamp new tasks
+            lazy_load: If True, defer reading tasks from storage until the
+                first operation that needs them (faster app startup)
+            commit_window: Seconds a save waits for more concurrent changes
+                to join it (0 = only changes made during the previous save)
+            max_commit_batch: Most changes saved together in one batch
+            durability: "sync", "group" or "write_behind" (see class docstring)
+            write_behind_interval: Seconds between background saves in
+                write_behind mode
+
+        Raises:
+            ValueError: If durability is not one of DURABILITY_LEVELS
+        """
+        if durability not in self.DURABILITY_LEVELS:
+            raise ValueError(f"Unknown durability level: {durability!r}")
         self.storage = storage
         self.time_service = time_service
-        # Load tasks from storage and convert to Task objects
-        self._tasks = []
+        # In-memory list of Task objects; None means "not loaded yet"
+        self._task_list = None
+        # Word, title-prefix and created_at indexes over the in-memory tasks;
+        # None until the first query that needs them
+        self._search_index = None
+        self._title_index = None
+        self._created_index = None
+        self._tasks_by_id = {}
+        # (task list snapshot, its encoded JSON); valid while that snapshot is current
+        self._json_cache = (None, None)
+        # Serializes writers (and the first lazy load); readers never take it
+        self._write_lock = threading.RLock()
+        # Guards the in-place updates of the indexes above
+        self._index_lock = threading.Lock()
+        # {task id: version} as last saved to storage; None while unknown
+        self._saved_versions = None
+        # Saves task list snapshots (converted to dicts once per save)
+        self.durability = durability
+        def save(tasks):
+            self._save_snapshot(tasks)
+
+        if durability == "write_behind":
+            self._writer = WriteBehindWriter(save, interval=write_behind_interval)
+        else:
+            self._writer = GroupCommitWriter(
+                save,
+                window=commit_window if durability == "group" else 0.0,
+                max_batch=max_commit_batch if durability == "group" else 1,
+            )
 
         # Only load from external storage if an injected storage adapter is provided.
         # When storage is None we start with an empty in-memory list (avoids reading
         # a shared file that causes cross-test pollution).
-        if self.storage:
-            for t in self._load_tasks():
-                self._tasks.append(
-                    Task(
-                        t["id"],
-                        t["title"],
-                        t.get("description", ""),
-                        t.get("completed", False),
-                        t.get("created_at", None),
-                    )
-                )
+        if not self.storage:
+            self._task_list = []
+        elif not lazy_load:
+            self._task_list = self._load_task_objects()
+
+    @property
+    def _tasks(self):
+        """Current snapshot of the Task objects, loaded from storage on first access.
+
+        Treat the returned list as read-only: writers publish a new list
+        instead of changing this one.
+        """
+        tasks = self._task_list
+        if tasks is None:
+            with self._write_lock:
+                if self._task_list is None:
+                    self._task_list = self._load_task_objects()
+                tasks = self._task_list
+        return tasks
+
+    @_tasks.setter
+    def _tasks(self, tasks):
+        with self._index_lock:
+            self._task_list = tasks
+            self._search_index = None
+
+    @staticmethod
+    def _search_text(task):
+        return f"{task.title} {task.description or ''}"
+
+    def _build_indexes(self, tasks):
+        """Build the search, title and created_at indexes over the in-memory tasks, if needed.
+
+        After that they are kept up to date by add_task/complete_task/
+        delete_task/clear_tasks, one task at a time.
+
+        Call with _index_lock held, passing a snapshot read from self._tasks
+        *before* taking it: reading self._tasks may lazily load under
+        _write_lock, and writers take _write_lock first, then _index_lock.
+        """
+        if self._search_index is None:
+            # Once loaded, the list is only replaced under _index_lock, so this
+            # is the newest one even if a writer published after `tasks` was read
+            if self._task_list is not None:
+                tasks = self._task_list
+            search_index, title_index = SearchIndex(), TitlePrefixIndex()
+            created_index = CreatedAtIndex()
+            tasks_by_id = {}
+            for task in tasks:
+                search_index.add(task.id, self._search_text(task))
+                title_index.add(task.id, task.title)
+                created_index.add(task.id, task.created_at)
+                tasks_by_id[task.id] = task
+            self._search_index, self._title_index = search_index, title_index
+            self._created_index = created_index
+            self._tasks_by_id = tasks_by_id
+
+    def _load_task_objects(self):
+        """Load tasks from storage and convert them to Task objects."""
+        tasks = [
+            Task(
+                t["id"],
+                t["title"],
+                t.get("description", ""),
+                t.get("completed", False),
+                t.get("created_at", None),
+            )
+            for t in self._load_tasks()
+        ]
+        for task in tasks:
+            self._touch(task)
+        # Storage now holds exactly these versions
+        self._saved_versions = {task.id: task.version for task in tasks}
+        return tasks
+
+    @staticmethod
+    def _touch(task):
+        """Give a task a new version number after it has changed."""
+        task.version = next(_versions)
 
     def _load_tasks(self):
         """Load tasks using either injected storage or direct functions.
@@ -46,19 +196,249 @@ class TaskService:
             return self.storage.load_tasks()  # Dependency injection path
         return load_tasks()  # Direct function path (for unit tests)
 
+    def _save_snapshot(self, tasks):
+        """Save one task list snapshot (called by the writer, one save at a time).
+
+        When storage can apply changes (DatabaseTaskRepository.save_changes)
+        and the versions it holds are known, only tasks whose version differs
+        from the last save are converted and written, and missing ids are
+        deleted. Otherwise the whole list is saved.
+        """
+        versions = {task.id: task.version for task in tasks}
+        previous = self._saved_versions
+        if previous is not None and hasattr(self.storage, "save_changes"):
+            changed = [task.to_dict() for task in tasks if previous.get(task.id) != task.version]
+            removed = [task_id for task_id in previous if task_id not in versions]
+            with tracing.span("TaskService._save_tasks", tasks=len(tasks), changed=len(changed)):
+                self.storage.save_changes(changed, removed)
+        else:
+            self._save_tasks([task.to_dict() for task in tasks])
+        # Only after a successful save: a failed one is retried against the old versions
+        self._saved_versions = versions
+
     def _save_tasks(self, tasks):
         """Save tasks using either injected storage or direct functions.
         Accepts a list of dicts.
         """
-        if self.storage:
-            self.storage.save_tasks(tasks)  # Dependency injection path
-        else:
-            save_tasks(tasks)  # Direct function path (for unit tests)
+        with tracing.span("TaskService._save_tasks", tasks=len(tasks)):
+            if self.storage:
+                self.storage.save_tasks(tasks)  # Dependency injection path
+            else:
+                save_tasks(tasks)  # Direct function path (for unit tests)
 
     def get_all_tasks(self):
         """Get all tasks from storage (as dicts)."""
         return [t.to_dict() for t in self._tasks]
 
+    def loaded_task_count(self):
+        """Number of tasks held in memory (0 while a lazy list is not loaded yet)."""
+        tasks = self._task_list
+        return 0 if tasks is None else len(tasks)
+
+    def get_all_tasks_json(self):
+        """Return all tasks as an encoded JSON array, the same bytes jsonify() gives.
+
+        The body is cached for the current task list snapshot; every change
+        publishes a new snapshot, which invalidates it, so polling an
+        unchanged list costs no encoding at all. A new body is joined from
+        each task's cached Task.to_json() fragment, so after a change only
+        the changed task is encoded again.
+        """
+        tasks = self._tasks
+        snapshot, body = self._json_cache
+        if snapshot is not tasks:
+            body = b"[" + b",".join([t.to_json() for t in tasks]) + b"]\n"
+            self._json_cache = (tasks, body)
+        return body
+
+    def iter_tasks_ndjson(self):
+        """Yield every task as one line of newline-delimited JSON (bytes).
+
+        Lines are the tasks' cached JSON fragments, taken from one snapshot.
+        """
+        for task in self._tasks:
+            yield task.to_json() + b"\n"
+
+    def iter_versioned_tasks(self):
+        """Yield (task dict, version) pairs one task at a time.
+
+        Dicts are built lazily as the caller iterates, so streaming a large
+        list never holds a full copy of it. The iteration runs over one
+        snapshot, so concurrent adds/deletes do not affect it.
+        """
+        for task in self._tasks:
+            yield task.to_dict(), task.version
+
+    def get_tasks_page(self, page=1, per_page=20, status="all"):
+        """Return one page of tasks plus the number of tasks matching the filter.
+
+        When the storage supports it (DatabaseTaskRepository.query_tasks) and
+        holds every change made so far, the filter and LIMIT/OFFSET are pushed
+        down to a repository query, so a page costs O(page), not a scan of
+        every task. Rows come back as the in-memory tasks they stand for, with
+        their versions; while the list is not loaded (lazy_load) the rows are
+        returned as read, with no version (None). While a save is pending the
+        page is filtered and sliced in memory instead.
+
+        Args:
+            page: 1-based page number
+            per_page: Maximum number of tasks on the page
+            status: "all", "open" or "completed"
+
+        Returns:
+            tuple: (list of (task dict, version) pairs, total matching tasks)
+
+        Raises:
+            ValueError: If status is not one of STATUS_FILTERS
+        """
+        if status not in self.STATUS_FILTERS:
+            raise ValueError(f"Unknown status filter: {status!r}")
+        completed = self.STATUS_FILTERS[status]
+        offset = (max(page, 1) - 1) * per_page
+
+        if self._storage_is_current("query_tasks"):
+            rows = self.storage.query_tasks(completed=completed, offset=offset, limit=per_page)
+            return self._with_versions(rows), self.storage.count_tasks(completed=completed)
+
+        tasks = self._tasks
+        if completed is not None:
+            tasks = [t for t in tasks if bool(t.completed) == completed]
+        return [(t.to_dict(), t.version) for t in tasks[offset:offset + per_page]], len(tasks)
+
+    def _storage_is_current(self, method):
+        """True if storage has `method` and every change made so far is saved.
+
+        Queries pushed down to storage then see the same tasks as memory;
+        while a save is pending (write_behind, or a batch being committed)
+        they would miss the newest changes.
+        """
+        return hasattr(self.storage, method) and not self._writer.pending
+
+    def _with_versions(self, rows):
+        """Pair task dicts read from storage with their in-memory versions.
+
+        Once the task list is loaded, each row is replaced by the in-memory
+        task with the same id (and its version), so rendered rows can come
+        from the fragment cache. Rows with no in-memory task get version None.
+        """
+        tasks = self._task_list
+        if tasks is None:
+            return [(row, None) for row in rows]
+        with self._index_lock:
+            self._build_indexes(tasks)
+            found = [self._tasks_by_id.get(row["id"]) for row in rows]
+        return [
+            (row, None) if task is None else (task.to_dict(), task.version)
+            for row, task in zip(rows, found)
+        ]
+
+    def search_tasks(self, query, limit=20):
+        """Find tasks whose title or description contain every word of query.
+
+        Words match as prefixes ("gro" finds "groceries"). When the storage
+        has a full-text index (DatabaseTaskRepository on SQLite FTS5), results
+        come from it, ranked by relevance over every match; otherwise they
+        come from an in-memory inverted index (see
+        app/services/search_index.py) and are returned in id order.
+
+        While a save is pending (e.g. with "write_behind" durability) the
+        full-text index lags behind the tasks in memory, so the in-memory
+        index answers instead, without waiting for that save.
+
+        Args:
+            query: Free-text search string
+            limit: Maximum number of results
+
+        Returns:
+            list: Matching task dictionaries
+        """
+        if self._storage_is_current("search_tasks"):
+            results = self.storage.search_tasks(query, limit)
+            if results is not None:
+                return results
+
+        tasks = self._tasks  # load (if lazy) before taking _index_lock
+        with self._index_lock:
+            self._build_indexes(tasks)
+            ids = self._search_index.search(query, limit)
+            tasks = [self._tasks_by_id[task_id] for task_id in ids]
+        return [task.to_dict() for task in tasks]
+
+    def suggest_titles(self, prefix, limit=10):
+        """Return existing task titles that start with prefix, for autocomplete.
+
+        Matching ignores case and extra spaces; each distinct title appears
+        once. Served from an in-memory sorted index (never from storage), so
+        it is cheap enough to call on every keystroke.
+
+        Args:
+            prefix: Text typed so far
+            limit: Maximum number of titles
+
+        Returns:
+            list: Titles in alphabetical order
+        """
+        tasks = self._tasks  # load (if lazy) before taking _index_lock
+        with self._index_lock:
+            self._build_indexes(tasks)
+            return self._title_index.suggest(prefix, limit)
+
+    def get_tasks_by_created(self, created_after=None, created_before=None,
+                             limit=None, newest_first=False):
+        """Return tasks created within a time range, in creation order.
+
+        Bounds are exclusive ISO 8601 UTC timestamps, compared the way
+        created_at is stored (as strings). Tasks without a created_at are
+        never returned. When the storage supports it and holds every change
+        made so far, the query runs in the database on the
+        ix_tasks_created_at index; while a save is pending (or without such
+        storage) it uses the in-memory CreatedAtIndex. Either way it costs
+        O(log n + k), not a scan and sort.
+
+        Args:
+            created_after: Only tasks created after this timestamp
+            created_before: Only tasks created before this timestamp
+            limit: Maximum number of tasks (None for all)
+            newest_first: Newest tasks first instead of oldest first
+
+        Returns:
+            list: Task dictionaries
+        """
+        if self._storage_is_current("query_tasks_by_created"):
+            return self.storage.query_tasks_by_created(
+                created_after=created_after, created_before=created_before,
+                limit=limit, newest_first=newest_first,
+            )
+        tasks = self._tasks  # load (if lazy) before taking _index_lock
+        with self._index_lock:
+            self._build_indexes(tasks)
+            ids = self._created_index.between(created_after, created_before, limit, newest_first)
+            tasks = [self._tasks_by_id[task_id] for task_id in ids]
+        return [task.to_dict() for task in tasks]
+
+    def get_recent_tasks(self, limit=10):
+        """Return the `limit` most recently created tasks, newest first."""
+        return self.get_tasks_by_created(limit=limit, newest_first=True)
+
+    def get_task_version(self, task_id):
+        """Return the current version of one task, or None if it does not exist.
+
+        Looked up by id in the index kept beside the task list, not by a scan.
+        """
+        tasks = self._tasks  # load (if lazy) before taking _index_lock
+        with self._index_lock:
+            self._build_indexes(tasks)
+            task = self._tasks_by_id.get(task_id)
+        return None if task is None else task.version
+
+    def get_task_versions(self):
+        """Return {task id: version} for all tasks.
+
+        A task's version changes every time the task does, so the pair
+        (id, version) identifies one exact state of one task.
+        """
+        return {t.id: t.version for t in self._tasks}
+
     def add_task(self, title, description=None):
         """Add a new task with centralized validation.
         
@@ -75,38 +455,79 @@ class TaskService:
         Raises:
             TaskValidationError: If validation fails (title empty, too long, etc.)
         """
-        # ✅ Validate using centralized schema
-        try:
-            # Create validated task data using schema
-            # This handles: trimming, type checking, length validation, required fields
-            validated_data = TaskCreate(title=title, description=description or "")
-        except TaskValidationError as e:
-            # Re-raise our custom validation error with full context
-            raise e
-        
-        # Find the next available ID
-        next_id = 1
-        if self._tasks:
-            next_id = max(task.id for task in self._tasks) + 1
-
-        # Get current UTC time from TimeService
-        created_at = None
-        if self.time_service:
-            time_response = self.time_service.get_current_time("UTC")
-            created_at = time_response.get("utc_datetime")
-
-        # Create new Task object with validated data and timestamp
-        new_task_obj = Task(
-            next_id, validated_data.title, validated_data.description, False, created_at
-        )
-        self._tasks.append(new_task_obj)
-
-        # Save all tasks as dicts
-        self._save_tasks([t.to_dict() for t in self._tasks])
+        with tracing.span("TaskService.add_task"):
+            # ✅ Validate using centralized schema
+            try:
+                # Create validated task data using schema
+                # This handles: trimming, type checking, length validation, required fields
+                with tracing.span("TaskCreate validation"):
+                    validated_data = TaskCreate(title=title, description=description or "")
+            except TaskValidationError as e:
+                # Re-raise our custom validation error with full context
+                raise e
+
+            # Get current UTC time from TimeService (outside the lock: may be a network call)
+            created_at = None
+            if self.time_service:
+                time_response = self.time_service.get_current_time("UTC")
+                created_at = time_response.get("utc_datetime")
+
+            with self._write_lock:
+                tasks = self._tasks
+                # Find the next available ID
+                next_id = 1
+                if tasks:
+                    next_id = max(task.id for task in tasks) + 1
+
+                # Create new Task object with validated data and timestamp
+                new_task_obj = Task(
+                    next_id, validated_data.title, validated_data.description, False, created_at
+                )
+                self._touch(new_task_obj)
+                saved = self._publish(tasks + [new_task_obj], added=new_task_obj)
+            self._wait_saved(saved)
 
         # Return as dict for backward compatibility
         return new_task_obj.to_dict()
-    
+
+    def _publish(self, tasks, added=None, removed_id=None):
+        """Make a new task list the snapshot readers see and queue it for saving.
+
+        Call with _write_lock held, then pass the returned ticket to
+        self._wait_saved() after releasing the lock. `added`/`removed_id`
+        describe the change so the indexes can be updated one task at a time
+        (a replaced task is both: removed_id is its id and added is the new
+        object).
+        """
+        with self._index_lock:
+            self._task_list = tasks
+            if self._search_index is not None:
+                if removed_id is not None:
+                    self._search_index.remove(removed_id)
+                    self._title_index.remove(removed_id)
+                    self._created_index.remove(removed_id)
+                    self._tasks_by_id.pop(removed_id, None)
+                if added is not None:
+                    self._search_index.add(added.id, self._search_text(added))
+                    self._title_index.add(added.id, added.title)
+                    self._created_index.add(added.id, added.created_at)
+                    self._tasks_by_id[added.id] = added
+        # Save all tasks as dicts (converted by the writer, once per batch)
+        return self._writer.submit(tasks)
+
+    def _wait_saved(self, saved):
+        """Wait, outside _write_lock, until the snapshot _publish queued is saved."""
+        with tracing.span("TaskService wait for save", durability=self.durability):
+            self._writer.wait(saved)
+
+    def flush(self):
+        """Block until every change made so far has been saved to storage."""
+        self._writer.flush()
+
+    def close(self):
+        """Flush pending changes and stop the background writer, if any."""
+        self._writer.close()
+
     def get_tasks(self):
         """Return a list of all tasks (alias for get_all_tasks).
 
@@ -129,13 +550,25 @@ class TaskService:
         # IMPORTANT: self._tasks is our in-memory (RAM) list of Task objects.
         # We operate on this list directly for speed and efficiency, instead of reloading from disk (storage) every time.
         # This is how real-world service layers work: keep data in memory, only save to storage when changes are made.
-        for task in self._tasks:
-            if task.id == task_id:
-                task.completed = True
-                # Persist the updated list to storage
-                self._save_tasks([t.to_dict() for t in self._tasks])
-                return task.to_dict()  # Return as dict for backward compatibility
-        return None     
+        with self._write_lock:
+            tasks = self._tasks
+            for i, task in enumerate(tasks):
+                if task.id == task_id:
+                    if task.completed:
+                        saved = self._publish(tasks)
+                    else:
+                        # Readers may hold the old object: publish a completed copy instead
+                        task = Task(task.id, task.title, task.description, task.completed, task.created_at)
+                        task.mark_complete()
+                        self._touch(task)
+                        # Persist the updated list to storage
+                        saved = self._publish(tasks[:i] + [task] + tasks[i + 1:], added=task, removed_id=task_id)
+                    break
+            else:
+                return None
+        self._wait_saved(saved)
+        return task.to_dict()  # Return as dict for backward compatibility
+
     def delete_task(self, task_id):
         """Delete a task from the system.
         
@@ -146,15 +579,21 @@ class TaskService:
         Test Coverage: TC-RF005-004 (Delete Task)
         """
         # Real-world: operate on self._tasks (in-memory Task objects), not by reloading from storage.
-        for i, task in enumerate(self._tasks):
-            if task.id == task_id:
-                deleted_task = self._tasks.pop(i)
-                # Persist the updated list to storage
-                self._save_tasks([t.to_dict() for t in self._tasks])
-                return deleted_task.to_dict()  # Return as dict for backward compatibility
-        return None    
+        with self._write_lock:
+            tasks = self._tasks
+            for i, task in enumerate(tasks):
+                if task.id == task_id:
+                    # Persist the updated list to storage
+                    saved = self._publish(tasks[:i] + tasks[i + 1:], removed_id=task_id)
+                    break
+            else:
+                return None
+        self._wait_saved(saved)
+        return task.to_dict()  # Return as dict for backward compatibility
 
     def clear_tasks(self):
         """Clear all tasks."""
-        self._tasks = []
-        self._save_tasks([])
\ No newline at end of file
+        with self._write_lock:
+            self._tasks = []
+            saved = self._writer.submit([])
+        self._wait_saved(saved)
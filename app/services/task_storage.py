@@ -1,7 +1,10 @@
 import os
 import json
+import logging
 import tempfile
 
+logger = logging.getLogger(__name__)
+
 # Use a temporary tasks file during testing to avoid using a checked-in
 # app/data/tasks.json which can contain example data and cause tests to
 # observe pre-existing tasks. When TESTING env var is truthy, write the
@@ -27,7 +30,7 @@ def save_tasks(tasks):
         with open(TASKS_FILE, "w") as file:
             json.dump(tasks, file, indent=2)
     except IOError as e:
-        print(f"[Warning] Error saving tasks: {e}")
+        logger.warning("error saving tasks", extra={"path": TASKS_FILE, "error": str(e)})
 
 class TaskStorage:
     """Storage interface for task persistence.
@@ -1,6 +1,33 @@
-import requests
+import logging
+import threading
+import time
 from datetime import datetime
 
+from app import tracing
+
+logger = logging.getLogger(__name__)
+
+
+def _requests():
+  """The `requests` module, imported on first use (it costs ~90ms to import).
+
+  The import binds the module-level name `requests`, so the API call and
+  mock.patch("app.services.time_service.requests", ...) use the same object.
+  """
+  global requests
+  if "requests" not in globals():
+    import requests
+  return requests
+
+
+def __getattr__(name):
+  # Keeps `app.services.time_service.requests` resolvable (e.g. for
+  # mock.patch) before the first API call has imported it
+  if name == "requests":
+    return _requests()
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class TimeService:
   # Mapping of friendly timezone names to IANA timezone identifiers
   TIMEZONE_MAP = {
@@ -13,11 +40,55 @@ class TimeService:
       "Beijing": "Asia/Shanghai"
   }
 
+  # During an upstream outage every call fails (each page render asks for the
+  # time): warn at most once per interval, with the failures since the last warning
+  FALLBACK_WARNING_INTERVAL = 60.0
+
+  def __init__(self, metrics=None):
+      self._fallback_lock = threading.Lock()
+      self._last_fallback_warning = None
+      self._fallbacks_since_warning = 0
+      # Optional MetricsRegistry (app/metrics.py) for upstream latency and fallbacks
+      self.upstream_seconds = None
+      self.fallbacks_total = None
+      if metrics is not None:
+          self.upstream_seconds = metrics.histogram(
+              "time_service_upstream_seconds", "Latency of timeapi.io calls.", ["outcome"]
+          )
+          self.fallbacks_total = metrics.counter(
+              "time_service_fallbacks_total", "Times the system clock was used instead of timeapi.io."
+          )
+
   def get_current_time(self, timezone="UTC"):
+      with tracing.span("TimeService.get_current_time", timezone=timezone) as span:
+          result = self._get_current_time(timezone)
+          if span is not None:
+              span.set_attribute("source", result.get("source", "error"))
+          return result
+
+  def _log_fallback(self, iana_timezone, error):
+      """Warn about a failed API call, rate-limited; the rest go to (sampled) DEBUG."""
+      fields = {"timezone": iana_timezone, "error": f"{type(error).__name__}: {error}"}
+      now = time.monotonic()
+      with self._fallback_lock:
+          self._fallbacks_since_warning += 1
+          last = self._last_fallback_warning
+          if last is None or now - last >= self.FALLBACK_WARNING_INTERVAL:
+              level = logging.WARNING
+              fields["failures"] = self._fallbacks_since_warning
+              self._last_fallback_warning, self._fallbacks_since_warning = now, 0
+          else:
+              level = logging.DEBUG
+      logger.log(level, "time api request failed, using system time", extra=fields)
+
+  def _get_current_time(self, timezone):
       # Convert friendly name to IANA timezone
       iana_timezone = self.TIMEZONE_MAP.get(timezone, "UTC")
+      started = time.perf_counter()
       
       try:
+          requests = _requests()
+
           # Try external API first with proper headers
           headers = {
               'User-Agent': 'TaskTracker/1.0 (Python-requests)',
@@ -25,15 +96,18 @@ class TimeService:
           }
           # Try timeapi.io with the selected timezone
           url = f"https://timeapi.io/api/Time/current/zone?timeZone={iana_timezone}"
-          print(f"DEBUG: Requesting URL: {url}")
+          logger.debug("time api request", extra={"url": url})
           
           response = requests.get(
               url, 
               timeout=3,
               headers=headers
           )
-          print(f"DEBUG: Response status: {response.status_code}")
-          print(f"DEBUG: Response body: {response.text[:200]}")
+          if logger.isEnabledFor(logging.DEBUG):  # skip decoding the body otherwise
+              logger.debug(
+                  "time api response",
+                  extra={"status": response.status_code, "body": response.text[:200]},
+              )
           
           response.raise_for_status()
           data = response.json()
@@ -42,6 +116,8 @@ class TimeService:
           # Ensure the datetime has a Z suffix for UTC
           if datetime_str and not datetime_str.endswith('Z'):
               datetime_str = datetime_str + 'Z'
+          if self.upstream_seconds is not None:
+              self.upstream_seconds.observe(time.perf_counter() - started, "success")
           
           return {
               "datetime": datetime_str,
@@ -50,8 +126,10 @@ class TimeService:
               "source": "TimeAPI.io (External)"
           }
       except Exception as e:
-          # Log the error for debugging
-          print(f"DEBUG: API request failed with error: {type(e).__name__}: {str(e)}")
+          self._log_fallback(iana_timezone, e)
+          if self.upstream_seconds is not None:
+              self.upstream_seconds.observe(time.perf_counter() - started, "error")
+              self.fallbacks_total.inc()
           
           # Fallback to local system time
           try:
@@ -0,0 +1,173 @@
+"""
+app/sql_instrumentation.py - SQL Query Counting, Timing and Slow-Query Log
+
+Hooks SQLAlchemy's `before_cursor_execute` / `after_cursor_execute` events on
+the engine create_app builds, so every statement, whichever code path issues
+it, is:
+
+- counted and timed into app.metrics (`db_queries_total`,
+  `db_query_duration_seconds{operation}`);
+- counted against the current request (`http_request_db_queries{endpoint}`);
+- logged on the "app.sql" logger when it takes longer than the slow-query
+  threshold, with the SQL text but never the parameter values (only their
+  types), since those can contain user data.
+
+Debug mode additionally runs `EXPLAIN QUERY PLAN` once per distinct SELECT
+(SQLite only), keeps the plans in `plans`, logs full table scans and counts
+them in `db_full_scans_total{table}`, and adds an `X-DB-Queries` header to
+every response.
+
+A statement counts toward the request whose thread runs it. Under group
+commit the batch leader runs the save for every request in its batch, so
+those statements count toward the leader's request only; the other requests'
+counts exclude the batched save. Write-behind saves run on a background
+thread and count toward no request.
+
+Environment variables (read by create_app):
+    SQL_SLOW_QUERY_MS  Slow-query threshold in milliseconds (default: 100)
+    SQL_DEBUG          Set to "true" for query plans and the response header
+"""
+
+import logging
+import re
+import time
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+logger = logging.getLogger("app.sql")
+
+# Buckets for "statements per request"
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 500)
+
+# A plan step that reads a whole table: "SCAN tasks", but not
+# "SCAN tasks USING [COVERING] INDEX ..." or an FTS5 "VIRTUAL TABLE" scan
+_FULL_SCAN_RE = re.compile(r"^SCAN (?:TABLE )?(\w+)(?!.*\b(?:USING (?:COVERING )?INDEX|VIRTUAL TABLE)\b)")
+
+
+def redact_parameters(parameters):
+    """Describe statement parameters by type only, never by value.
+
+    Example:
+        >>> redact_parameters(("secret title", 3, None))
+        '(<str>, <int>, <NoneType>)'
+    """
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: <{type(value).__name__}>" for key, value in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(f"<{type(value).__name__}>" for value in parameters) + ")"
+    return f"<{type(parameters).__name__}>"
+
+
+def _operation(statement):
+    """First SQL keyword of a statement (SELECT, INSERT, ...)."""
+    word = statement.lstrip().split(None, 1)[:1]
+    return word[0].upper() if word else "UNKNOWN"
+
+
+class QueryInstrumentation:
+    """Engine event hooks that count, time and optionally explain SQL statements."""
+
+    def __init__(self, registry, slow_threshold=0.1, explain=False):
+        """
+        Args:
+            registry: MetricsRegistry (app/metrics.py) to record into
+            slow_threshold: Seconds after which a statement is logged as slow
+            explain: Capture EXPLAIN QUERY PLAN for each distinct SELECT
+        """
+        self.slow_threshold = slow_threshold
+        self.explain = explain
+        self.plans = {}  # statement → list of plan detail strings
+        self.queries_total = registry.counter("db_queries_total", "SQL statements executed.")
+        self.duration = registry.histogram(
+            "db_query_duration_seconds", "Time to execute one SQL statement.", ["operation"]
+        )
+        self.per_request = registry.histogram(
+            "http_request_db_queries", "SQL statements executed per request.",
+            ["endpoint"], buckets=QUERY_COUNT_BUCKETS,
+        )
+        self.full_scans = registry.counter(
+            "db_full_scans_total", "Statements whose query plan scans a whole table.", ["table"]
+        )
+
+    def attach(self, engine):
+        """Listen to every statement executed through engine."""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    def install_request_counting(self, app):
+        """Record the number of statements each request of app executed.
+
+        Only statements run on the request's own thread count, so batched
+        group-commit saves count toward the batch leader's request.
+        """
+
+        @app.before_request
+        def _reset_query_count():
+            g.db_queries = 0
+
+        @app.after_request
+        def _record_query_count(response):
+            count = g.pop("db_queries", None)
+            if count is not None:
+                self.per_request.observe(count, request.endpoint or "unmatched")
+                if self.explain:
+                    response.headers["X-DB-Queries"] = str(count)
+            return response
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    def _handle_error(self, exception_context):
+        # A failed statement never reaches after_cursor_execute: drop its start time
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_started"):
+            conn.info["query_started"].pop()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        operation = _operation(statement)
+        self.queries_total.inc()
+        self.duration.observe(elapsed, operation)
+        if has_request_context() and "db_queries" in g:
+            g.db_queries += 1
+
+        if elapsed >= self.slow_threshold:
+            logger.warning(
+                "slow query",
+                extra={
+                    "duration_ms": round(elapsed * 1000, 1),
+                    "statement": " ".join(statement.split()),
+                    "params": "[...]" if executemany else redact_parameters(parameters),
+                    "executemany": executemany,
+                },
+            )
+
+        if (self.explain and operation == "SELECT" and not executemany
+                and conn.dialect.name == "sqlite" and statement not in self.plans):
+            self._explain(cursor, statement, parameters)
+
+    def _explain(self, cursor, statement, parameters):
+        """Store the statement's query plan and report full table scans."""
+        # A separate DBAPI cursor: it does not fire engine events and leaves
+        # the original cursor's pending rows alone
+        plan_cursor = cursor.connection.cursor()
+        try:
+            plan_cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            details = [row[-1] for row in plan_cursor.fetchall()]
+        except Exception as e:  # e.g. a statement EXPLAIN cannot wrap
+            details = [f"(no plan: {type(e).__name__})"]
+        finally:
+            plan_cursor.close()
+        self.plans[statement] = details
+        # Subqueries SQLite materializes ("MATERIALIZE hits") are small temp tables, not real ones
+        temporary = {detail.split()[1] for detail in details if detail.startswith(("MATERIALIZE ", "CO-ROUTINE "))}
+        for detail in details:
+            match = _FULL_SCAN_RE.match(detail)
+            if match and match.group(1) not in temporary:
+                self.full_scans.inc(match.group(1))
+                logger.warning(
+                    "full table scan",
+                    extra={"table": match.group(1), "statement": " ".join(statement.split())},
+                )
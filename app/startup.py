@@ -0,0 +1,55 @@
+"""
+app/startup.py - Startup Phase Timing
+
+Records how long each phase of `create_app()` takes so cold-start regressions
+(slow imports, database setup, loading every task) are easy to spot.
+
+Usage:
+    flask --app app startup-report
+"""
+
+import time
+from contextlib import contextmanager
+
+
+class StartupTimer:
+    """Collects (phase name, seconds) pairs in the order they ran.
+
+    Example:
+        >>> timer = StartupTimer()
+        >>> with timer.phase("database"):
+        ...     pass
+        >>> [name for name, _ in timer.phases]
+        ['database']
+    """
+
+    def __init__(self):
+        self.phases = []
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record a phase that was timed elsewhere (e.g. module import)."""
+        self.phases.append((name, seconds))
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the body of a `with` block as one startup phase."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    @property
+    def total(self) -> float:
+        """Total seconds across all recorded phases."""
+        return sum(seconds for _, seconds in self.phases)
+
+    def report(self) -> str:
+        """Format the phases as an aligned text table with a total line."""
+        width = max([len(name) for name, _ in self.phases] + [len("total")])
+        lines = [
+            f"{name:<{width}}  {seconds * 1000:9.2f} ms"
+            for name, seconds in self.phases
+        ]
+        lines.append(f"{'total':<{width}}  {self.total * 1000:9.2f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,45 @@
+// static/scripts/add_task.js
+// Title autocomplete for the add-task form: suggest titles of existing tasks
+// (from /api/tasks/suggest) so duplicates are easy to spot. Without
+// JavaScript the form is a plain text input.
+
+const titleInput = document.getElementById("task-title");
+const suggestionList = document.getElementById("title-suggestions");
+
+if (titleInput && suggestionList) {
+  let timer = null;
+  let controller = null;
+
+  const showSuggestions = (titles) => {
+    suggestionList.replaceChildren(
+      ...titles.map((title) => {
+        const option = document.createElement("option");
+        option.value = title;
+        return option;
+      })
+    );
+  };
+
+  titleInput.addEventListener("input", () => {
+    clearTimeout(timer);
+    const prefix = titleInput.value.trim();
+    if (!prefix) {
+      showSuggestions([]);
+      return;
+    }
+    // Wait for a short pause in typing, and drop any request still in flight
+    timer = setTimeout(async () => {
+      controller?.abort();
+      controller = new AbortController();
+      const url = `${titleInput.dataset.suggestUrl}?prefix=${encodeURIComponent(prefix)}`;
+      try {
+        const response = await fetch(url, { signal: controller.signal });
+        if (response.ok) {
+          showSuggestions(await response.json());
+        }
+      } catch (error) {
+        // Aborted or offline: keep the current suggestions
+      }
+    }, 150);
+  });
+}
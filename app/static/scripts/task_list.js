@@ -0,0 +1,71 @@
+// static/scripts/task_list.js
+// Progressive enhancements for the /tasks page. Without JavaScript the page
+// still works through plain form posts, redirects and the pager.
+
+// In-place Complete/Delete: post the row's form with "X-Fragment: row" and
+// replace the row with the returned fragment (empty for a delete) instead of
+// reloading the whole list. Falls back to a normal form submit on any error.
+document.addEventListener("submit", async (event) => {
+  const form = event.target;
+  const row = form.closest(".task-list .task-item");
+  if (!row || form.dataset.submitting) {
+    return;
+  }
+  event.preventDefault();
+  form.dataset.submitting = "true";
+  try {
+    const response = await fetch(form.action, { method: "POST", headers: { "X-Fragment": "row" } });
+    if (!response.ok) {
+      throw new Error(`HTTP ${response.status}`);
+    }
+    row.outerHTML = await response.text();
+  } catch (error) {
+    form.submit();
+  }
+});
+
+// Infinite scroll for /tasks?mode=scroll.
+// When the #load-more sentinel nears the viewport, fetch the next page of rows
+// from /tasks/rows (an HTML fragment, one page at a time) and append it to the
+// list. The server-rendered pager stays as the fallback if anything fails.
+(function () {
+  const sentinel = document.getElementById("load-more");
+  const list = document.querySelector(".task-list");
+  const pager = document.querySelector(".pagination");
+  if (!sentinel || !list || !("IntersectionObserver" in window)) {
+    return;
+  }
+  if (pager) {
+    pager.hidden = true;
+  }
+
+  let loading = false;
+  const observer = new IntersectionObserver(async (entries) => {
+    if (!entries[0].isIntersecting || loading) {
+      return;
+    }
+    loading = true;
+    try {
+      const response = await fetch(sentinel.dataset.nextUrl, { headers: { Accept: "text/html" } });
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status}`);
+      }
+      list.insertAdjacentHTML("beforeend", await response.text());
+      const next = response.headers.get("X-Next-Page");
+      if (next) {
+        sentinel.dataset.nextUrl = next;
+        loading = false;
+      } else {
+        observer.disconnect();
+        sentinel.remove();
+      }
+    } catch (error) {
+      observer.disconnect();
+      if (pager) {
+        pager.hidden = false;
+      }
+    }
+  }, { rootMargin: "300px" });
+
+  observer.observe(sentinel);
+})();
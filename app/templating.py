@@ -0,0 +1,144 @@
+"""
+app/templating.py - Jinja Template Compilation Setup
+
+Compiling a template from source (parse → generate Python → compile) is the
+slowest part of the first render in a fresh worker. This module:
+
+- Gives the Jinja environment a filesystem bytecode cache, so a new worker
+  loads already-compiled template code from disk instead of recompiling.
+- Provides a build step that compiles every template ahead of time:
+      flask --app app precompile-templates
+- Strips developer `<!-- ... -->` comments and collapses whitespace while a
+  template is loaded for compilation. The files in app/templates keep their
+  teaching comments; the rendered HTML no longer carries them.
+
+Invalidation is automatic: each cache entry stores a checksum of the template
+source, and Jinja recompiles (and rewrites the entry) when the source changes.
+
+Environment variables:
+    TEMPLATE_CACHE_DIR  Directory for cached bytecode
+                        (default: a per-user directory in the system temp dir)
+    MINIFY_TEMPLATES    Set to "false" to serve templates exactly as written
+                        (default: true)
+"""
+
+import os
+import re
+
+from jinja2 import BaseLoader, FileSystemBytecodeCache
+
+# Segments that are copied through untouched: whitespace-sensitive elements,
+# HTML comments (handled separately) and Jinja tags, whose string literals
+# must not be altered
+_SEGMENT_RE = re.compile(
+    r"<(pre|textarea|script|style)\b.*?</\1\s*>"
+    r"|<!--.*?-->"
+    r"|\{\{.*?\}\}|\{%.*?%\}|\{#.*?#\}",
+    re.DOTALL | re.IGNORECASE,
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def minify_html(source):
+    """Remove HTML comments and collapse runs of whitespace to one space.
+
+    Conditional comments (`<!--[if ...]>`) and comments that contain Jinja
+    statements (`{% ... %}`) are kept, since dropping them could change output
+    or template structure.
+
+    Example:
+        >>> minify_html("<p>\\n  <!-- note -->\\n  Hi   there</p>")
+        '<p> Hi there</p>'
+    """
+    parts = []
+    pending = []  # plain markup waiting to be collapsed
+    position = 0
+    for match in _SEGMENT_RE.finditer(source):
+        pending.append(source[position:match.start()])
+        position = match.end()
+        segment = match.group(0)
+        if segment.startswith("<!--") and not segment.startswith("<!--[if") and "{%" not in segment:
+            continue  # drop the comment; text on both sides collapses together
+        parts.append(_WHITESPACE_RE.sub(" ", "".join(pending)))
+        parts.append(segment)
+        pending = []
+    pending.append(source[position:])
+    parts.append(_WHITESPACE_RE.sub(" ", "".join(pending)))
+    return "".join(parts).strip()
+
+
+class MinifyingLoader(BaseLoader):
+    """Template loader that minifies the source returned by another loader.
+
+    Runs once per compilation, not per render. `sizes` maps each loaded
+    template name to its (original bytes, minified bytes).
+    """
+
+    def __init__(self, loader):
+        self.loader = loader
+        self.sizes = {}
+
+    def get_source(self, environment, template):
+        source, filename, uptodate = self.loader.get_source(environment, template)
+        minified = minify_html(source)
+        self.sizes[template] = (len(source.encode("utf-8")), len(minified.encode("utf-8")))
+        return minified, filename, uptodate
+
+    def list_templates(self):
+        return self.loader.list_templates()
+
+
+def configure_templates(app):
+    """Attach the bytecode cache and minifying loader to the app's Jinja environment.
+
+    Must run before anything touches `app.jinja_env`, because Flask builds the
+    environment from `app.jinja_options` on first access.
+    """
+    cache_dir = app.config.get("TEMPLATE_CACHE_DIR") or os.getenv("TEMPLATE_CACHE_DIR")
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    app.config["TEMPLATE_CACHE_DIR"] = cache_dir
+    app.jinja_options = {
+        **app.jinja_options,
+        "bytecode_cache": FileSystemBytecodeCache(cache_dir),
+    }
+
+    if os.getenv("MINIFY_TEMPLATES", "true").lower() not in ("0", "false", "no"):
+        app.jinja_loader = MinifyingLoader(app.jinja_loader)
+
+    @app.cli.command("precompile-templates")
+    def precompile_templates_command():
+        """Compile every template into the bytecode cache."""
+        for name in precompile_templates(app):
+            print(f"compiled {name}")
+        for name, original, minified in template_size_report(app):
+            print(f"{name}: {original} -> {minified} bytes (saved {original - minified})")
+
+
+def precompile_templates(app):
+    """Compile all HTML templates, filling the in-memory and bytecode caches.
+
+    Returns:
+        list: Names of the templates that were compiled
+    """
+    env = app.jinja_env
+    names = [name for name in env.list_templates() if name.endswith(".html")]
+    for name in names:
+        env.get_template(name)
+    return names
+
+
+def template_size_report(app):
+    """Bytes saved by minification for each template loaded so far.
+
+    Returns:
+        list: (template name, original bytes, minified bytes) tuples, or an
+        empty list when minification is disabled
+    """
+    loader = app.jinja_loader
+    if not isinstance(loader, MinifyingLoader):
+        return []
+    return [
+        (name, original, minified)
+        for name, (original, minified) in sorted(loader.sizes.items())
+    ]
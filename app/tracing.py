@@ -0,0 +1,239 @@
+"""
+app/tracing.py - Minimal In-Process Request Tracing
+
+Nested timing spans per layer, so a slow request shows where its time went:
+
+    POST /api/tasks                              (route, one per request)
+    └── TaskService.add_task
+        ├── TaskCreate validation
+        ├── TimeService.get_current_time
+        └── TaskService wait for save
+            └── TaskService._save_tasks
+                └── DatabaseTaskRepository.save_changes
+
+Code marks a span with a `with` block; the current span is tracked in a
+contextvar, so spans nest across layers without passing anything around:
+
+    with tracing.span("TaskService.add_task", title_length=len(title)):
+        ...
+
+Tracing is off unless TRACING=true. While off, `span()` returns one shared
+no-op context manager and no request hooks are installed. The exporter lives
+in `app.extensions["tracing"]`, so each app is traced (or not) on its own;
+a span outside any request or app context is not recorded.
+
+Under group commit one request, the batch leader, runs the save for every
+request in its batch. The `TaskService._save_tasks` and repository spans
+appear only in the leader's trace; the other requests of that batch show
+just their "TaskService wait for save" span, which covers the batch's save.
+
+While on, a request's trace id is taken from an incoming W3C `traceparent`
+header (or generated), and echoed in the response's `traceparent` header.
+When a request finishes, its spans are appended to the trace file as one
+OTLP/JSON line (`{"resourceSpans": [...]}`), the format OpenTelemetry's file
+exporter writes. The collector's otlpjsonfile receiver, Jaeger and similar
+tools can import it.
+
+Configuration (app.config or environment):
+    TRACING            "true" to record spans
+    TRACE_FILE         Where traces are appended (default: <tmp>/task-traces.jsonl)
+    OTEL_SERVICE_NAME  service.name resource attribute (default: task-tracker)
+"""
+
+import contextlib
+import contextvars
+import json
+import os
+import re
+import secrets
+import tempfile
+import threading
+import time
+
+from flask import current_app, g, has_app_context, request
+
+# OTLP span kinds and status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+STATUS_UNSET = 0
+STATUS_ERROR = 2
+
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+_NOOP = contextlib.nullcontext()
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+
+def parse_traceparent(header):
+    """(trace id, parent span id) from a W3C traceparent header, or None.
+
+    Example:
+        >>> parse_traceparent("00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01")
+        ('4bf92f3577b34da6a3ce929d0e0e4736', '00f067aa0ba902b7')
+    """
+    match = _TRACEPARENT_RE.match((header or "").strip().lower())
+    if not match or set(match.group(1)) == {"0"} or set(match.group(2)) == {"0"}:
+        return None
+    return match.group(1), match.group(2)
+
+
+def _attribute_value(value):
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}  # int64 is a string in OTLP/JSON
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Span:
+    """One timed operation; use as a context manager (see `span()`)."""
+
+    def __init__(self, name, attributes=None, kind=SPAN_KIND_INTERNAL, remote_parent=None, exporter=None):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.kind = kind
+        self.status = STATUS_UNSET
+        self.span_id = secrets.token_hex(8)
+        self._remote_parent = remote_parent
+        self._exporter = exporter
+        self._token = None
+        self.start_ns = self.end_ns = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def __enter__(self):
+        parent = _current_span.get()
+        if parent is not None:
+            self.trace_id, self.parent_id = parent.trace_id, parent.span_id
+            self._finished = parent._finished  # spans of this trace in this process
+            self._local_root = False
+        else:
+            self.trace_id, self.parent_id = self._remote_parent or (secrets.token_hex(16), None)
+            self._finished = []
+            self._local_root = True
+        self._token = _current_span.set(self)
+        self.start_ns = time.time_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.time_ns()
+        try:
+            _current_span.reset(self._token)
+        except ValueError:
+            pass  # ended from another context, e.g. after a streamed response
+        if exc_type is not None:
+            self.status = STATUS_ERROR
+            self.attributes["exception.type"] = exc_type.__name__
+        self._finished.append(self)
+        if self._local_root and self._exporter is not None:
+            self._exporter.export(self._finished)
+        return False
+
+    def to_otlp(self):
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [{"key": k, "value": _attribute_value(v)} for k, v in self.attributes.items()],
+            "status": {"code": self.status},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+def span(name, **attributes):
+    """Context manager timing the block as a child of the current span.
+
+    Returns a shared no-op context manager when tracing is off.
+    """
+    parent = _current_span.get()
+    exporter = parent._exporter if parent is not None else _app_exporter()
+    if exporter is None:
+        return _NOOP
+    return Span(name, attributes, exporter=exporter)
+
+
+def _app_exporter():
+    """The current app's exporter, or None outside an app context."""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get("tracing")
+
+
+def current_span():
+    """The innermost active span, or None."""
+    return _current_span.get()
+
+
+class FileSpanExporter:
+    """Appends each finished trace to a file as one OTLP/JSON line."""
+
+    def __init__(self, path, service_name="task-tracker"):
+        self.path = path
+        self.resource = {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]}
+        self._lock = threading.Lock()
+
+    def export(self, spans):
+        line = json.dumps({"resourceSpans": [{
+            "resource": self.resource,
+            "scopeSpans": [{"scope": {"name": __name__}, "spans": [s.to_otlp() for s in spans]}],
+        }]}, separators=(",", ":"))
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+def install_tracing(app):
+    """Trace every request of app when TRACING is enabled.
+
+    Returns:
+        bool: True if tracing was turned on
+    """
+    def setting(name, default=None):
+        return app.config.get(name) or os.getenv(name) or default
+
+    if str(setting("TRACING", "")).lower() not in ("1", "true", "yes"):
+        return False
+    path = setting("TRACE_FILE", os.path.join(tempfile.gettempdir(), "task-traces.jsonl"))
+    app.config["TRACE_FILE"] = path
+    exporter = FileSpanExporter(path, setting("OTEL_SERVICE_NAME", "task-tracker"))
+    app.extensions["tracing"] = exporter
+
+    @app.before_request
+    def _start_request_span():
+        route = request.url_rule.rule if request.url_rule else request.path
+        # Path only: query strings carry user input such as search terms
+        request_span = Span(
+            f"{request.method} {route}",
+            {"http.method": request.method, "http.route": route, "http.target": request.path},
+            kind=SPAN_KIND_SERVER,
+            remote_parent=parse_traceparent(request.headers.get("traceparent")),
+            exporter=exporter,
+        )
+        g.trace_span = request_span.__enter__()
+
+    @app.after_request
+    def _record_response(response):
+        request_span = g.get("trace_span")
+        if request_span is not None:
+            request_span.set_attribute("http.status_code", response.status_code)
+            response.headers["traceparent"] = f"00-{request_span.trace_id}-{request_span.span_id}-01"
+        return response
+
+    @app.teardown_request
+    def _end_request_span(exception):
+        request_span = g.pop("trace_span", None)
+        if request_span is not None:
+            if exception is not None:
+                request_span.__exit__(type(exception), exception, exception.__traceback__)
+            else:
+                request_span.__exit__(None, None, None)
+
+    return True
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+tests/benchmarks/bench_concurrency.py - TaskService Multi-Threaded Stress Test
+
+Runs concurrent writers (add/complete/delete) against lock-free readers and
+checks the results:
+
+- every added task got a unique id, and storage holds exactly the final list;
+- no reader ever saw a half-updated list (ids in a snapshot are unique and
+  in order).
+
+Then it measures read throughput with 1, 2, 4 and 8 reader threads while one
+writer keeps changing the list. Readers take no lock, so they never wait on
+the writer (whose saves and copies hold the writer lock). On a standard (GIL)
+CPython build all threads share one core, so adding readers mostly shifts CPU
+time from the writer to the readers; a free-threaded build can scale with cores.
+
+Not collected by pytest (no test_ prefix); run it directly:
+
+    python tests/benchmarks/bench_concurrency.py
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from app.services.task_service import TaskService  # noqa: E402
+from tests.storage_stubs import MemoryStorage  # noqa: E402
+
+
+def run_threads(targets):
+    threads = [threading.Thread(target=target) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def stress(writers=8, operations=300, readers=8):
+    """Hammer one service with writers and readers; return a list of problems."""
+    storage = MemoryStorage()
+    service = TaskService(storage)
+    problems = []
+    writers_left = [writers]
+    lock = threading.Lock()
+
+    def writer(n):
+        for i in range(operations):
+            task = service.add_task(f"writer {n} op {i}")
+            if i % 3 == 0:
+                service.complete_task(task["id"])
+            if i % 5 == 0:
+                service.delete_task(task["id"])
+        with lock:
+            writers_left[0] -= 1
+
+    def reader():
+        while writers_left[0]:
+            ids = [t["id"] for t in service.get_all_tasks()]
+            if ids != sorted(set(ids)):
+                problems.append("reader saw duplicate or out-of-order ids")
+
+    run_threads([lambda n=n: writer(n) for n in range(writers)] + [reader] * readers)
+
+    final = service.get_all_tasks()
+    expected = writers * (operations - len(range(0, operations, 5)))
+    if len(final) != expected:
+        problems.append(f"expected {expected} tasks, found {len(final)}")
+    if len({t["id"] for t in final}) != len(final):
+        problems.append("duplicate ids in final list")
+    if [t["id"] for t in storage.saved] != [t["id"] for t in final]:
+        problems.append("storage does not match the in-memory list")
+    return problems
+
+
+def read_throughput(threads, seconds=1.0, tasks=200):
+    """Total get_all_tasks() calls per second across `threads` readers."""
+    service = TaskService(MemoryStorage())
+    for i in range(tasks):
+        service.add_task(f"task {i}")
+    stop = threading.Event()
+    counts = []
+
+    def reader():
+        count = 0
+        while not stop.is_set():
+            service.get_all_tasks()
+            count += 1
+        counts.append(count)
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            task = service.add_task(f"churn {i}")
+            service.delete_task(task["id"])
+            i += 1
+
+    workers = [threading.Thread(target=reader) for _ in range(threads)]
+    workers.append(threading.Thread(target=writer))
+    for worker in workers:
+        worker.start()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    return sum(counts) / seconds
+
+
+def main():
+    problems = stress()
+    print("stress test:", "OK" if not problems else "FAILED")
+    for problem in problems:
+        print("  -", problem)
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"\nread throughput (GIL {'enabled' if gil else 'disabled'}, one concurrent writer)")
+    for threads in (1, 2, 4, 8):
+        print(f"  {threads} reader thread(s): {read_throughput(threads):>10,.0f} reads/s")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
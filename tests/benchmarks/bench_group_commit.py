@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+tests/benchmarks/bench_group_commit.py - Group Commit Load Test
+
+Bursts of concurrent add_task calls against a file-backed SQLite database,
+for each TaskService durability level. "sync" and "group" are equally
+durable: every call returns only after a committed transaction contains its
+task. With "sync" each call pays for its own commit; with group commit,
+calls that arrive while a commit is running share the next one.
+"write_behind" is shown for comparison: calls return before anything is
+saved (its writes/s is acknowledgement rate).
+
+Not collected by pytest (no test_ prefix); run it directly:
+
+    python tests/benchmarks/bench_group_commit.py [threads] [writes per thread]
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.models.sqlalchemy_task import create_schema  # noqa: E402
+from app.repositories.database_task_repository import DatabaseTaskRepository  # noqa: E402
+from app.services.task_service import TaskService  # noqa: E402
+
+
+def run(label, threads, writes, **service_options):
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{directory}/bench.db")
+        create_schema(engine)
+        repo = DatabaseTaskRepository(sessionmaker(bind=engine))
+        service = TaskService(repo, **service_options)
+        start_line = threading.Barrier(threads)
+
+        def writer(n):
+            start_line.wait()
+            for i in range(writes):
+                service.add_task(f"writer {n} task {i}")
+
+        workers = [threading.Thread(target=writer, args=(n,)) for n in range(threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        service.close()  # write-behind saves here; the others are already saved
+
+        stored = len(repo.load_tasks())
+        engine.dispose()
+    total = threads * writes
+    assert stored == total, f"{label}: expected {total} stored tasks, found {stored}"
+    commits = service._writer.batches
+    print(f"{label:<30}{total / elapsed:>10.0f} writes/s{commits:>8} commits"
+          f"{total / commits:>8.1f} writes/commit")
+
+
+def main(threads=16, writes=25):
+    print(f"{threads} threads x {writes} add_task calls, SQLite file database\n")
+    run("one commit per write (sync)", threads, writes, durability="sync")
+    run("group commit", threads, writes)
+    run("group commit, 2 ms window", threads, writes, commit_window=0.002)
+    run("write-behind (not durable)", threads, writes, durability="write_behind")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+tests/benchmarks/bench_http_endpoints.py - End-to-End Endpoint Latency
+
+Requests every route of tasks_bp, ui_bp, time_bp, ui_time_bp and health_bp
+through `create_app(service).test_client()`. The full Flask stack runs:
+routing, request hooks, views, templates and serialization, with no network
+or server in between. The app is seeded with --size tasks (a quarter of them
+completed), and TimeService is replaced by the stub from
+bench_task_service.py, so nothing leaves the process.
+
+Per case (route plus query string):
+- latency p50/p95/p99 over --requests timed requests, after a few untimed
+  warm-up requests (template compilation, caches);
+- memory, from a second, shorter pass under tracemalloc:
+  alloc_peak_kib   peak memory allocated while one request runs
+                   (templates and serialization show up here)
+  alloc_net_bytes  memory still held per request afterwards (caches, leaks)
+
+Write routes get a fresh task id per request from the seeded range. POST
+/api/tasks/reset is timed last, re-seeding the service before each call
+(untimed).
+
+The script warns about any route of those blueprints without a case, so new
+routes get noticed.
+
+Output: one JSON object per case on stdout (`"schema": 1`, fixed keys), and
+a readable table on stderr. Not collected by pytest (no test_ prefix); run
+it directly:
+
+    python tests/benchmarks/bench_http_endpoints.py > endpoints.jsonl
+    python tests/benchmarks/bench_http_endpoints.py --size 5000 --requests 500
+"""
+
+import argparse
+import gc
+import itertools
+import json
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from app import create_app  # noqa: E402
+from app.services.task_service import TaskService  # noqa: E402
+from bench_task_service import (  # noqa: E402
+    CREATED_AT,
+    SCHEMA_VERSION,
+    StubTimeService,
+    percentile,
+)
+from tests.storage_stubs import MemoryStorage  # noqa: E402
+
+BLUEPRINTS = ("tasks", "ui", "time", "ui_time", "health")
+WARMUP_REQUESTS = 5
+
+
+def seeded_service(size):
+    storage = MemoryStorage()
+    storage.save_tasks([
+        {"id": i, "title": f"Task {i} {('groceries', 'report', 'release', 'invoice')[i % 4]}",
+         "description": f"Seeded task number {i}", "completed": i % 4 == 0,
+         "created_at": CREATED_AT.replace("01T", f"{1 + i % 28:02d}T")}
+        for i in range(1, size + 1)
+    ])
+    return TaskService(storage, StubTimeService())
+
+
+def build_cases(size):
+    """(endpoint, label, method, path(i), request options) for every case."""
+    # Disjoint ranges of open (i % 4 != 0) seeded ids for the write routes
+    open_ids = [i for i in range(1, size + 1) if i % 4]
+    quarter = len(open_ids) // 4
+    ranges = {name: open_ids[n * quarter:(n + 1) * quarter]
+              for n, name in enumerate(("api_complete", "api_delete", "ui_complete", "ui_delete"))}
+
+    def task_path(name, template):
+        return lambda i: template.format(ranges[name][i % len(ranges[name])])
+
+    def fixed(path):
+        return lambda i: path
+
+    return [
+        ("health.health_check", "GET /api/health", "GET", fixed("/api/health"), {}),
+        ("time.get_time", "GET /api/time", "GET", fixed("/api/time"), {}),
+        ("ui_time.show_time", "GET /time", "GET", fixed("/time?timezone=London"), {}),
+        ("tasks.list_tasks", "GET /api/tasks", "GET", fixed("/api/tasks"), {}),
+        ("tasks.list_tasks", "GET /api/tasks?q=", "GET", fixed("/api/tasks?q=report&limit=20"), {}),
+        ("tasks.list_tasks", "GET /api/tasks?created_after=", "GET",
+         fixed("/api/tasks?created_after=2026-01-20"), {}),
+        ("tasks.recent_tasks", "GET /api/tasks/recent", "GET", fixed("/api/tasks/recent?limit=20"), {}),
+        ("tasks.suggest_titles", "GET /api/tasks/suggest", "GET", fixed("/api/tasks/suggest?prefix=Task%201"), {}),
+        ("tasks.export_tasks", "GET /api/tasks/export.ndjson", "GET", fixed("/api/tasks/export.ndjson"), {}),
+        ("tasks.add_task", "POST /api/tasks", "POST", fixed("/api/tasks"),
+         {"json": {"title": "Benchmark task", "description": "created by the benchmark"}}),
+        ("tasks.complete_task", "PUT /api/tasks/<id>", "PUT", task_path("api_complete", "/api/tasks/{}"), {}),
+        ("tasks.delete_task", "DELETE /api/tasks/<id>", "DELETE", task_path("api_delete", "/api/tasks/{}"), {}),
+        ("ui.home", "GET /", "GET", fixed("/"), {}),
+        ("ui.show_tasks", "GET /tasks", "GET", fixed("/tasks"), {}),
+        ("ui.show_tasks", "GET /tasks?page=5", "GET", fixed("/tasks?page=5&status=open"), {}),
+        ("ui.show_tasks", "GET /tasks?q=", "GET", fixed("/tasks?q=invoice"), {}),
+        ("ui.task_rows", "GET /tasks/rows", "GET", fixed("/tasks/rows?page=2"), {}),
+        ("ui.task_report", "GET /tasks/report", "GET", fixed("/tasks/report"), {}),
+        ("ui.task_submit", "GET /tasks/new", "GET", fixed("/tasks/new"), {}),
+        ("ui.task_submit", "POST /tasks/new", "POST", fixed("/tasks/new"),
+         {"data": {"title": "Benchmark form task", "description": "created by the benchmark"}}),
+        ("ui.complete_task", "POST /tasks/<id>/complete", "POST",
+         task_path("ui_complete", "/tasks/{}/complete"), {}),
+        ("ui.delete_task", "POST /tasks/<id>/delete", "POST", task_path("ui_delete", "/tasks/{}/delete"), {}),
+        # Destructive: runs last and re-seeds before every request
+        ("tasks.reset_tasks", "POST /api/tasks/reset", "POST", fixed("/api/tasks/reset"), {}),
+    ]
+
+
+def uncovered_endpoints(app, cases):
+    covered = {endpoint for endpoint, *_ in cases}
+    return sorted(
+        rule.endpoint for rule in app.url_map.iter_rules()
+        if rule.endpoint.split(".")[0] in BLUEPRINTS and rule.endpoint not in covered
+    )
+
+
+def run_case(app, case, requests, alloc_requests, counter, setup=None):
+    endpoint, label, method, path, options = case
+    client = app.test_client()
+
+    def call():
+        i = next(counter)
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        response = client.open(path(i), method=method, **options)
+        response.get_data()
+        elapsed = time.perf_counter() - started
+        if response.status_code >= 400:
+            raise RuntimeError(f"{label}: HTTP {response.status_code}")
+        response.close()
+        return elapsed
+
+    for _ in range(WARMUP_REQUESTS):
+        call()
+    gc.collect()
+    timings = sorted(call() for _ in range(requests))
+
+    # Memory pass: tracemalloc slows every allocation, so it is kept separate
+    peaks = []
+    tracemalloc.start()
+    try:
+        # State replaced by each request (e.g. the saved task list) was allocated
+        # before tracing started, so its release would not be counted: let it
+        # turn over once under tracing before taking the baseline
+        call()
+        gc.collect()
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(alloc_requests):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            call()
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "case": label,
+        "endpoint": endpoint,
+        "method": method,
+        "requests": len(timings),
+        "p50_ms": round(percentile(timings, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(timings, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(timings, 0.99) * 1000, 3),
+        "max_ms": round(timings[-1] * 1000, 3),
+        "alloc_peak_kib": round(sorted(peaks)[len(peaks) // 2] / 1024, 1),
+        "alloc_net_bytes": round((after - before) / alloc_requests),
+        "python": platform.python_version(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", type=int, default=2000, help="seeded task count")
+    parser.add_argument("--requests", type=int, default=200, help="timed requests per case")
+    parser.add_argument("--alloc-requests", type=int, default=30, help="requests traced for memory per case")
+    args = parser.parse_args(argv)
+    # Room for warm-up, timed and traced requests in each write route's id range
+    needed = WARMUP_REQUESTS + args.requests + args.alloc_requests
+    if args.size * 3 // 16 < needed:
+        parser.error(f"--size must be at least {needed * 16 // 3 + 16} for {args.requests} requests per case")
+
+    logging.getLogger("app").setLevel(logging.WARNING)  # no per-request log lines
+    app = create_app(seeded_service(args.size))
+    app.time_service = StubTimeService()
+    cases = build_cases(args.size)
+    for endpoint in uncovered_endpoints(app, cases):
+        print(f"warning: no benchmark case for {endpoint}", file=sys.stderr)
+
+    def reseed():
+        app.task_service = seeded_service(args.size)
+
+    print(f"{'case':<32} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'peak KiB':>9} {'net B/req':>10}",
+          file=sys.stderr)
+    for case in cases:
+        counter = itertools.count()
+        setup = reseed if case[0] == "tasks.reset_tasks" else None
+        result = run_case(app, case, args.requests, args.alloc_requests, counter, setup)
+        print(json.dumps(result), flush=True)
+        print(f"{result['case']:<32} {result['p50_ms']:>8.3f} {result['p95_ms']:>8.3f} "
+              f"{result['p99_ms']:>8.3f} {result['alloc_peak_kib']:>9.1f} {result['alloc_net_bytes']:>10,}",
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
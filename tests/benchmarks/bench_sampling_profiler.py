@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+tests/benchmarks/bench_sampling_profiler.py - Sampling Profiler Overhead
+
+The background profiler holds the GIL while it walks the other threads'
+stacks, so its cost is paid by the whole process. Two measurements:
+
+1. The cost of one sample() with 8 busy threads, times the sampling rate:
+   the fraction of one core the profiler takes (the budget is 1%).
+2. Request throughput of the app (4 client threads on the Flask test client)
+   with the profiler off and on, alternating runs to average out noise.
+
+Not collected by pytest (no test_ prefix); run it directly:
+
+    python tests/benchmarks/bench_sampling_profiler.py
+"""
+
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from app import create_app  # noqa: E402
+from app.sampling_profiler import SamplingProfiler  # noqa: E402
+from app.services.task_service import TaskService  # noqa: E402
+from tests.storage_stubs import MemoryStorage  # noqa: E402
+
+
+def sample_cost(threads=8, samples=2000):
+    """Average seconds per sample() while `threads` threads run app code."""
+    stop = threading.Event()
+    service = TaskService(MemoryStorage())
+    for i in range(200):
+        service.add_task(f"task {i}")
+
+    def busy():
+        while not stop.is_set():
+            service.get_all_tasks_json()
+            service.search_tasks("task 1")
+            time.sleep(0)
+
+    workers = [threading.Thread(target=busy) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    profiler = SamplingProfiler()
+    try:
+        started = time.perf_counter()
+        for _ in range(samples):
+            profiler.sample()
+        return (time.perf_counter() - started) / samples
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join()
+
+
+def requests_per_second(app, seconds=1.0, clients=4):
+    stop = threading.Event()
+    counts = []
+
+    def client():
+        http = app.test_client()
+        count = 0
+        while not stop.is_set():
+            http.get("/api/tasks")
+            count += 1
+        counts.append(count)
+
+    workers = [threading.Thread(target=client) for _ in range(clients)]
+    for worker in workers:
+        worker.start()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    return sum(counts) / seconds
+
+
+def main():
+    cost = sample_cost()
+    print(f"one sample with 8 busy threads: {cost * 1e6:.1f} µs")
+    for interval_ms in (5, 10, 20, 50):
+        print(f"  every {interval_ms:>2} ms: {cost / (interval_ms / 1000):.3%} of one core")
+
+    app = create_app(TaskService(MemoryStorage()))
+    for i in range(200):
+        app.task_service.add_task(f"task {i}")
+    profiler = SamplingProfiler()  # default interval
+    off, on = [], []
+    for _ in range(5):
+        off.append(requests_per_second(app))
+        profiler.start()
+        on.append(requests_per_second(app))
+        profiler.stop()
+    off_rate, on_rate = statistics.median(off), statistics.median(on)
+    print(f"\nGET /api/tasks, 4 clients, profiler every {profiler.interval * 1000:.0f} ms")
+    print(f"  profiler off: {off_rate:>8,.0f} req/s")
+    print(f"  profiler on:  {on_rate:>8,.0f} req/s ({profiler.samples} samples)")
+    print(f"  difference:   {(off_rate - on_rate) / off_rate:+.2%} (run-to-run noise is of the same order)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
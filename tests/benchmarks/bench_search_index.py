@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+tests/benchmarks/bench_search_index.py - Inverted Index vs. Linear Scan
+
+Compares TaskService's in-memory search index with the naive approach it
+replaced (tokenise every task on every query). Not collected by pytest (no
+test_ prefix); run it directly:
+
+    python tests/benchmarks/bench_search_index.py [number of tasks]
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from app.services.search_index import SearchIndex  # noqa: E402
+
+WORDS = (
+    "buy groceries call plumber write report review budget plan garden "
+    "book hotel pay invoice fix bike clean kitchen email team prepare slides"
+).split()
+QUERIES = ["groceries", "gro", "kitchen clean", "rep", "zebra", "b"]
+
+
+def naive_search(documents, query, limit=20):
+    """The linear scan: tokenise every document for every query."""
+    words = re.findall(r"\w+", query.lower())
+    matches = []
+    for doc_id, text in documents:
+        text_words = re.findall(r"\w+", text.lower())
+        if all(any(w.startswith(word) for w in text_words) for word in words):
+            matches.append(doc_id)
+            if len(matches) == limit:
+                break
+    return matches
+
+
+def best_of(func, repeat=5):
+    """Fastest of several runs, in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main(count=50_000):
+    rng = random.Random(42)
+    documents = [
+        (doc_id, " ".join(rng.choices(WORDS, k=6)) + f" item{doc_id}")
+        for doc_id in range(1, count + 1)
+    ]
+
+    start = time.perf_counter()
+    index = SearchIndex()
+    for doc_id, text in documents:
+        index.add(doc_id, text)
+    print(f"{count} documents, index built in {(time.perf_counter() - start) * 1000:.0f} ms\n")
+
+    print(f"{'query':<16}{'scan ms':>10}{'index ms':>10}")
+    for query in QUERIES:
+        scan = best_of(lambda: naive_search(documents, query))
+        indexed = best_of(lambda: index.search(query, 20))
+        print(f"{query:<16}{scan:>10.2f}{indexed:>10.2f}")
+
+    add_ms = best_of(lambda: index.add(count + 1, "new task text"), repeat=100)
+    print(f"\nincremental add: {add_ms * 1000:.1f} µs")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+tests/benchmarks/bench_task_service.py - TaskService Micro-Benchmarks
+
+Times add_task, complete_task, delete_task, get_all_tasks and clear_tasks on
+services holding N tasks, for each storage backend:
+
+    memory    in-process list (no I/O): the service's own cost
+    json      TaskStorage, the JSON file (rewritten on every change)
+    database  DatabaseTaskRepository on a SQLite file
+
+Stores are seeded directly (not through add_task), and TimeService is
+replaced by a stub returning a fixed time, so the run needs no network.
+Every write uses the default "group" durability: a call returns once its
+change is saved.
+
+Each (backend, N, operation) case runs until --ops calls are timed or the
+case has used --budget seconds, whichever comes first (but at least 3
+calls). Slow cases, such as rewriting a 100k-task JSON file per write, still
+finish in reasonable time. clear_tasks re-seeds the store before each call,
+untimed.
+
+Output: one JSON object per case on stdout, with the same keys in the same
+order every run (`"schema": 1`), so results can be diffed or loaded with
+`pandas.read_json(path, lines=True)`. A readable table goes to stderr.
+
+Not collected by pytest (no test_ prefix); run it directly:
+
+    python tests/benchmarks/bench_task_service.py > results.jsonl
+    python tests/benchmarks/bench_task_service.py --sizes 1000 --backends memory,database
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.models.sqlalchemy_task import create_schema  # noqa: E402
+from app.repositories.database_task_repository import DatabaseTaskRepository  # noqa: E402
+from app.services import task_storage  # noqa: E402
+from app.services.task_service import TaskService  # noqa: E402
+from tests.storage_stubs import MemoryStorage  # noqa: E402
+
+SCHEMA_VERSION = 1
+OPERATIONS = ("get_all_tasks", "add_task", "complete_task", "delete_task", "clear_tasks")
+CREATED_AT = "2026-01-01T00:00:00.000000Z"
+
+
+class StubTimeService:
+    """TimeService stand-in: a fixed timestamp, no network call."""
+
+    def get_current_time(self, timezone="UTC"):
+        return {"utc_datetime": CREATED_AT, "timezone": timezone, "source": "stub"}
+
+
+def make_storage(backend, directory):
+    """Return (storage, cleanup) for a backend name."""
+    if backend == "memory":
+        return MemoryStorage(), lambda: None
+    if backend == "json":
+        # TaskStorage wraps module-level functions that read TASKS_FILE
+        previous = task_storage.TASKS_FILE
+        task_storage.TASKS_FILE = str(Path(directory) / "tasks.json")
+
+        def restore():
+            task_storage.TASKS_FILE = previous
+
+        return task_storage.TaskStorage(), restore
+    if backend == "database":
+        engine = create_engine(f"sqlite:///{directory}/bench.db")
+        create_schema(engine)
+        return DatabaseTaskRepository(sessionmaker(bind=engine)), engine.dispose
+    raise ValueError(f"Unknown backend {backend!r}")
+
+
+def seed_tasks(size):
+    return [
+        {"id": i, "title": f"Task {i}", "description": f"Seeded task number {i}",
+         "completed": False, "created_at": CREATED_AT}
+        for i in range(1, size + 1)
+    ]
+
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def summarize(backend, size, operation, timings):
+    ordered = sorted(timings)
+    total = sum(ordered)
+    return {
+        "schema": SCHEMA_VERSION,
+        "backend": backend,
+        "size": size,
+        "operation": operation,
+        "iterations": len(ordered),
+        "ops_per_sec": round(len(ordered) / total, 2) if total else None,
+        "mean_us": round(total / len(ordered) * 1e6, 2),
+        "p50_us": round(percentile(ordered, 0.50) * 1e6, 2),
+        "p95_us": round(percentile(ordered, 0.95) * 1e6, 2),
+        "p99_us": round(percentile(ordered, 0.99) * 1e6, 2),
+        "min_us": round(ordered[0] * 1e6, 2),
+        "max_us": round(ordered[-1] * 1e6, 2),
+        "python": platform.python_version(),
+    }
+
+
+def time_calls(call, ops, budget, setup=None):
+    """Time call(i) for i = 0, 1, ... until ops calls or budget seconds."""
+    timings = []
+    spent = 0.0
+    while len(timings) < ops and (spent < budget or len(timings) < 3):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        call(len(timings))
+        elapsed = time.perf_counter() - started
+        timings.append(elapsed)
+        spent += elapsed
+    return timings
+
+
+def bench_case(backend, size, ops, budget):
+    """Benchmark every operation on one backend at one size; return result dicts."""
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        storage, cleanup = make_storage(backend, directory)
+        seed = seed_tasks(size)
+        try:
+            storage.save_tasks(seed)
+            service = TaskService(storage, StubTimeService())
+            gc.collect()
+
+            calls = {
+                "get_all_tasks": lambda i: service.get_all_tasks(),
+                "add_task": lambda i: service.add_task(f"Benchmark task {i}", "added by the benchmark"),
+                # Seeded tasks are all open; complete them from the front
+                "complete_task": lambda i: service.complete_task(i + 1),
+                # Delete from the back, below the tasks add_task appended
+                "delete_task": lambda i: service.delete_task(size - i),
+            }
+            for operation in OPERATIONS[:-1]:
+                results.append(summarize(backend, size, operation, time_calls(calls[operation], ops, budget)))
+            service.close()
+
+            state = {}
+
+            def reseed():
+                storage.save_tasks(seed)
+                state["service"] = TaskService(storage, StubTimeService())
+
+            timings = time_calls(lambda i: state["service"].clear_tasks(), ops, budget, setup=reseed)
+            results.append(summarize(backend, size, "clear_tasks", timings))
+        finally:
+            cleanup()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated task counts")
+    parser.add_argument("--backends", default="memory,json,database", help="comma-separated backends")
+    parser.add_argument("--ops", type=int, default=200, help="most timed calls per case")
+    parser.add_argument("--budget", type=float, default=2.0, help="seconds per case (soft limit)")
+    args = parser.parse_args(argv)
+
+    print(f"{'backend':<9} {'N':>7} {'operation':<14} {'calls':>5} {'ops/s':>11} "
+          f"{'p50 µs':>10} {'p95 µs':>10} {'p99 µs':>10}", file=sys.stderr)
+    for backend in args.backends.split(","):
+        for size in (int(n) for n in args.sizes.split(",")):
+            for result in bench_case(backend, size, args.ops, args.budget):
+                print(json.dumps(result), flush=True)
+                print(f"{backend:<9} {size:>7} {result['operation']:<14} {result['iterations']:>5} "
+                      f"{result['ops_per_sec']:>11,.1f} {result['p50_us']:>10,.1f} "
+                      f"{result['p95_us']:>10,.1f} {result['p99_us']:>10,.1f}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
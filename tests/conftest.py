@@ -47,6 +47,9 @@ class MockTaskService:
     """Mock implementation of TaskService for testing routes without file I/O.
     
     ✅ PR-5: Now uses centralized validation (TaskValidationError)
+
+    Implements every TaskService method the blueprints call, so any route
+    can be exercised through create_app(service=MockTaskService()).
     """
     def __init__(self):
         self._tasks = []
@@ -55,6 +58,49 @@ class MockTaskService:
     def get_all_tasks(self):
         return [task.copy() for task in self._tasks]
 
+    def iter_tasks_ndjson(self):
+        for task in self._tasks:
+            yield json.dumps(task).encode() + b"\n"
+
+    def get_tasks(self):
+        return self.get_all_tasks()
+
+    def get_tasks_page(self, page=1, per_page=20, status="all"):
+        completed = {"all": None, "open": False, "completed": True}[status]
+        tasks = [t for t in self.get_all_tasks() if completed is None or t["completed"] == completed]
+        offset = (max(page, 1) - 1) * per_page
+        # No versions: the UI renders these rows without the fragment cache
+        return [(task, None) for task in tasks[offset:offset + per_page]], len(tasks)
+
+    def suggest_titles(self, prefix, limit=10):
+        from app.services.search_index import TitlePrefixIndex
+        index = TitlePrefixIndex()
+        for task in self._tasks:
+            index.add(task["id"], task["title"])
+        return index.suggest(prefix, limit)
+
+    def get_tasks_by_created(self, created_after=None, created_before=None,
+                             limit=None, newest_first=False):
+        tasks = [
+            t for t in self.get_all_tasks()
+            if t.get("created_at") is not None
+            and (created_after is None or t["created_at"] > created_after)
+            and (created_before is None or t["created_at"] < created_before)
+        ]
+        tasks.sort(key=lambda t: (t["created_at"], t["id"]), reverse=newest_first)
+        return tasks if limit is None else tasks[:limit]
+
+    def get_recent_tasks(self, limit=10):
+        return self.get_tasks_by_created(limit=limit, newest_first=True)
+
+    def search_tasks(self, query, limit=20):
+        words = query.lower().split()
+        matches = [
+            t for t in self.get_all_tasks()
+            if words and all(word in f"{t['title']} {t['description']}".lower() for word in words)
+        ]
+        return matches[:limit]
+
     def add_task(self, title, description=None):
         # ✅ PR-5: Use centralized validation from TaskCreate schema
         from app.schemas import TaskCreate
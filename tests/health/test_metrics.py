@@ -0,0 +1,72 @@
+# tests/health/test_metrics.py
+# ✅ Request timing middleware and the Prometheus /metrics endpoint
+
+import pytest
+
+from app.metrics import MetricsRegistry
+from app.services.time_service import TimeService
+
+pytestmark = pytest.mark.unit
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = registry.histogram("op_seconds", "Op latency.", ["op"], buckets=(0.1, 1.0))
+    latency.observe(0.05, "read")
+    latency.observe(0.5, "read")
+    latency.observe(5, "read")
+    text = registry.render()
+    assert '# TYPE op_seconds histogram' in text
+    assert 'op_seconds_bucket{op="read",le="0.1"} 1' in text
+    assert 'op_seconds_bucket{op="read",le="1.0"} 2' in text
+    assert 'op_seconds_bucket{op="read",le="+Inf"} 3' in text
+    assert 'op_seconds_count{op="read"} 3' in text
+
+
+def test_registry_returns_existing_metric_and_rejects_type_clash():
+    registry = MetricsRegistry()
+    assert registry.counter("things_total", "Things.") is registry.counter("things_total", "Things.")
+    with pytest.raises(ValueError):
+        registry.histogram("things_total", "Things.")
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.counter("odd_total", "Odd labels.", ["name"]).inc('say "hi"\n')
+    assert 'odd_total{name="say \\"hi\\"\\n"} 1' in registry.render()
+
+
+def test_requests_are_counted_and_timed(app, client):
+    client.get("/api/health")
+    client.get("/api/health")
+    client.get("/no-such-page")
+    requests_total = app.metrics.get("http_requests_total")
+    assert requests_total.value("health.health_check", "GET", "200") >= 2
+    assert requests_total.value("unmatched", "GET", "404") >= 1
+    assert app.metrics.get("http_request_duration_seconds").count("health.health_check", "GET") >= 2
+
+
+def test_metrics_endpoint_serves_prometheus_text(client):
+    client.post("/api/tasks", json={"title": "Counted"})
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    text = response.get_data(as_text=True)
+    assert '# TYPE http_requests_total counter' in text
+    assert 'http_requests_total{endpoint="tasks.add_task",method="POST",status="201"}' in text
+    assert "tasks_in_memory " in text
+    assert "db_queries_total " in text
+
+
+def test_time_service_records_fallbacks(monkeypatch):
+    import app.services.time_service as time_service_module
+
+    def failing_get(*args, **kwargs):
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(time_service_module.requests, "get", failing_get)
+    registry = MetricsRegistry()
+    service = TimeService(metrics=registry)
+    assert service.get_current_time()["source"] == "System Time (Fallback)"
+    assert registry.get("time_service_fallbacks_total").value() == 1
+    assert registry.get("time_service_upstream_seconds").count("error") == 1
@@ -0,0 +1,48 @@
+# tests/health/test_request_profiling.py
+# ✅ Header-triggered cProfile of single requests (off unless PROFILE_SECRET is set)
+
+import pytest
+
+from app import create_app
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def profiled_app(monkeypatch, tmp_path):
+    monkeypatch.setenv("PROFILE_SECRET", "let-me-profile")
+    monkeypatch.setenv("PROFILE_DIR", str(tmp_path))
+    app = create_app()
+    yield app
+    app.task_service.close()
+
+
+def test_profiling_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("PROFILE_SECRET", raising=False)
+    app = create_app()
+    response = app.test_client().get("/api/health", headers={"X-Profile": "anything"})
+    assert "X-Profile-File" not in response.headers
+    app.task_service.close()
+
+
+def test_request_with_secret_writes_profile_and_summary(profiled_app, tmp_path):
+    client = profiled_app.test_client()
+    client.post("/api/tasks", json={"title": "Profile me"})
+    response = client.get("/tasks", headers={"X-Profile": "let-me-profile"})
+
+    assert response.status_code == 200
+    assert b"Profile me" in response.data
+    name = response.headers["X-Profile-File"]
+    assert (tmp_path / name).exists()
+    summary = (tmp_path / name.replace(".prof", ".txt")).read_text()
+    assert "cumulative" in summary
+    assert "Application frames" in summary
+    assert "task_service.py" in summary
+    assert "routes" in summary
+
+
+def test_wrong_secret_is_served_without_profiling(profiled_app, tmp_path):
+    response = profiled_app.test_client().get("/api/health", headers={"X-Profile": "guess"})
+    assert response.status_code == 200
+    assert "X-Profile-File" not in response.headers
+    assert list(tmp_path.iterdir()) == []
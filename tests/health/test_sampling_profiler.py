@@ -0,0 +1,174 @@
+# tests/health/test_sampling_profiler.py
+# ✅ Background stack sampling and the token-protected collapsed-stack endpoint
+
+import threading
+
+import pytest
+
+from app import create_app
+from app.sampling_profiler import OTHER, SamplingProfiler
+
+pytestmark = pytest.mark.unit
+
+
+def _parked_thread(name):
+    """Start a thread blocked inside a function called name; return (thread, release)."""
+    release = threading.Event()
+    ready = threading.Event()
+
+    def body():
+        ready.set()
+        release.wait()
+
+    body.__name__ = body.__qualname__ = name
+    body.__code__ = body.__code__.replace(co_name=name, co_qualname=name)
+    thread = threading.Thread(target=body)
+    thread.start()
+    ready.wait()
+    return thread, release
+
+
+def test_sample_counts_stacks_of_other_threads():
+    thread, release = _parked_thread("parked_in_test")
+    profiler = SamplingProfiler()
+    try:
+        profiler.sample()
+        profiler.sample()
+    finally:
+        release.set()
+        thread.join()
+
+    lines = profiler.collapsed().splitlines()
+    parked = [line for line in lines if "parked_in_test" in line]
+    assert len(parked) == 1
+    stack, count = parked[0].rsplit(" ", 1)
+    assert count == "2"
+    # Outermost frame first, the parked function below the thread bootstrap
+    assert stack.index("threading.Thread._bootstrap") < stack.index("parked_in_test")
+    assert profiler.samples == 2
+
+
+def test_sampler_thread_is_not_sampled():
+    profiler = SamplingProfiler()
+    profiler.sample()
+    assert "SamplingProfiler.sample" not in profiler.collapsed()
+
+
+def test_distinct_stacks_are_bounded():
+    profiler = SamplingProfiler(max_stacks=1)
+    threads = [_parked_thread(f"parked_{n}") for n in range(2)]
+    try:
+        profiler.sample()
+    finally:
+        for thread, release in threads:
+            release.set()
+            thread.join()
+    assert len(profiler._counts) <= 2  # max_stacks plus the overflow bucket
+    assert f"{OTHER} " in profiler.collapsed()
+
+
+def test_stack_depth_keeps_innermost_frames():
+    thread, release = _parked_thread("deep_leaf")
+    profiler = SamplingProfiler(max_depth=3)
+    try:
+        profiler.sample()
+    finally:
+        release.set()
+        thread.join()
+    line = next(line for line in profiler.collapsed().splitlines() if "deep_leaf" in line)
+    # deep_leaf → Event.wait → Condition.wait; the thread bootstrap frames are cut
+    assert line.split(" ")[0].count(";") == 2
+    assert "deep_leaf;threading.Event.wait;threading.Condition.wait " in line
+    assert "_bootstrap" not in line
+
+
+def test_contains_filter_and_reset():
+    thread, release = _parked_thread("filtered_leaf")
+    profiler = SamplingProfiler()
+    try:
+        profiler.sample()
+    finally:
+        release.set()
+        thread.join()
+    filtered = profiler.collapsed(contains="filtered_leaf")
+    assert filtered and all("filtered_leaf" in line for line in filtered.splitlines())
+
+    profiler.reset()
+    assert profiler.collapsed() == ""
+    assert profiler.samples == 0
+
+
+def test_background_thread_samples_until_stopped():
+    profiler = SamplingProfiler(interval=0.001)
+    profiler.start()
+    try:
+        deadline = threading.Event()
+        while profiler.samples < 5:
+            deadline.wait(0.005)
+    finally:
+        profiler.stop()
+    assert not profiler.running
+    taken = profiler.samples
+    deadline.wait(0.01)
+    assert profiler.samples == taken
+
+
+@pytest.fixture
+def sampled_app(monkeypatch):
+    monkeypatch.setenv("SAMPLING_PROFILER", "true")
+    monkeypatch.setenv("SAMPLING_PROFILER_INTERVAL_MS", "1")
+    monkeypatch.setenv("ADMIN_TOKEN", "admin-secret")
+    app = create_app()
+    yield app
+    app.sampling_profiler.stop()
+    app.task_service.close()
+
+
+def test_profiler_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("SAMPLING_PROFILER", raising=False)
+    monkeypatch.setenv("ADMIN_TOKEN", "admin-secret")
+    app = create_app()
+    assert app.sampling_profiler is None
+    response = app.test_client().get(
+        "/admin/profile/stacks", headers={"Authorization": "Bearer admin-secret"}
+    )
+    assert response.status_code == 404
+    app.task_service.close()
+
+
+def test_stacks_endpoint_returns_collapsed_stacks(sampled_app):
+    assert sampled_app.sampling_profiler.running
+    sampled_app.sampling_profiler.sample()
+    response = sampled_app.test_client().get(
+        "/admin/profile/stacks", headers={"Authorization": "Bearer admin-secret"}
+    )
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    assert int(response.headers["X-Profile-Samples"]) >= 1
+    for line in response.get_data(as_text=True).splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack and int(count) >= 1
+
+
+def test_stacks_endpoint_requires_admin_token(sampled_app, monkeypatch):
+    client = sampled_app.test_client()
+    assert client.get("/admin/profile/stacks").status_code == 401
+    assert client.get(
+        "/admin/profile/stacks", headers={"Authorization": "Bearer wrong"}
+    ).status_code == 401
+
+    monkeypatch.delenv("ADMIN_TOKEN")
+    assert client.get(
+        "/admin/profile/stacks", headers={"Authorization": "Bearer admin-secret"}
+    ).status_code == 404
+
+
+def test_reset_endpoint_clears_samples(sampled_app):
+    client = sampled_app.test_client()
+    headers = {"Authorization": "Bearer admin-secret"}
+    sampled_app.sampling_profiler.stop()
+    sampled_app.sampling_profiler.sample()
+
+    assert client.post("/admin/profile/reset", headers=headers).status_code == 204
+    assert sampled_app.sampling_profiler.samples == 0
+    assert client.get("/admin/profile/stacks", headers=headers).get_data() == b""
@@ -0,0 +1,143 @@
+# tests/health/test_tracing.py
+# ✅ Per-layer request spans, traceparent propagation and OTLP/JSON file export
+
+import json
+
+import pytest
+
+from app import create_app, tracing
+
+pytestmark = pytest.mark.unit
+
+REMOTE_TRACE = "4bf92f3577b34da6a3ce929d0e0e4736"
+REMOTE_SPAN = "00f067aa0ba902b7"
+
+
+def _offline(*args, **kwargs):
+    raise ConnectionError("offline")
+
+
+@pytest.fixture
+def traced_app(monkeypatch, tmp_path):
+    monkeypatch.setenv("TRACING", "true")
+    monkeypatch.setenv("TRACE_FILE", str(tmp_path / "traces.jsonl"))
+    # Offline: TimeService falls back to the system clock right away
+    monkeypatch.setattr("app.services.time_service.requests.get", _offline)
+    app = create_app()
+    yield app
+    app.task_service.close()
+
+
+def _traces(app):
+    with open(app.config["TRACE_FILE"], encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def _spans(trace):
+    (resource,) = trace["resourceSpans"]
+    assert resource["resource"]["attributes"][0] == {
+        "key": "service.name", "value": {"stringValue": "task-tracker"},
+    }
+    return resource["scopeSpans"][0]["spans"]
+
+
+def test_tracing_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("TRACING", raising=False)
+    app = create_app()
+    response = app.test_client().get("/api/health")
+    assert "traceparent" not in response.headers
+    # The no-op context manager is shared and yields nothing
+    assert tracing.span("anything") is tracing.span("other")
+    with tracing.span("anything") as span:
+        assert span is None
+    app.task_service.close()
+
+
+def test_post_task_records_nested_spans_per_layer(traced_app):
+    response = traced_app.test_client().post("/api/tasks", json={"title": "Traced"})
+    assert response.status_code == 201
+
+    (trace,) = _traces(traced_app)
+    spans = {span["name"]: span for span in _spans(trace)}
+    root = spans["POST /api/tasks"]
+    add = spans["TaskService.add_task"]
+    assert "parentSpanId" not in root
+    assert root["kind"] == tracing.SPAN_KIND_SERVER
+    assert {"key": "http.status_code", "value": {"intValue": "201"}} in root["attributes"]
+    assert add["parentSpanId"] == root["spanId"]
+    assert spans["TaskCreate validation"]["parentSpanId"] == add["spanId"]
+    time_span = spans["TimeService.get_current_time"]
+    assert time_span["parentSpanId"] == add["spanId"]
+    assert {"key": "source", "value": {"stringValue": "System Time (Fallback)"}} in time_span["attributes"]
+    wait = spans["TaskService wait for save"]
+    assert wait["parentSpanId"] == add["spanId"]
+    assert spans["TaskService._save_tasks"]["parentSpanId"] == wait["spanId"]
+    assert spans["DatabaseTaskRepository.save_changes"]["parentSpanId"] == spans["TaskService._save_tasks"]["spanId"]
+    assert len({span["traceId"] for span in spans.values()}) == 1
+    for span in spans.values():
+        assert int(span["startTimeUnixNano"]) <= int(span["endTimeUnixNano"])
+        assert int(root["startTimeUnixNano"]) <= int(span["startTimeUnixNano"])
+
+
+def test_incoming_traceparent_sets_trace_id_and_parent(traced_app):
+    response = traced_app.test_client().get(
+        "/api/health", headers={"traceparent": f"00-{REMOTE_TRACE}-{REMOTE_SPAN}-01"}
+    )
+    (trace,) = _traces(traced_app)
+    (root,) = [span for span in _spans(trace) if span["name"] == "GET /api/health"]
+    assert root["traceId"] == REMOTE_TRACE
+    assert root["parentSpanId"] == REMOTE_SPAN
+    assert response.headers["traceparent"] == f"00-{REMOTE_TRACE}-{root['spanId']}-01"
+
+
+def test_invalid_traceparent_starts_a_new_trace(traced_app):
+    traced_app.test_client().get("/api/health", headers={"traceparent": "00-garbage"})
+    (trace,) = _traces(traced_app)
+    root = _spans(trace)[-1]
+    assert root["traceId"] != REMOTE_TRACE
+    assert len(root["traceId"]) == 32
+    assert "parentSpanId" not in root
+
+
+def test_failed_span_records_error_status(traced_app):
+    with traced_app.app_context(), pytest.raises(ValueError):
+        with tracing.span("failing step"):
+            raise ValueError("boom")
+    (trace,) = _traces(traced_app)
+    (span,) = _spans(trace)
+    assert span["status"] == {"code": tracing.STATUS_ERROR}
+    assert {"key": "exception.type", "value": {"stringValue": "ValueError"}} in span["attributes"]
+
+
+def test_request_span_records_the_path_without_the_query(traced_app):
+    traced_app.test_client().get("/api/tasks/search?q=secret")
+    (trace,) = _traces(traced_app)
+    (root,) = [span for span in _spans(trace) if span["name"] == "GET /api/tasks/search"]
+    assert {"key": "http.target", "value": {"stringValue": "/api/tasks/search"}} in root["attributes"]
+    assert "secret" not in json.dumps(trace)
+
+
+def test_untraced_app_does_not_turn_off_another_apps_tracing(traced_app, monkeypatch):
+    monkeypatch.delenv("TRACING")
+    untraced = create_app()
+    untraced.test_client().get("/api/health")
+    traced_app.test_client().get("/api/health")
+    untraced.task_service.close()
+
+    (trace,) = _traces(traced_app)
+    assert [span["name"] for span in _spans(trace)] == ["GET /api/health"]
+
+
+def test_spans_outside_an_app_context_are_not_recorded(traced_app):
+    assert tracing.span("background step") is tracing.span("other")
+
+
+@pytest.mark.parametrize("header, expected", [
+    (f"00-{REMOTE_TRACE}-{REMOTE_SPAN}-01", (REMOTE_TRACE, REMOTE_SPAN)),
+    (f"00-{REMOTE_TRACE.upper()}-{REMOTE_SPAN}-00", (REMOTE_TRACE, REMOTE_SPAN)),
+    (f"00-{'0' * 32}-{REMOTE_SPAN}-01", None),
+    (f"01-{REMOTE_TRACE}-{REMOTE_SPAN}-01", None),
+    (None, None),
+])
+def test_parse_traceparent(header, expected):
+    assert tracing.parse_traceparent(header) == expected
@@ -12,6 +12,9 @@ except Exception:
 class AppControl:
     """Lightweight Robot library to start and stop the Flask app used in tests.
 
+    Set APP_SERVER=production to run the Gunicorn entry point (`app.server`)
+    instead of the Flask development server (`app.main`).
+
     Keywords exposed:
     - Start App
     - Stop App
@@ -34,8 +37,9 @@ class AppControl:
         # ensure Flask doesn't use reloader in subprocess
         env.pop("PYTHONBREAKPOINT", None)
 
-        # start the app module
-        self.process = subprocess.Popen([python, "-m", "app.main"], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        # start the app module (dev server by default, Gunicorn when requested)
+        module = "app.server" if env.get("APP_SERVER") == "production" else "app.main"
+        self.process = subprocess.Popen([python, "-m", module], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
         # wait for health endpoint
         self.wait_for_server(timeout)
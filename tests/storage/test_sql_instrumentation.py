@@ -0,0 +1,82 @@
+# tests/storage/test_sql_instrumentation.py
+# ✅ SQL statement counting/timing, slow-query log and query plans (SQLAlchemy events)
+
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app import create_app
+from app.metrics import MetricsRegistry
+from app.models.sqlalchemy_task import create_schema
+from app.repositories.database_task_repository import DatabaseTaskRepository
+from app.sql_instrumentation import QueryInstrumentation, redact_parameters
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def instrumented():
+    engine = create_engine("sqlite:///:memory:")
+    create_schema(engine)
+    instrumentation = QueryInstrumentation(MetricsRegistry(), slow_threshold=10, explain=True)
+    instrumentation.attach(engine)
+    yield instrumentation, DatabaseTaskRepository(sessionmaker(bind=engine)), engine
+    engine.dispose()
+
+
+def test_statements_are_counted_and_timed(instrumented):
+    instrumentation, repo, _ = instrumented
+    repo.save_tasks([{"id": i, "title": f"Task {i}"} for i in range(1, 6)])
+    repo.load_tasks()
+    assert instrumentation.queries_total.value() >= 3
+    assert instrumentation.duration.count("SELECT") >= 1
+    assert instrumentation.duration.count("INSERT") == 1  # one executemany, not one per task
+
+
+def test_slow_queries_are_logged_without_parameter_values(instrumented, caplog):
+    instrumentation, repo, _ = instrumented
+    instrumentation.slow_threshold = 0
+    with caplog.at_level(logging.WARNING, logger="app.sql"):
+        repo.search_tasks("topsecret")
+    slow = [r for r in caplog.records if r.getMessage() == "slow query"]
+    assert slow and all("topsecret" not in f"{r.statement} {r.params}" for r in slow)
+    assert "<str>" in slow[0].params
+    assert slow[0].duration_ms >= 0 and "tasks_fts" in slow[0].statement
+
+
+def test_query_plans_flag_full_table_scans(instrumented, caplog):
+    instrumentation, repo, _ = instrumented
+    with caplog.at_level(logging.WARNING, logger="app.sql"):
+        repo.query_tasks(completed=False, limit=5)   # uses ix_tasks_completed_id
+        repo.load_tasks()                            # reads every row
+    plans = list(instrumentation.plans.values())
+    assert any("USING INDEX ix_tasks_completed_id" in " ".join(plan) for plan in plans)
+    assert instrumentation.full_scans.value("tasks") == 1
+    assert any(r.getMessage() == "full table scan" and r.table == "tasks" for r in caplog.records)
+
+
+def test_failed_statement_does_not_break_timing(instrumented):
+    instrumentation, _, engine = instrumented
+    with engine.connect() as conn:
+        with pytest.raises(Exception):
+            conn.execute(text("SELECT * FROM no_such_table"))
+        conn.execute(text("SELECT 1"))
+    assert instrumentation.duration.count("SELECT") >= 1
+
+
+def test_redact_parameters_hides_values():
+    assert redact_parameters({"title": "private"}) == "{title: <str>}"
+
+
+def test_requests_report_their_query_count(monkeypatch):
+    monkeypatch.setenv("SQL_DEBUG", "true")
+    app = create_app()
+    client = app.test_client()
+    response = client.get("/api/tasks/recent")
+    assert response.status_code == 200
+    assert response.headers["X-DB-Queries"] == "1"  # one ORDER BY created_at ... LIMIT select
+    assert app.metrics.get("http_request_db_queries").count("tasks.recent_tasks") == 1
+    assert client.get("/api/health").headers["X-DB-Queries"] == "0"
+    app.task_service.close()
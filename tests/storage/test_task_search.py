@@ -0,0 +1,174 @@
+# tests/storage/test_task_search.py
+# ✅ Full-text search over titles/descriptions (SQLite FTS5 + fallback scan)
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models.sqlalchemy_task import create_schema
+from app.repositories.database_task_repository import DatabaseTaskRepository
+from app.services.task_service import TaskService
+
+pytestmark = pytest.mark.integration
+
+
+def _titles(tasks):
+    return [t["title"] for t in tasks]
+
+
+def test_search_matches_title_and_description_prefixes(in_memory_repo):
+    in_memory_repo.add_task("Buy groceries", "milk and eggs")
+    in_memory_repo.add_task("Write report", "quarterly numbers")
+    in_memory_repo.add_task("Call plumber", "kitchen sink")
+
+    assert _titles(in_memory_repo.search_tasks("groc")) == ["Buy groceries"]
+    assert _titles(in_memory_repo.search_tasks("quarter")) == ["Write report"]
+    assert _titles(in_memory_repo.search_tasks("kitchen call")) == ["Call plumber"]
+    assert in_memory_repo.search_tasks("nothing-like-this") == []
+
+
+def test_search_ranks_title_matches_first(in_memory_repo):
+    in_memory_repo.add_task("Weekly review", "garden chores")
+    in_memory_repo.add_task("Garden", "plant tomatoes")
+    assert _titles(in_memory_repo.search_tasks("garden")) == ["Garden", "Weekly review"]
+
+
+def test_search_index_follows_updates_deletes_and_bulk_saves(in_memory_repo):
+    in_memory_repo.add_task("Old title", "")
+    task = in_memory_repo.get_all_tasks()[0]
+    in_memory_repo.update_task(task.id, title="New title")
+    assert in_memory_repo.search_tasks("old") == []
+    assert _titles(in_memory_repo.search_tasks("new")) == ["New title"]
+
+    in_memory_repo.delete_task(task.id)
+    assert in_memory_repo.search_tasks("new") == []
+
+    in_memory_repo.save_tasks([{"id": 7, "title": "Saved task", "description": "bulk"}])
+    assert _titles(in_memory_repo.search_tasks("bulk")) == ["Saved task"]
+
+
+def test_save_tasks_writes_only_changed_rows(in_memory_repo):
+    in_memory_repo.save_tasks([
+        {"id": 1, "title": "Keep me", "description": "unchanged"},
+        {"id": 2, "title": "Rename me", "description": ""},
+        {"id": 3, "title": "Remove me", "description": ""},
+    ])
+    session = in_memory_repo.session_factory()
+    try:
+        # Log every row the next save writes
+        session.execute(text("CREATE TABLE touched (id INTEGER, op TEXT)"))
+        for op, row in (("INSERT", "NEW"), ("UPDATE", "NEW"), ("DELETE", "OLD")):
+            session.execute(text(
+                f"CREATE TRIGGER log_{op.lower()} AFTER {op} ON tasks BEGIN "
+                f"INSERT INTO touched VALUES ({row}.id, '{op}'); END"
+            ))
+        session.commit()
+        in_memory_repo.save_tasks([
+            {"id": 1, "title": "Keep me", "description": "unchanged"},
+            {"id": 2, "title": "Renamed", "description": ""},
+            {"id": 4, "title": "Added", "description": ""},
+        ])
+        touched = session.execute(text("SELECT id, op FROM touched ORDER BY id")).all()
+    finally:
+        session.close()
+
+    assert [tuple(row) for row in touched] == [(2, "UPDATE"), (3, "DELETE"), (4, "INSERT")]
+    assert _titles(in_memory_repo.search_tasks("keep")) == ["Keep me"]
+    assert _titles(in_memory_repo.search_tasks("rename")) == ["Renamed"]
+    assert in_memory_repo.search_tasks("remove") == []
+    assert _titles(in_memory_repo.search_tasks("added")) == ["Added"]
+
+
+def test_service_saves_only_changed_tasks(in_memory_repo, monkeypatch):
+    in_memory_repo.save_tasks([{"id": i, "title": f"Task {i}", "description": ""} for i in range(1, 4)])
+    service = TaskService(in_memory_repo)
+    calls = []
+    save_changes = in_memory_repo.save_changes
+    monkeypatch.setattr(in_memory_repo, "save_tasks", lambda tasks: pytest.fail("full save"))
+    monkeypatch.setattr(in_memory_repo, "save_changes",
+                        lambda changed, removed: calls.append(([t["id"] for t in changed], removed))
+                        or save_changes(changed, removed))
+
+    service.add_task("Task 4")
+    service.complete_task(2)
+    service.delete_task(3)
+    assert calls == [([4], []), ([2], []), ([], [3])]
+    assert in_memory_repo.load_tasks() == service.get_all_tasks()
+    assert sorted(_titles(in_memory_repo.search_tasks("task"))) == ["Task 1", "Task 2", "Task 4"]
+
+
+def test_failed_change_save_is_retried_in_full_by_the_next_save(in_memory_repo, monkeypatch):
+    service = TaskService(in_memory_repo)
+    save_changes = in_memory_repo.save_changes
+
+    def failing(changed, removed):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(in_memory_repo, "save_changes", failing)
+    with pytest.raises(RuntimeError):
+        service.add_task("Lost at first")
+    monkeypatch.setattr(in_memory_repo, "save_changes", save_changes)
+    service.add_task("Second")
+    assert _titles(in_memory_repo.load_tasks()) == ["Lost at first", "Second"]
+
+
+def test_search_ranks_every_match_not_just_the_newest(in_memory_repo):
+    in_memory_repo.save_tasks(
+        [{"id": 1, "title": "Garden", "description": ""}]
+        + [{"id": i, "title": f"Review {i}", "description": "garden chores"} for i in range(2, 3002)]
+    )
+    # The oldest task is the only title match, so it ranks first
+    assert _titles(in_memory_repo.search_tasks("garden", limit=2))[0] == "Garden"
+
+
+def test_search_input_cannot_inject_fts_syntax(in_memory_repo):
+    in_memory_repo.add_task("Alpha", "")
+    assert in_memory_repo.search_tasks('alpha" OR "*') == []
+    assert _titles(in_memory_repo.search_tasks('"alpha')) == ["Alpha"]
+    assert in_memory_repo.search_tasks("   ") == []
+
+
+def test_create_schema_builds_index_for_existing_rows(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE tasks (id INTEGER PRIMARY KEY, title VARCHAR NOT NULL, "
+            "description VARCHAR, completed BOOLEAN, created_at VARCHAR)"
+        ))
+        conn.execute(text("INSERT INTO tasks (id, title) VALUES (1, 'Existing task')"))
+    create_schema(engine)
+    repo = DatabaseTaskRepository(sessionmaker(bind=engine))
+    assert _titles(repo.search_tasks("exist")) == ["Existing task"]
+    engine.dispose()
+
+
+def test_task_service_uses_repository_search(in_memory_repo):
+    service = TaskService(in_memory_repo)
+    service.add_task("Plan trip", "book hotel")
+    assert _titles(service.search_tasks("hot")) == ["Plan trip"]
+
+
+@pytest.mark.unit
+def test_task_service_falls_back_to_scanning_memory():
+    service = TaskService(storage=None)
+    service.add_task("Plan trip", "book hotel")
+    service.add_task("Pay bills", "")
+    assert _titles(service.search_tasks("pla hot")) == ["Plan trip"]
+    assert _titles(service.search_tasks("p", limit=1)) == ["Plan trip"]
+
+
+def test_api_search_parameter(client):
+    client.post("/api/tasks", json={"title": "Searchable API task"})
+    client.post("/api/tasks", json={"title": "Other"})
+    response = client.get("/api/tasks?q=searchable")
+    assert response.status_code == 200
+    assert _titles(response.get_json()) == ["Searchable API task"]
+
+
+def test_ui_search_parameter(client):
+    client.post("/api/tasks", json={"title": "Findable UI task"})
+    client.post("/api/tasks", json={"title": "Hidden"})
+    response = client.get("/tasks?q=findable")
+    assert b"Findable UI task" in response.data
+    assert b"Hidden" not in response.data
+    assert b'1 result for' in response.data
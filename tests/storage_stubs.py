@@ -0,0 +1,30 @@
+# tests/storage_stubs.py
+# ✅ In-memory storage adapters for TaskService, shared by tests and benchmarks
+#
+# Not a test module (no test_ prefix). Benchmarks run as scripts and put the
+# repo root on sys.path, so both import it as `tests.storage_stubs`.
+
+
+class MemoryStorage:
+    """Storage adapter that keeps the last saved list in memory (no I/O)."""
+
+    def __init__(self, tasks=None):
+        self.saved = list(tasks or [])
+
+    def load_tasks(self):
+        return list(self.saved)
+
+    def save_tasks(self, tasks):
+        self.saved = tasks
+
+
+class RecordingStorage(MemoryStorage):
+    """MemoryStorage that also keeps every saved list, oldest first, in .saves."""
+
+    def __init__(self, tasks=None):
+        super().__init__(tasks)
+        self.saves = []
+
+    def save_tasks(self, tasks):
+        super().save_tasks(tasks)
+        self.saves.append(tasks)
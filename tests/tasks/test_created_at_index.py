@@ -0,0 +1,103 @@
+# tests/tasks/test_created_at_index.py
+# ✅ created_at range filters and "most recent" queries (memory and database)
+
+import pytest
+
+from app.services.search_index import CreatedAtIndex
+from app.services.task_service import TaskService
+
+pytestmark = pytest.mark.unit
+
+
+class StepClock:
+    """TimeService stand-in that returns one day later on every call."""
+
+    def __init__(self):
+        self.day = 0
+
+    def get_current_time(self, timezone="UTC"):
+        self.day += 1
+        return {"utc_datetime": f"2025-01-{self.day:02d}T09:00:00.000000Z"}
+
+
+def _titles(tasks):
+    return [t["title"] for t in tasks]
+
+
+def test_index_range_bounds_are_exclusive():
+    index = CreatedAtIndex()
+    for day in (3, 1, 2, 4):
+        index.add(day, f"2025-01-0{day}T00:00:00Z")
+    index.add(9, None)  # tasks without a timestamp are not indexed
+
+    assert index.between() == [1, 2, 3, 4]
+    assert index.between("2025-01-02T00:00:00Z", "2025-01-04T00:00:00Z") == [3]
+    assert index.between(created_after="2025-01-01T00:00:00Z", limit=2) == [2, 3]
+    assert index.between(created_before="2025-01-04T00:00:00Z", limit=2, newest_first=True) == [3, 2]
+    assert index.between("2025-01-04T00:00:00Z", "2025-01-01T00:00:00Z") == []
+
+    index.remove(3)
+    assert index.between(newest_first=True) == [4, 2, 1]
+
+
+def test_service_recent_and_range_queries_follow_changes():
+    service = TaskService(time_service=StepClock())
+    for title in ("First", "Second", "Third"):
+        service.add_task(title)
+
+    assert _titles(service.get_recent_tasks(2)) == ["Third", "Second"]
+    assert _titles(service.get_tasks_by_created(created_after="2025-01-01T09:00:00.000000Z")) == ["Second", "Third"]
+
+    service.add_task("Fourth")
+    service.delete_task(3)
+    assert _titles(service.get_recent_tasks(2)) == ["Fourth", "Second"]
+    assert _titles(service.get_tasks_by_created(created_before="2025-01-03")) == ["First", "Second"]
+
+
+@pytest.mark.integration
+def test_repository_range_query_matches_service(in_memory_repo):
+    in_memory_repo.save_tasks([
+        {"id": 1, "title": "Old", "created_at": "2025-01-01T09:00:00Z"},
+        {"id": 2, "title": "Undated", "created_at": None},
+        {"id": 3, "title": "New", "created_at": "2025-01-05T09:00:00Z"},
+        {"id": 4, "title": "Middle", "created_at": "2025-01-03T09:00:00Z"},
+    ])
+    lazy = TaskService(in_memory_repo, lazy_load=True)
+    assert _titles(lazy.get_recent_tasks(2)) == ["New", "Middle"]
+    assert _titles(lazy.get_tasks_by_created(created_after="2025-01-01T09:00:00Z")) == ["Middle", "New"]
+    assert lazy._task_list is None  # answered by the database, not a full load
+
+    loaded = TaskService(in_memory_repo)
+    assert _titles(loaded.get_recent_tasks(2)) == ["New", "Middle"]
+    assert _titles(loaded.get_tasks_by_created(created_after="2025-01-01T09:00:00Z")) == ["Middle", "New"]
+    assert loaded._created_index is None  # answered by the database once loaded, too
+
+
+@pytest.mark.integration
+def test_pending_write_behind_changes_use_the_memory_index(in_memory_repo):
+    service = TaskService(in_memory_repo, time_service=StepClock(), durability="write_behind",
+                          write_behind_interval=60)
+    try:
+        service.add_task("Not saved yet")
+        assert _titles(service.get_recent_tasks(1)) == ["Not saved yet"]
+        service.flush()
+        assert _titles(service.get_recent_tasks(1)) == ["Not saved yet"]
+    finally:
+        service.close()
+
+
+def test_recent_and_range_endpoints(app, client):
+    original = app.task_service
+    app.task_service = TaskService(time_service=StepClock())
+    try:
+        for title in ("One", "Two", "Three"):
+            client.post("/api/tasks", json={"title": title})
+
+        response = client.get("/api/tasks/recent?limit=2")
+        assert response.status_code == 200
+        assert _titles(response.get_json()) == ["Three", "Two"]
+
+        response = client.get("/api/tasks?created_after=2025-01-01T09:00:00.000000Z&limit=1")
+        assert _titles(response.get_json()) == ["Two"]
+    finally:
+        app.task_service = original
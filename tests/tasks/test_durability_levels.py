@@ -0,0 +1,75 @@
+# tests/tasks/test_durability_levels.py
+# ✅ TaskService durability levels: sync, group commit, write-behind
+
+import time
+
+import pytest
+
+from app.services.task_service import TaskService
+from tests.storage_stubs import RecordingStorage
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize("durability", ["sync", "group"])
+def test_sync_and_group_save_before_returning(durability):
+    storage = RecordingStorage()
+    service = TaskService(storage, durability=durability)
+    service.add_task("Saved right away")
+    assert [t["title"] for t in storage.saves[-1]] == ["Saved right away"]
+
+
+def test_write_behind_acknowledges_before_saving_and_flushes():
+    storage = RecordingStorage()
+    service = TaskService(storage, durability="write_behind", write_behind_interval=60)
+    try:
+        service.add_task("First")
+        service.add_task("Second")
+        assert [t["title"] for t in service.get_all_tasks()] == ["First", "Second"]
+        assert storage.saves == []
+
+        service.flush()
+        assert len(storage.saves) == 1  # both changes in one save
+        assert [t["title"] for t in storage.saves[-1]] == ["First", "Second"]
+    finally:
+        service.close()
+
+
+def test_write_behind_background_thread_saves_after_interval():
+    storage = RecordingStorage()
+    service = TaskService(storage, durability="write_behind", write_behind_interval=0.01)
+    try:
+        service.add_task("Eventually saved")
+        deadline = time.monotonic() + 2
+        while not storage.saves and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [t["title"] for t in storage.saves[-1]] == ["Eventually saved"]
+    finally:
+        service.close()
+
+
+def test_write_behind_close_saves_pending_changes():
+    storage = RecordingStorage()
+    service = TaskService(storage, durability="write_behind", write_behind_interval=60)
+    service.add_task("Saved on shutdown")
+    service.close()
+    assert [t["title"] for t in storage.saves[-1]] == ["Saved on shutdown"]
+
+
+@pytest.mark.integration
+def test_write_behind_search_sees_pending_changes(in_memory_repo):
+    service = TaskService(in_memory_repo, durability="write_behind", write_behind_interval=5)
+    try:
+        service.add_task("Buy groceries")
+        assert [t["title"] for t in service.search_tasks("groceries")] == ["Buy groceries"]
+        assert in_memory_repo.load_tasks() == []  # answered from memory, without a save
+
+        service.delete_task(service.get_all_tasks()[0]["id"])
+        assert service.search_tasks("groceries") == []
+    finally:
+        service.close()
+
+
+def test_unknown_durability_level_is_rejected():
+    with pytest.raises(ValueError):
+        TaskService(durability="eventually")
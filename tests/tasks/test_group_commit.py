@@ -0,0 +1,72 @@
+# tests/tasks/test_group_commit.py
+# ✅ Group commit: concurrent saves coalesce, every caller waits for its save
+
+import threading
+
+import pytest
+
+from app.services.group_commit import GroupCommitWriter
+from app.services.task_service import TaskService
+from tests.storage_stubs import RecordingStorage
+
+pytestmark = pytest.mark.unit
+
+
+def test_writes_during_a_save_share_the_next_save():
+    first_save_started = threading.Event()
+    release_first_save = threading.Event()
+    saved = []
+
+    def save(snapshot):
+        if not saved:
+            first_save_started.set()
+            release_first_save.wait(5)
+        saved.append(snapshot)
+
+    writer = GroupCommitWriter(save)
+    first = threading.Thread(target=writer.commit, args=(1,))
+    first.start()
+    first_save_started.wait(5)
+
+    # Submitted (in order) while save #1 runs → one batch, newest snapshot wins
+    tickets = [writer.submit(n) for n in (2, 3, 4)]
+    waiters = [threading.Thread(target=writer.wait, args=(t,)) for t in tickets]
+    for waiter in waiters:
+        waiter.start()
+    release_first_save.set()
+    for thread in [first] + waiters:
+        thread.join(5)
+
+    assert saved == [1, 4]
+    assert writer.batches == 2 and writer.submitted == 4
+
+
+def test_save_error_is_raised_to_every_writer_in_the_batch():
+    def save(snapshot):
+        raise OSError("disk full")
+
+    writer = GroupCommitWriter(save)
+    tickets = [writer.submit(n) for n in range(3)]
+    for ticket in tickets:
+        with pytest.raises(OSError, match="disk full"):
+            writer.wait(ticket)
+    assert writer.batches == 1
+
+
+def test_max_batch_splits_batches():
+    saved = []
+    writer = GroupCommitWriter(saved.append, max_batch=2)
+    tickets = [writer.submit(n) for n in range(5)]
+    for ticket in tickets:
+        writer.wait(ticket)
+    assert saved == [1, 3, 4]
+
+
+def test_service_returns_after_its_change_is_saved():
+    storage = RecordingStorage()
+    service = TaskService(storage, commit_window=0.001)
+    service.add_task("One")
+    assert [t["title"] for t in storage.saves[-1]] == ["One"]
+    service.complete_task(1)
+    service.delete_task(1)
+    assert storage.saves[-1] == []
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from flask import current_app
 from app import create_app
@@ -75,4 +77,79 @@ def test_delete_task_route_with_mock(app_with_mock):
     resp2 = client.delete(f'/api/tasks/{task_id}')
     assert resp2.status_code == 404
     err = resp2.get_json()
-    assert err["error"] == "Task not found"
\ No newline at end of file
+    assert err["error"] == "Task not found"
+
+def test_task_list_pages_render_with_mock(app_with_mock):
+    # The UI routes only need the TaskService interface MockTaskService implements
+    client = app_with_mock.test_client()
+    for title in ("Mock row 1", "Mock row 2", "Mock row 3"):
+        client.post('/api/tasks', json={"title": title})
+    client.put('/api/tasks/2')
+
+    response = client.get('/tasks?per_page=2')
+    assert response.status_code == 200
+    assert b"Mock row 1" in response.data and b"Mock row 3" not in response.data
+
+    response = client.get('/tasks?status=completed')
+    assert b"Mock row 2" in response.data and b"Mock row 1" not in response.data
+
+    response = client.get('/tasks/rows?page=2&per_page=2')
+    assert response.status_code == 200
+    assert b"Mock row 3" in response.data
+    assert response.headers["X-Next-Page"] == ""
+
+    assert client.get('/tasks/report').status_code == 200
+
+
+def test_suggest_titles_route_with_mock(app_with_mock):
+    client = app_with_mock.test_client()
+    for title in ("Buy milk", "buy bread", "Call mom"):
+        client.post('/api/tasks', json={"title": title})
+    response = client.get('/api/tasks/suggest?prefix=bu')
+    assert response.status_code == 200
+    assert response.get_json() == ["buy bread", "Buy milk"]
+
+
+def test_recent_and_range_routes_with_mock(app_with_mock):
+    # MockTaskService does not timestamp tasks; give them created_at directly
+    service = app_with_mock.task_service
+    for day, title in ((1, "Old"), (3, "New"), (2, "Middle")):
+        service.add_task(title)["created_at"] = f"2025-01-0{day}T09:00:00Z"
+    client = app_with_mock.test_client()
+
+    response = client.get('/api/tasks/recent?limit=2')
+    assert response.status_code == 200
+    assert [t["title"] for t in response.get_json()] == ["New", "Middle"]
+
+    response = client.get('/api/tasks?created_after=2025-01-01T09:00:00Z')
+    assert [t["title"] for t in response.get_json()] == ["Middle", "New"]
+
+
+def test_search_routes_with_mock(app_with_mock):
+    client = app_with_mock.test_client()
+    client.post('/api/tasks', json={"title": "Buy groceries", "description": "milk"})
+    client.post('/api/tasks', json={"title": "Write report"})
+
+    response = client.get('/api/tasks?q=groc')
+    assert [t["title"] for t in response.get_json()] == ["Buy groceries"]
+
+    response = client.get('/tasks?q=milk')
+    assert response.status_code == 200
+    assert b"Buy groceries" in response.data and b"Write report" not in response.data
+
+
+def test_export_route_with_mock(app_with_mock):
+    client = app_with_mock.test_client()
+    client.post('/api/tasks', json={"title": "Exported"})
+    response = client.get('/api/tasks/export.ndjson')
+    assert response.status_code == 200
+    assert [json.loads(line)["title"] for line in response.data.splitlines()] == ["Exported"]
+
+
+def test_row_fragment_routes_with_mock(app_with_mock):
+    # MockTaskService has no task versions: the row is rendered uncached
+    client = app_with_mock.test_client()
+    task = client.post('/api/tasks', json={"title": "Fragment via mock"}).get_json()
+    response = client.post(f"/tasks/{task['id']}/complete", headers={"X-Fragment": "row"})
+    assert response.status_code == 200
+    assert b"task-completed" in response.data and b"Fragment via mock" in response.data
@@ -0,0 +1,110 @@
+# tests/tasks/test_search_index.py
+# ✅ In-memory search and title-autocomplete indexes used by TaskService
+
+import pytest
+
+from app.services.search_index import SearchIndex, TitlePrefixIndex
+from app.services.task_service import TaskService
+
+pytestmark = pytest.mark.unit
+
+
+def _titles(tasks):
+    return [t["title"] for t in tasks]
+
+
+def test_index_answers_term_and_prefix_queries():
+    index = SearchIndex()
+    index.add(1, "Buy groceries")
+    index.add(2, "Grout the bathroom")
+    index.add(3, "Buy a gift")
+
+    assert index.search("buy") == [1, 3]
+    assert index.search("gr") == [1, 2]
+    assert index.search("BUY GRO") == [1]
+    assert index.search("gr", limit=1) == [1]
+    assert index.search("zebra") == []
+    assert index.search("  !! ") == []
+
+
+def test_index_remove_drops_words_no_longer_used():
+    index = SearchIndex()
+    index.add(1, "alpha beta")
+    index.add(2, "alpha")
+    index.remove(1)
+    assert index.search("beta") == []
+    assert index.search("alpha") == [2]
+    assert 1 not in index and len(index) == 1
+    index.remove(99)  # unknown ids are ignored
+
+
+def test_index_add_replaces_existing_text():
+    index = SearchIndex()
+    index.add(1, "old words")
+    index.add(1, "new words")
+    assert index.search("old") == []
+    assert index.search("new") == [1]
+
+
+def test_service_search_follows_add_delete_and_clear():
+    service = TaskService()
+    service.add_task("Buy groceries", "milk and eggs")
+    service.add_task("Call plumber", "kitchen sink")
+    assert _titles(service.search_tasks("gro")) == ["Buy groceries"]
+
+    # Built on the first search, then updated incrementally
+    service.add_task("Grout kitchen tiles")
+    assert _titles(service.search_tasks("kitch")) == ["Call plumber", "Grout kitchen tiles"]
+
+    service.delete_task(1)
+    assert service.search_tasks("groceries") == []
+    assert _titles(service.search_tasks("gro")) == ["Grout kitchen tiles"]
+
+    service.clear_tasks()
+    assert service.search_tasks("kitchen") == []
+    service.add_task("Fresh start")
+    assert _titles(service.search_tasks("fresh")) == ["Fresh start"]
+
+
+def test_service_search_respects_limit():
+    service = TaskService()
+    for n in range(5):
+        service.add_task(f"Report {n}")
+    assert [t["id"] for t in service.search_tasks("report", limit=3)] == [1, 2, 3]
+
+
+def test_title_index_suggests_distinct_titles_by_prefix():
+    index = TitlePrefixIndex()
+    index.add(1, "Buy groceries")
+    index.add(2, "buy  GROCERIES")
+    index.add(3, "Buy a gift")
+    index.add(4, "Call plumber")
+
+    assert index.suggest("buy") == ["Buy a gift", "Buy groceries"]
+    assert index.suggest("  BUY   G") == ["Buy groceries"]
+    assert index.suggest("buy", limit=1) == ["Buy a gift"]
+    assert index.suggest("") == []
+
+    index.remove(1)
+    assert index.suggest("buy g") == ["buy  GROCERIES"]
+
+
+def test_service_suggest_titles_follows_add_and_delete():
+    service = TaskService()
+    service.add_task("Water plants")
+    assert service.suggest_titles("wat") == ["Water plants"]
+    service.add_task("Wash car")
+    assert service.suggest_titles("wa") == ["Wash car", "Water plants"]
+    service.delete_task(1)
+    assert service.suggest_titles("wa") == ["Wash car"]
+
+
+def test_suggest_endpoint_returns_matching_titles(client):
+    client.post("/api/tasks", json={"title": "Plan trip"})
+    client.post("/api/tasks", json={"title": "Plant tomatoes"})
+    client.post("/api/tasks", json={"title": "Call bank"})
+
+    response = client.get("/api/tasks/suggest?prefix=pla&limit=5")
+    assert response.status_code == 200
+    assert response.get_json() == ["Plan trip", "Plant tomatoes"]
+    assert client.get("/api/tasks/suggest").get_json() == []
@@ -0,0 +1,115 @@
+# tests/tasks/test_task_service_concurrency.py
+# ✅ TaskService under concurrent writers and readers (writer lock + snapshots)
+
+import threading
+import time
+
+import pytest
+
+from app.services.task_service import TaskService
+from tests.storage_stubs import MemoryStorage
+
+pytestmark = pytest.mark.unit
+
+WRITERS = 8
+TASKS_PER_WRITER = 50
+
+
+def _run_threads(targets):
+    threads = [threading.Thread(target=target) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_adds_get_unique_ids_and_all_reach_storage():
+    storage = MemoryStorage()
+    service = TaskService(storage)
+    start = threading.Barrier(WRITERS)
+
+    def writer(n):
+        start.wait()
+        for i in range(TASKS_PER_WRITER):
+            service.add_task(f"writer {n} task {i}")
+
+    _run_threads([lambda n=n: writer(n) for n in range(WRITERS)])
+
+    ids = [t["id"] for t in service.get_all_tasks()]
+    assert sorted(ids) == list(range(1, WRITERS * TASKS_PER_WRITER + 1))
+    assert [t["id"] for t in storage.saved] == ids
+
+
+def test_readers_always_see_consistent_snapshots():
+    service = TaskService(MemoryStorage())
+    for i in range(20):
+        service.add_task(f"seed {i}")
+    done = threading.Event()
+    problems = []
+
+    def writer():
+        for i in range(200):
+            task = service.add_task(f"new {i}")
+            service.complete_task(task["id"])
+            service.delete_task(task["id"] - 10)
+        done.set()
+
+    def reader():
+        while not done.is_set():
+            tasks = service.get_all_tasks()
+            ids = [t["id"] for t in tasks]
+            if ids != sorted(set(ids)):
+                problems.append(ids)
+
+    _run_threads([writer] + [reader] * 4)
+    assert problems == []
+
+
+def test_complete_task_does_not_change_objects_readers_hold():
+    service = TaskService(MemoryStorage())
+    service.add_task("Snapshot me")
+    snapshot = service._tasks
+    old_version = snapshot[0].version
+
+    service.complete_task(1)
+    assert snapshot[0].completed is False
+    assert snapshot[0].version == old_version
+    assert service._tasks[0].completed is True
+
+
+class SlowLoadStorage(MemoryStorage):
+    """Storage whose first load is slow, so a lazy load holds _write_lock for a while."""
+
+    def __init__(self, tasks):
+        super().__init__(tasks)
+        self.loading = threading.Event()
+
+    def load_tasks(self):
+        self.loading.set()
+        time.sleep(0.2)
+        return super().load_tasks()
+
+
+@pytest.mark.parametrize("read", [
+    lambda service: service.suggest_titles("bu"),
+    lambda service: service.search_tasks("buy"),
+    lambda service: service.get_recent_tasks(),
+])
+def test_index_reads_racing_a_lazy_load_do_not_deadlock(read):
+    # add_task lazily loads under _write_lock and then takes _index_lock; an
+    # index read must not hold _index_lock while it waits for that load
+    storage = SlowLoadStorage([{"id": 1, "title": "Buy milk", "created_at": "2026-01-01T00:00:00Z"}])
+    service = TaskService(storage, lazy_load=True)
+    results = {}
+    writer = threading.Thread(target=lambda: results.setdefault("add", service.add_task("x")), daemon=True)
+    reader = threading.Thread(target=lambda: results.setdefault("read", read(service)), daemon=True)
+
+    writer.start()
+    assert storage.loading.wait(5)
+    reader.start()
+    writer.join(5)
+    reader.join(5)
+
+    assert not writer.is_alive() and not reader.is_alive(), "deadlock between add_task and an index read"
+    assert results["add"]["id"] == 2
+    assert results["read"]
@@ -0,0 +1,75 @@
+# tests/tasks/test_tasks_json_cache.py
+# ✅ Cached JSON for GET /api/tasks: per-task fragments and the list body
+
+import json
+
+import pytest
+from flask import jsonify
+
+from app.models.task import Task
+from app.services.task_service import TaskService
+
+pytestmark = pytest.mark.unit
+
+
+def test_json_body_matches_jsonify(app):
+    service = TaskService()
+    service.add_task("Ünïcode title", 'quotes " and <tags>')
+    service.add_task("Second")
+    with app.test_request_context():
+        assert service.get_all_tasks_json() == jsonify(service.get_all_tasks()).get_data()
+
+
+def test_json_body_is_reused_until_the_list_changes():
+    service = TaskService()
+    service.add_task("One")
+    body = service.get_all_tasks_json()
+    assert service.get_all_tasks_json() is body
+
+    service.complete_task(1)
+    changed = service.get_all_tasks_json()
+    assert changed is not body
+    assert b'"completed":true' in changed
+
+    service.delete_task(1)
+    assert service.get_all_tasks_json() == b"[]\n"
+
+
+def test_list_endpoint_serves_cached_body(client):
+    client.post("/api/tasks", json={"title": "Cached"})
+    response = client.get("/api/tasks")
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert [t["title"] for t in response.get_json()] == ["Cached"]
+
+
+def test_only_changed_tasks_are_encoded_again():
+    service = TaskService()
+    for title in ("One", "Two", "Three"):
+        service.add_task(title)
+    service.get_all_tasks_json()
+    fragments = [t.to_json() for t in service._tasks]
+
+    service.complete_task(2)
+    body = service.get_all_tasks_json()
+    after = [t.to_json() for t in service._tasks]
+    assert after[0] is fragments[0] and after[2] is fragments[2]
+    assert after[1] is not fragments[1]
+    assert body == b"[" + b",".join(after) + b"]\n"
+
+
+def test_mark_complete_invalidates_fragment():
+    task = Task(1, "Fragment")
+    assert b'"completed":false' in task.to_json()
+    task.mark_complete()
+    assert b'"completed":true' in task.to_json()
+
+
+def test_ndjson_export_streams_one_task_per_line(client):
+    client.post("/api/tasks", json={"title": "First"})
+    client.post("/api/tasks", json={"title": "Second"})
+    response = client.get("/api/tasks/export.ndjson")
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    lines = response.get_data().splitlines()
+    assert [json.loads(line)["title"] for line in lines] == ["First", "Second"]
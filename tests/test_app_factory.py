@@ -65,4 +65,28 @@ def test_app_uses_db_repo():
     # Additional verification that it's a proper service
     assert app.task_service is not None
     assert hasattr(app.task_service, 'add_task')
-    assert hasattr(app.task_service, 'get_tasks')
\ No newline at end of file
+    assert hasattr(app.task_service, 'get_tasks')
+
+
+def test_create_app_reads_task_durability(monkeypatch):
+    monkeypatch.setenv("TASK_DURABILITY", "write_behind")
+    app = create_app()
+    assert app.task_service.durability == "write_behind"
+    app.task_service.close()
+
+
+def test_exit_hook_disposes_engine_when_final_save_fails(monkeypatch, caplog):
+    hooks = []
+    monkeypatch.setattr("atexit.register", hooks.append)
+    app = create_app()
+    (hook,) = hooks
+
+    def failing_close():
+        raise RuntimeError("disk full")
+
+    disposed = []
+    monkeypatch.setattr(app.task_service, "close", failing_close)
+    monkeypatch.setattr(app.database_engine, "dispose", lambda: disposed.append(True))
+    hook()
+    assert disposed == [True]
+    assert "saving pending task changes at exit failed" in caplog.text
@@ -0,0 +1,130 @@
+# tests/test_logging_config.py
+# ✅ Structured queue-based logging: JSON lines, per-module levels, DEBUG sampling
+
+import json
+import logging
+import queue
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from app.logging_config import (
+    DebugSampler,
+    DroppingQueueHandler,
+    JsonFormatter,
+    configure_logging,
+    parse_levels,
+)
+from app.services.time_service import TimeService
+
+pytestmark = pytest.mark.unit
+
+
+def _record(level=logging.INFO, msg="hello %s", args=("world",), **fields):
+    record = logging.LogRecord("app.test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(fields)
+    return record
+
+
+def test_json_formatter_writes_message_and_extra_fields():
+    line = JsonFormatter().format(_record(status=200, url="https://example"))
+    entry = json.loads(line)
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "app.test"
+    assert entry["message"] == "hello world"
+    assert entry["status"] == 200
+    assert entry["url"] == "https://example"
+    assert entry["ts"].endswith("Z")
+
+
+def test_queued_record_keeps_traceback_separate_from_message():
+    handler = DroppingQueueHandler(queue.Queue())
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.getLogger("app.test").makeRecord(
+            "app.test", logging.ERROR, __file__, 1, "failed %d", (3,), sys.exc_info()
+        )
+    handler.handle(record)
+    entry = json.loads(JsonFormatter().format(handler.queue.get_nowait()))
+    assert entry["message"] == "failed 3"
+    assert "ValueError: boom" in entry["exception"]
+
+
+def test_full_queue_drops_records_instead_of_blocking():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+    handler.handle(_record())
+    handler.handle(_record())
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
+
+
+def test_debug_sampler_keeps_one_in_n_per_message():
+    sampler = DebugSampler(every=10)
+    kept = [sampler.filter(_record(level=logging.DEBUG, msg="hot path")) for _ in range(25)]
+    assert kept.count(True) == 3
+    assert kept[0] and kept[10] and kept[20]
+    # Other messages are counted separately; INFO and above are never sampled
+    assert sampler.filter(_record(level=logging.DEBUG, msg="rare event"))
+    assert all(sampler.filter(_record(level=logging.WARNING, msg="hot path")) for _ in range(5))
+
+
+def test_parse_levels():
+    assert parse_levels("app.sql=DEBUG, app.services.time_service=warning,,bad") == {
+        "app.sql": "DEBUG",
+        "app.services.time_service": "WARNING",
+    }
+    assert parse_levels(None) == {}
+
+
+def test_configure_logging_sets_levels_and_installs_handler_once():
+    sql, time_service = logging.getLogger("app.sql"), logging.getLogger("app.services.time_service")
+    previous = (logging.getLogger("app").level, sql.level, time_service.level)
+    try:
+        handler = configure_logging({
+            "LOG_LEVEL": "warning",
+            "LOG_LEVELS": "app.sql=DEBUG,app.services.time_service=ERROR",
+        })
+        assert logging.getLogger("app").level == logging.WARNING
+        assert sql.level == logging.DEBUG
+        assert time_service.level == logging.ERROR
+        assert configure_logging({}) is handler
+        assert logging.getLogger("app").handlers.count(handler) == 1
+        assert handler not in logging.getLogger().handlers  # third-party loggers are not captured
+    finally:
+        logging.getLogger("app").setLevel(previous[0])
+        sql.setLevel(previous[1])
+        time_service.setLevel(previous[2])
+
+
+def test_time_service_logs_fallback_instead_of_printing(caplog, capsys):
+    def _raise(*args, **kwargs):
+        raise RuntimeError("network failure")
+
+    with patch("app.services.time_service.requests.get", side_effect=_raise):
+        with caplog.at_level(logging.DEBUG, logger="app.services.time_service"):
+            result = TimeService().get_current_time("London")
+
+    assert "System Time" in result["source"]
+    assert capsys.readouterr().out == ""
+    failure = next(r for r in caplog.records if r.levelno == logging.WARNING)
+    assert failure.timezone == "Europe/London"
+    assert "network failure" in failure.error
+    assert any(r.getMessage() == "time api request" for r in caplog.records)
+
+
+def test_time_service_fallback_warning_is_rate_limited(caplog):
+    def _raise(*args, **kwargs):
+        raise RuntimeError("outage")
+
+    service = TimeService()
+    with patch("app.services.time_service.requests.get", side_effect=_raise):
+        with caplog.at_level(logging.WARNING, logger="app.services.time_service"):
+            for _ in range(5):
+                service.get_current_time("UTC")
+            service._last_fallback_warning -= TimeService.FALLBACK_WARNING_INTERVAL
+            service.get_current_time("UTC")
+
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert [r.failures for r in warnings] == [1, 5]  # the 4 in between were DEBUG only
@@ -0,0 +1,104 @@
+# tests/test_server.py
+# ✅ Production entry point: Gunicorn settings and fork hooks (app/server.py)
+
+import gc
+
+import pytest
+
+pytest.importorskip("gunicorn")
+
+from app import create_app
+from app.server import ProductionServer, post_fork, server_options, when_ready
+
+pytestmark = pytest.mark.unit
+
+
+def test_server_options_defaults():
+    options = server_options({})
+    assert options["bind"] == "0.0.0.0:5000"
+    assert options["workers"] == 1
+    assert options["threads"] == 4
+    assert options["worker_class"] == "gthread"
+    assert options["preload_app"] is True
+
+
+def test_server_options_read_from_environment():
+    options = server_options({
+        "HOST": "127.0.0.1",
+        "PORT": "8080",
+        "WEB_CONCURRENCY": "3",
+        "WEB_THREADS": "8",
+    })
+    assert options["bind"] == "127.0.0.1:8080"
+    assert options["workers"] == 3
+    assert options["threads"] == 8
+
+
+def test_server_options_reject_non_positive_counts():
+    with pytest.raises(ValueError):
+        server_options({"WEB_CONCURRENCY": "0"})
+
+
+def test_when_ready_freezes_gc():
+    try:
+        when_ready(server=None)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_post_fork_disposes_inherited_engine():
+    class FakeEngine:
+        def __init__(self):
+            self.dispose_calls = []
+
+        def dispose(self, close=True):
+            self.dispose_calls.append(close)
+
+    class FakeApp:
+        database_engine = FakeEngine()
+
+    class FakeServer:
+        class app:
+            application = FakeApp()
+
+    post_fork(FakeServer(), worker=None)
+    assert FakeApp.database_engine.dispose_calls == [False]
+
+
+def test_post_fork_restarts_sampling_profiler():
+    class FakeProfiler:
+        restarted = False
+
+        def restart_after_fork(self):
+            self.restarted = True
+
+    class FakeApp:
+        sampling_profiler = FakeProfiler()
+
+    class FakeServer:
+        class app:
+            application = FakeApp()
+
+    post_fork(FakeServer(), worker=None)
+    assert FakeApp.sampling_profiler.restarted
+
+
+def test_production_server_preloads_app_once():
+    created = []
+
+    def factory():
+        created.append(create_app())
+        return created[-1]
+
+    server = ProductionServer(app_factory=factory, options=server_options({}))
+    assert server.cfg.preload_app is True
+    assert server.load() is server.load()
+    assert len(created) == 1
+
+
+def test_production_server_compiles_templates_before_fork():
+    server = ProductionServer(options=server_options({}))
+    app = server.load()
+    compiled = {name for _, name in app.jinja_env.cache.keys()}
+    assert "task_list.html" in compiled
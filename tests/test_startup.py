@@ -0,0 +1,70 @@
+# tests/test_startup.py
+# ✅ Cold-start: startup phase timing, startup-report command, lazy task loading
+
+import pytest
+
+from app import create_app
+from app.services.task_service import TaskService
+from app.startup import StartupTimer
+
+pytestmark = pytest.mark.unit
+
+
+def test_startup_timer_records_phases_in_order():
+    timer = StartupTimer()
+    timer.record("import", 0.5)
+    with timer.phase("database"):
+        pass
+    assert [name for name, _ in timer.phases] == ["import", "database"]
+    assert timer.total >= 0.5
+    assert "total" in timer.report()
+
+
+def test_create_app_records_startup_phases():
+    app = create_app()
+    names = [name for name, _ in app.startup_timer.phases]
+    assert names[0] == "import app package"
+    assert "database setup" in names
+    assert "blueprints" in names
+
+
+def test_startup_report_command_prints_breakdown():
+    app = create_app()
+    result = app.test_cli_runner().invoke(args=["startup-report"])
+    assert result.exit_code == 0
+    assert "database setup" in result.output
+    assert "total" in result.output
+
+
+def test_time_service_module_exposes_requests_lazily():
+    import app.services.time_service as time_service_module
+    assert hasattr(time_service_module.requests, "get")
+
+
+@pytest.mark.integration
+def test_lazy_load_defers_storage_read_until_first_use(in_memory_repo):
+    in_memory_repo.save_tasks([{"id": 1, "title": "Stored", "description": ""}])
+
+    class CountingRepo:
+        def __init__(self, repo):
+            self.repo = repo
+            self.loads = 0
+
+        def load_tasks(self):
+            self.loads += 1
+            return self.repo.load_tasks()
+
+        def save_tasks(self, tasks):
+            self.repo.save_tasks(tasks)
+
+    repo = CountingRepo(in_memory_repo)
+    service = TaskService(repo, lazy_load=True)
+    assert repo.loads == 0
+
+    tasks = service.get_all_tasks()
+    assert [t["title"] for t in tasks] == ["Stored"]
+    assert repo.loads == 1
+
+    service.add_task("Second")
+    assert repo.loads == 1
+    assert [t["id"] for t in service.get_all_tasks()] == [1, 2]
@@ -1,6 +1,6 @@
 import pytest
 from app.services.time_service import TimeService
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from datetime import datetime
 
 pytestmark = pytest.mark.unit
@@ -24,6 +24,18 @@ def test_get_current_time_fallback_to_system_on_api_error(monkeypatch):
         assert 'System Time' in result['source']
 
 
+def test_patching_the_requests_module_reaches_the_api_call():
+    """Replacing the module attribute itself must affect the lazy import."""
+    fake = MagicMock()
+    fake.get.side_effect = RuntimeError("offline")
+
+    with patch('app.services.time_service.requests', fake):
+        result = TimeService().get_current_time()
+
+    assert fake.get.called
+    assert 'System Time' in result['source']
+
+
 def test_utc_datetime_format_is_iso_like():
     svc = TimeService()
     res = svc.get_current_time()
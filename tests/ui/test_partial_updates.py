@@ -0,0 +1,60 @@
+# tests/ui/test_partial_updates.py
+# ✅ Complete/Delete return just the changed row when asked (X-Fragment: row)
+
+import pytest
+
+pytestmark = pytest.mark.integration
+
+ROW = {"X-Fragment": "row"}
+
+
+def _add(client, title):
+    return client.post("/api/tasks", json={"title": title}).get_json()
+
+
+def test_task_list_loads_the_partial_update_script(client):
+    task = _add(client, "Scripted task")
+    response = client.get("/tasks")
+    assert b'src="/static/scripts/task_list.js"' in response.data
+    # The plain forms stay in place for browsers without JavaScript
+    assert f'action="/tasks/{task["id"]}/complete"'.encode() in response.data
+
+
+def test_complete_returns_updated_row_fragment(client):
+    task = _add(client, "Fragment task")
+    response = client.post(f"/tasks/{task['id']}/complete", headers=ROW)
+    assert response.status_code == 200
+    assert response.mimetype == "text/html"
+    assert response.data.count(b'class="task-item') == 1
+    assert b"task-completed" in response.data
+    assert b"Fragment task" in response.data
+    assert b"<html" not in response.data
+
+
+def test_delete_returns_empty_fragment(client):
+    task = _add(client, "Doomed task")
+    response = client.post(f"/tasks/{task['id']}/delete", headers=ROW)
+    assert response.status_code == 200
+    assert response.data == b""
+    assert client.get("/api/tasks").get_json() == []
+
+
+def test_missing_task_returns_404_fragment(client):
+    assert client.post("/tasks/999/complete", headers=ROW).status_code == 404
+    assert client.post("/tasks/999/delete", headers=ROW).status_code == 404
+
+
+def test_plain_form_posts_still_redirect(client):
+    task = _add(client, "Classic task")
+    response = client.post(f"/tasks/{task['id']}/complete")
+    assert response.status_code == 302
+    assert response.location.endswith("/tasks")
+
+
+def test_completed_row_fragment_is_reused_by_the_list(app, client):
+    task = _add(client, "Reused row")
+    client.post(f"/tasks/{task['id']}/complete", headers=ROW)
+    cache = app.fragment_cache
+    hits = cache.hits
+    client.get("/tasks")
+    assert cache.hits == hits + 1
@@ -0,0 +1,70 @@
+# tests/ui/test_streamed_task_list.py
+# ✅ /tasks is streamed over a lazy task iterator
+
+import pytest
+
+from app.routes.ui import _chunked
+from app.services.task_service import TaskService
+
+pytestmark = pytest.mark.integration
+
+
+def test_task_list_response_is_streamed(client):
+    client.post("/api/tasks", json={"title": "Streamed task"})
+    response = client.get("/tasks")
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == "text/html"
+    assert b"Streamed task" in response.data
+    assert response.data.count(b'class="task-list"') == 1
+
+
+def test_empty_task_list_streams_empty_state(client):
+    response = client.get("/tasks")
+    assert b"No tasks yet!" in response.data
+    assert b'class="task-list"' not in response.data
+
+
+def test_header_is_sent_before_all_rows_are_rendered(client, app, monkeypatch):
+    rendered = []
+
+    def many_tasks():
+        for task_id in range(1, 101):
+            rendered.append(task_id)
+            task = {"id": task_id, "title": f"Task {task_id}", "description": "",
+                    "completed": False, "created_at": None}
+            yield task, -task_id  # negative versions never collide with real ones
+
+    monkeypatch.setattr(app.task_service, "get_tasks_page",
+                        lambda page, per_page, status: (many_tasks(), 100))
+    response = client.get("/tasks?per_page=100", buffered=False)
+    chunks = iter(response.response)
+    first_chunk = next(chunks)
+    if isinstance(first_chunk, bytes):
+        first_chunk = first_chunk.decode()
+    assert "All Tasks" in first_chunk
+    assert 0 < len(rendered) < 100
+
+    # Finish the stream so the request context is popped where it was pushed
+    for _ in chunks:
+        pass
+    assert len(rendered) == 100
+    response.close()
+
+
+@pytest.mark.unit
+def test_iter_versioned_tasks_is_lazy():
+    service = TaskService(storage=None)
+    service.add_task("One")
+    service.add_task("Two")
+    iterator = service.iter_versioned_tasks()
+    task, version = next(iterator)
+    assert task["title"] == "One"
+    assert version == service.get_task_versions()[task["id"]]
+    assert [t["title"] for t, _ in iterator] == ["Two"]
+
+
+@pytest.mark.unit
+def test_chunked_joins_small_pieces():
+    chunks = list(_chunked(["ab", "cd", "ef", "g"], size=4))
+    assert chunks == ["abcd", "efg"]
@@ -0,0 +1,91 @@
+# tests/ui/test_task_fragments.py
+# ✅ Task list fragment caching keyed on (task id, task version)
+
+import pytest
+
+from app.services.fragment_cache import FragmentCache
+from app.services.task_service import TaskService
+
+pytestmark = pytest.mark.unit
+
+
+def test_fragment_cache_evicts_least_recently_used():
+    cache = FragmentCache(max_entries=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    assert cache.get("a") == "A"  # "a" is now most recently used
+    cache.set("c", "C")
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    assert len(cache) == 2
+
+
+def test_fragment_cache_renders_only_on_miss():
+    cache = FragmentCache()
+    calls = []
+
+    def render():
+        calls.append(1)
+        return "<article/>"
+
+    assert cache.get_or_render((1, 1), render) == "<article/>"
+    assert cache.get_or_render((1, 1), render) == "<article/>"
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_task_version_changes_only_when_task_changes():
+    service = TaskService(storage=None)
+    first = service.add_task("First")
+    second = service.add_task("Second")
+    before = service.get_task_versions()
+
+    service.complete_task(first["id"])
+    after = service.get_task_versions()
+    assert after[first["id"]] != before[first["id"]]
+    assert after[second["id"]] == before[second["id"]]
+
+    # Completing an already completed task is not a change
+    service.complete_task(first["id"])
+    assert service.get_task_versions() == after
+
+
+def test_get_task_version_follows_changes_by_id():
+    service = TaskService(storage=None)
+    task = service.add_task("Looked up")
+    assert service.get_task_version(task["id"]) == service.get_task_versions()[task["id"]]
+    service.complete_task(task["id"])
+    assert service.get_task_version(task["id"]) == service.get_task_versions()[task["id"]]
+    service.delete_task(task["id"])
+    assert service.get_task_version(task["id"]) is None
+
+
+def test_reused_task_id_gets_a_new_version():
+    service = TaskService(storage=None)
+    task = service.add_task("Original")
+    old_version = service.get_task_versions()[task["id"]]
+    service.delete_task(task["id"])
+    replacement = service.add_task("Replacement")
+    assert replacement["id"] == task["id"]
+    assert service.get_task_versions()[task["id"]] != old_version
+
+
+@pytest.mark.integration
+def test_task_list_rerenders_only_changed_tasks(app, client):
+    cache = app.fragment_cache
+    cache.clear()
+    client.post("/api/tasks", json={"title": "Cached one"})
+    second = client.post("/api/tasks", json={"title": "Cached two"}).get_json()
+
+    client.get("/tasks")
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    client.get("/tasks")
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    client.put(f"/api/tasks/{second['id']}")
+    response = client.get("/tasks")
+    assert (cache.hits, cache.misses) == (3, 3)
+    assert b"task-completed" in response.data
+    assert b"Cached one" in response.data
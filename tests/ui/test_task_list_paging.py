@@ -0,0 +1,164 @@
+# tests/ui/test_task_list_paging.py
+# ✅ Server-side pagination, status filter tabs and infinite-scroll rows
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from app.models.sqlalchemy_task import create_schema
+from app.services.task_service import TaskService
+
+pytestmark = pytest.mark.integration
+
+
+def _titles(entries):
+    return [task["title"] for task, _ in entries]
+
+
+@pytest.mark.unit
+def test_get_tasks_page_filters_and_slices_in_memory():
+    service = TaskService(storage=None)
+    for i in range(1, 6):
+        service.add_task(f"Task {i}")
+    service.complete_task(2)
+    service.complete_task(4)
+
+    entries, total = service.get_tasks_page(page=2, per_page=2, status="all")
+    assert (_titles(entries), total) == (["Task 3", "Task 4"], 5)
+
+    entries, total = service.get_tasks_page(page=1, per_page=10, status="open")
+    assert (_titles(entries), total) == (["Task 1", "Task 3", "Task 5"], 3)
+
+    entries, total = service.get_tasks_page(page=1, per_page=10, status="completed")
+    assert (_titles(entries), total) == (["Task 2", "Task 4"], 2)
+
+
+@pytest.mark.unit
+def test_get_tasks_page_rejects_unknown_status():
+    with pytest.raises(ValueError):
+        TaskService(storage=None).get_tasks_page(status="archived")
+
+
+def test_repository_query_tasks_pages_in_sql(in_memory_repo):
+    in_memory_repo.save_tasks([
+        {"id": i, "title": f"Task {i}", "completed": i % 2 == 0} for i in range(1, 8)
+    ])
+    page = in_memory_repo.query_tasks(completed=False, offset=1, limit=2)
+    assert [t["id"] for t in page] == [3, 5]
+    assert in_memory_repo.count_tasks() == 7
+    assert in_memory_repo.count_tasks(completed=True) == 3
+
+
+def test_lazy_service_pages_from_repository_without_loading(in_memory_repo):
+    in_memory_repo.save_tasks([{"id": i, "title": f"Task {i}"} for i in range(1, 6)])
+    service = TaskService(in_memory_repo, lazy_load=True)
+
+    entries, total = service.get_tasks_page(page=2, per_page=2)
+    assert (_titles(entries), total) == (["Task 3", "Task 4"], 5)
+    assert all(version is None for _, version in entries)
+    assert service._task_list is None  # nothing was loaded into memory
+
+
+def test_loaded_service_still_pages_in_sql_with_versions(in_memory_repo, monkeypatch):
+    in_memory_repo.save_tasks([{"id": i, "title": f"Task {i}", "completed": i % 2 == 0} for i in range(1, 6)])
+    service = TaskService(in_memory_repo)
+    queries = []
+    query_tasks = in_memory_repo.query_tasks
+    monkeypatch.setattr(in_memory_repo, "query_tasks", lambda **kw: queries.append(kw) or query_tasks(**kw))
+
+    service.complete_task(1)
+    entries, total = service.get_tasks_page(page=1, per_page=2, status="completed")
+    assert (_titles(entries), total) == (["Task 1", "Task 2"], 3)
+    assert queries == [{"completed": True, "offset": 0, "limit": 2}]
+    # Rows carry the in-memory versions, so the fragment cache applies
+    versions = service.get_task_versions()
+    assert [version for _, version in entries] == [versions[1], versions[2]]
+
+
+def test_pending_write_behind_changes_page_from_memory(in_memory_repo):
+    in_memory_repo.save_tasks([{"id": 1, "title": "Saved"}])
+    service = TaskService(in_memory_repo, durability="write_behind", write_behind_interval=60)
+    try:
+        service.add_task("Not saved yet")
+        entries, total = service.get_tasks_page(per_page=10)
+        assert (_titles(entries), total) == (["Saved", "Not saved yet"], 2)
+    finally:
+        service.close()
+
+
+def test_create_schema_adds_missing_index_to_existing_table(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE tasks (id INTEGER PRIMARY KEY, title VARCHAR NOT NULL, "
+            "description VARCHAR, completed BOOLEAN, created_at VARCHAR)"
+        ))
+    create_schema(engine)
+    names = {index["name"] for index in inspect(engine).get_indexes("tasks")}
+    assert "ix_tasks_completed_id" in names
+    engine.dispose()
+
+
+def test_task_list_shows_one_page(client):
+    for i in range(1, 6):
+        client.post("/api/tasks", json={"title": f"Paged task {i}"})
+
+    response = client.get("/tasks?page=2&per_page=2")
+    assert b"Paged task 3" in response.data
+    assert b"Paged task 4" in response.data
+    assert b"Paged task 1" not in response.data
+    assert b"Paged task 5" not in response.data
+    assert b"Page 2 of 3" in response.data
+
+
+def test_task_list_filter_tabs(client):
+    client.post("/api/tasks", json={"title": "Open task"})
+    done = client.post("/api/tasks", json={"title": "Done task"}).get_json()
+    client.put(f"/api/tasks/{done['id']}")
+
+    response = client.get("/tasks?status=completed")
+    assert b"Done task" in response.data
+    assert b"Open task" not in response.data
+    assert b'aria-current="page">Completed' in response.data
+
+    response = client.get("/tasks?status=open")
+    assert b"Open task" in response.data
+    assert b"Done task" not in response.data
+
+
+def test_task_rows_returns_fragment_and_next_page(client):
+    for i in range(1, 4):
+        client.post("/api/tasks", json={"title": f"Row task {i}"})
+
+    response = client.get("/tasks/rows?page=1&per_page=2")
+    assert response.data.count(b'class="task-item') == 2
+    assert b"<html" not in response.data
+    assert "page=2" in response.headers["X-Next-Page"]
+
+    response = client.get("/tasks/rows?page=2&per_page=2")
+    assert response.data.count(b'class="task-item') == 1
+    assert response.headers["X-Next-Page"] == ""
+
+
+def test_scroll_mode_adds_load_more_sentinel(client):
+    for i in range(1, 4):
+        client.post("/api/tasks", json={"title": f"Scroll task {i}"})
+
+    response = client.get("/tasks?mode=scroll&per_page=2")
+    assert b'id="load-more"' in response.data
+
+    response = client.get("/tasks?per_page=2")
+    assert b'id="load-more"' not in response.data
+
+
+@pytest.mark.unit
+def test_rows_stream_after_the_view_returns():
+    # No `app`/`client` fixture: nothing keeps an app context pushed, so the
+    # rows must render inside the request context the response carries
+    from app import create_app
+
+    service = TaskService(storage=None)
+    for i in range(1, 4):
+        service.add_task(f"Streamed row {i}")
+    response = create_app(service).test_client().get("/tasks/rows?per_page=2")
+    assert response.status_code == 200
+    assert response.get_data().count(b'class="task-item') == 2
@@ -0,0 +1,63 @@
+# tests/ui/test_template_cache.py
+# ✅ Jinja bytecode cache and precompile build step (app/templating.py)
+
+import os
+
+import pytest
+
+from app import create_app
+from app.templating import precompile_templates
+
+pytestmark = pytest.mark.integration
+
+UI_TEMPLATES = {"base.html", "task_list.html", "add_task.html", "report.html", "time_view.html"}
+
+
+@pytest.fixture
+def cached_app(tmp_path, monkeypatch):
+    monkeypatch.setenv("TEMPLATE_CACHE_DIR", str(tmp_path))
+    return create_app()
+
+
+def test_precompile_compiles_every_ui_template(cached_app, tmp_path):
+    names = precompile_templates(cached_app)
+    assert UI_TEMPLATES <= set(names)
+    # One bytecode file per compiled template
+    assert len(os.listdir(tmp_path)) == len(names)
+
+
+def test_new_app_loads_templates_from_bytecode_cache(cached_app):
+    precompile_templates(cached_app)
+
+    # A fresh app (e.g. a recycled worker) finds compiled code on disk
+    fresh_app = create_app()
+    cache = fresh_app.jinja_env.bytecode_cache
+    hits = []
+    original = cache.load_bytecode
+
+    def load_bytecode(bucket):
+        original(bucket)
+        hits.append(bucket.code is not None)
+
+    cache.load_bytecode = load_bytecode
+    fresh_app.jinja_env.get_template("task_list.html")
+    assert hits and all(hits)
+
+
+def test_cache_is_invalidated_when_template_source_changes(cached_app, tmp_path):
+    env = cached_app.jinja_env
+    cache = env.bytecode_cache
+    source = "<p>{{ value }}</p>"
+    bucket = cache.get_bucket(env, "example.html", "example.html", source)
+    bucket.code = compile("x = 1", "example", "exec")
+    cache.set_bucket(bucket)
+
+    assert cache.get_bucket(env, "example.html", "example.html", source).code is not None
+    changed = cache.get_bucket(env, "example.html", "example.html", source + "<p>new</p>")
+    assert changed.code is None
+
+
+def test_precompile_templates_command(cached_app):
+    result = cached_app.test_cli_runner().invoke(args=["precompile-templates"])
+    assert result.exit_code == 0
+    assert "compiled task_list.html" in result.output
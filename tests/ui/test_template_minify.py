@@ -0,0 +1,57 @@
+# tests/ui/test_template_minify.py
+# ✅ Compile-time HTML comment/whitespace stripping (app/templating.py)
+
+import pytest
+
+from app import create_app
+from app.templating import minify_html, precompile_templates, template_size_report
+
+pytestmark = pytest.mark.unit
+
+
+def test_minify_removes_comments_and_collapses_whitespace():
+    source = "<section>\n  <!-- teaching note -->\n    <h1>All   Tasks</h1>\n</section>\n"
+    assert minify_html(source) == "<section> <h1>All Tasks</h1> </section>"
+
+
+def test_minify_keeps_whitespace_sensitive_elements():
+    source = "<pre>a\n   b</pre>  <script>// comment\nrun()</script>"
+    assert minify_html(source) == source.replace("</pre>  <script>", "</pre> <script>")
+
+
+def test_minify_keeps_jinja_tags_verbatim():
+    source = "<p>{{ 'two  spaces' }}</p>\n\n{% if x  %}y{% endif %}"
+    assert minify_html(source) == "<p>{{ 'two  spaces' }}</p> {% if x  %}y{% endif %}"
+
+
+def test_minify_keeps_comments_with_jinja_statements():
+    source = "<!-- {% block note %}{% endblock %} --><p>x</p>"
+    assert minify_html(source) == source
+
+
+@pytest.mark.integration
+def test_rendered_pages_do_not_ship_teaching_comments(client):
+    client.post("/api/tasks", json={"title": "Minified task"})
+    response = client.get("/tasks")
+    assert response.status_code == 200
+    assert b"Minified task" in response.data
+    assert b"FULL-STACK DATA FLOW EXPLAINED" not in response.data
+    assert b"JINJA2 TEMPLATING EXPLAINED" not in response.data
+    assert b"<!--" not in response.data
+
+
+@pytest.mark.integration
+def test_size_report_lists_bytes_saved_per_template():
+    app = create_app()
+    precompile_templates(app)
+    report = {name: (original, minified) for name, original, minified in template_size_report(app)}
+    original, minified = report["task_list.html"]
+    assert minified < original
+
+
+@pytest.mark.integration
+def test_minification_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("MINIFY_TEMPLATES", "false")
+    app = create_app()
+    precompile_templates(app)
+    assert template_size_report(app) == []